@@ -15,6 +15,7 @@ from ..services.review_engine import ReviewEngine
 from ..models.schemas import Task
 from ..models.persistent_storage import product_storage
 from ..services.pdf_analyzer import PDFAnalyzer
+from ..core.review_executor import ReviewCapacityExceeded, review_executor
 
 router = APIRouter(prefix="/lifecycle", tags=["lifecycle"])
 
@@ -90,6 +91,46 @@ class NextTaskDetailResponse(BaseModel):
 orchestrator = ProductOrchestrator()  # No legacy review engine needed
 pdf_analyzer = PDFAnalyzer()
 
+def _process_submission(
+    task_title: str,
+    task_description: str,
+    submitted_by: str,
+    github_repo_link: str,
+    module_id: str,
+    schema_version: str,
+    previous_task_id: Optional[str],
+    pdf_file: Optional[UploadFile]
+) -> dict:
+    """Blocking part of a submission: PDF extraction and the review pipeline."""
+    # 1. Handle PDF Processing
+    pdf_file_path = None
+    pdf_text = ""
+    if pdf_file:
+        pdf_result = pdf_analyzer.process_upload(pdf_file)
+        pdf_file_path = pdf_result["file_path"]
+        pdf_text = pdf_result["extracted_text"]
+
+    # 2. Create task object for evaluation
+    task = Task(
+        task_id=f"task-{datetime.now().timestamp()}",
+        task_title=task_title,
+        task_description=task_description,
+        submitted_by=submitted_by,
+        github_repo_link=github_repo_link,
+        module_id=module_id,
+        schema_version=schema_version,
+        timestamp=datetime.now(),
+        pdf_extracted_text=pdf_text
+    )
+    
+    # 3. Process submission via orchestrator
+    return orchestrator.process_submission(
+        task, 
+        previous_task_id,
+        pdf_file_path=pdf_file_path,
+        pdf_extracted_text=pdf_text
+    )
+
 @router.post("/submit", response_model=TaskSubmitResponse)
 async def submit_task(
     task_title: str = Form(...),
@@ -105,33 +146,17 @@ async def submit_task(
     Submit task for review with optional PDF support.
     """
     try:
-        # 1. Handle PDF Processing
-        pdf_file_path = None
-        pdf_text = ""
-        if pdf_file:
-            pdf_result = pdf_analyzer.process_upload(pdf_file)
-            pdf_file_path = pdf_result["file_path"]
-            pdf_text = pdf_result["extracted_text"]
-
-        # 2. Create task object for evaluation
-        task = Task(
-            task_id=f"task-{datetime.now().timestamp()}",
+        # PDF parsing and the review pipeline block; run them off the event loop
+        result = await review_executor.run(
+            _process_submission,
             task_title=task_title,
             task_description=task_description,
             submitted_by=submitted_by,
             github_repo_link=github_repo_link,
             module_id=module_id,
             schema_version=schema_version,
-            timestamp=datetime.now(),
-            pdf_extracted_text=pdf_text
-        )
-        
-        # 3. Process submission via orchestrator
-        result = orchestrator.process_submission(
-            task, 
-            previous_task_id,
-            pdf_file_path=pdf_file_path,
-            pdf_extracted_text=pdf_text
+            previous_task_id=previous_task_id,
+            pdf_file=pdf_file,
         )
         
         # Build response
@@ -149,6 +174,8 @@ async def submit_task(
                 difficulty=result["next_task"]["difficulty"]
             )
         )
+    except ReviewCapacityExceeded:
+        raise
     except Exception as e:
         logger.error(f"Submission failed: {e}")
         raise HTTPException(status_code=500, detail=f"Submission failed: {str(e)}")
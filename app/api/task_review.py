@@ -6,6 +6,7 @@ from ..models.storage import task_storage
 
 from ..services.review_orchestrator import ReviewOrchestrator
 from ..core.dependencies import get_review_orchestrator
+from ..core.review_executor import ReviewCapacityExceeded, review_executor
 
 router = APIRouter()
 logger = logging.getLogger("task_review_system")
@@ -44,8 +45,10 @@ async def review_task(
                         submitted_by=p.submitted_by,
                         timestamp=datetime.now()
                     )
-                    orchestration_res = orchestrator.process_submission(target_task)
+                    orchestration_res = await review_executor.run(orchestrator.process_submission, target_task)
                     return orchestration_res.review
+            except ReviewCapacityExceeded:
+                raise
             except Exception as e:
                 logger.error(f"JSON parsing failed: {str(e)}")
                 raise HTTPException(status_code=422, detail="Invalid JSON body")
@@ -57,7 +60,7 @@ async def review_task(
                 raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
             
             target_task = entry["task"] if isinstance(entry, dict) else entry
-            orchestration_res = orchestrator.process_submission(target_task)
+            orchestration_res = await review_executor.run(orchestrator.process_submission, target_task)
             return orchestration_res.review
 
         # 3. Handle Ad-hoc Form Payload
@@ -75,15 +78,18 @@ async def review_task(
                     submitted_by=p.submitted_by,
                     timestamp=datetime.now()
                 )
-                orchestration_res = orchestrator.process_submission(target_task)
+                orchestration_res = await review_executor.run(orchestrator.process_submission, target_task)
                 return orchestration_res.review
+            except ReviewCapacityExceeded:
+                raise
             except Exception:
                 raise HTTPException(status_code=400, detail="Invalid payload format in form")
 
         # 4. Handle Extended Review (GitHub / PDF / Description)
         if github_url or pdf_file or description:
             # We must have a description if github is present (validation handled in orchestrator or schemas)
-            orchestration_res = orchestrator.orchestrate_review(
+            orchestration_res = await review_executor.run(
+                orchestrator.orchestrate_review,
                 description=description,
                 github_url=github_url,
                 pdf_file=pdf_file,
@@ -1,3 +1,16 @@
+"""
+Dependency Providers
+Review engines are application-scoped: built once (at startup, or on first
+use) and shared by every request. They hold no per-request state, so one
+instance serves concurrent requests; construction (analyzers, keyword sets,
+environment and upload-directory setup) is paid once instead of per request.
+
+engines.reload() rebuilds them from the current configuration and swaps the
+whole set in atomically; requests already running finish on the old set.
+"""
+import threading
+from typing import NamedTuple, Optional
+
 from fastapi import Depends
 from ..core.interfaces.review_engine_interface import ReviewEngineInterface
 from ..core.interfaces.next_task_interface import NextTaskGeneratorInterface
@@ -5,17 +18,72 @@ from ..services.review_engine import ReviewEngine
 from ..services.sequential_task_generator import SequentialTaskGenerator
 from ..services.review_orchestrator import ReviewOrchestrator
 
+
+class EngineSet(NamedTuple):
+    review_engine: ReviewEngineInterface
+    next_task_generator: NextTaskGeneratorInterface
+    review_orchestrator: ReviewOrchestrator
+    generation: int
+
+
+class EngineContainer:
+    """Thread-safe holder of the application's engine instances"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._engines: Optional[EngineSet] = None
+        self._generation = 0
+
+    def _build(self) -> EngineSet:
+        review_engine = ReviewEngine()
+        next_task_generator = SequentialTaskGenerator()
+        self._generation += 1
+        return EngineSet(
+            review_engine=review_engine,
+            next_task_generator=next_task_generator,
+            review_orchestrator=ReviewOrchestrator(review_engine, next_task_generator),
+            generation=self._generation,
+        )
+
+    def get(self) -> EngineSet:
+        engines = self._engines
+        if engines is None:
+            with self._lock:
+                if self._engines is None:
+                    self._engines = self._build()
+                engines = self._engines
+        return engines
+
+    def startup(self) -> EngineSet:
+        """Build the engines eagerly so the first request does not pay for it."""
+        return self.get()
+
+    def reload(self) -> EngineSet:
+        """Rebuild every engine from the current configuration."""
+        with self._lock:
+            self._engines = self._build()
+            return self._engines
+
+
+# Global application-scoped engines
+engines = EngineContainer()
+
+
 def get_review_engine() -> ReviewEngineInterface:
     """Dependency Provider for Review Engine"""
-    return ReviewEngine()
+    return engines.get().review_engine
 
 def get_next_task_generator() -> NextTaskGeneratorInterface:
     """Dependency Provider for Next Task Generator"""
-    return SequentialTaskGenerator()
+    return engines.get().next_task_generator
 
 def get_review_orchestrator(
     review_engine: ReviewEngineInterface = Depends(get_review_engine),
     next_task_generator: NextTaskGeneratorInterface = Depends(get_next_task_generator)
 ) -> ReviewOrchestrator:
     """Dependency Provider for Review Orchestrator"""
+    current = engines.get()
+    if review_engine is current.review_engine and next_task_generator is current.next_task_generator:
+        return current.review_orchestrator
+    # An overridden engine or generator (tests, experiments) gets its own orchestrator
     return ReviewOrchestrator(review_engine, next_task_generator)
@@ -1,12 +1,15 @@
-from ..services.review_engine import ReviewEngine
+from typing import Optional
+
 from ..core.interfaces.review_engine_interface import ReviewEngineInterface
+from ..core.dependencies import engines
 
 class EngineRegistry:
-    _engine: ReviewEngineInterface = ReviewEngine()
+    # None means the application-scoped engine from core.dependencies
+    _engine: Optional[ReviewEngineInterface] = None
 
     @classmethod
     def get_engine(cls) -> ReviewEngineInterface:
-        return cls._engine
+        return cls._engine or engines.get().review_engine
 
     @classmethod
     def register_engine(cls, engine: ReviewEngineInterface):
@@ -1,6 +1,16 @@
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+from ...models.schemas import ReviewOutput
+
+if TYPE_CHECKING:
+    from ...services.review_context import ReviewContext
 
 class ReviewEngineInterface(ABC):
     @abstractmethod
     def evaluate(self, task: dict) -> dict:
         pass
+
+    def review(self, context: "ReviewContext") -> ReviewOutput:
+        """Review a typed context; engines that only implement evaluate() get the legacy task form."""
+        return ReviewOutput(**self.evaluate(context.to_task().model_dump()))
@@ -0,0 +1,96 @@
+"""
+Review Executor - Bounded Off-Loop Dispatch for Review Pipelines
+The review pipelines (GitHub requests, pdfplumber parsing, scoring) are
+synchronous. Async handlers hand them to this executor instead of calling
+them on the event loop, so one slow repository no longer stalls every other
+request served by the worker.
+
+Concurrency is bounded by REVIEW_WORKERS threads; beyond REVIEW_MAX_PENDING
+queued or running reviews new requests are rejected with 503 and a
+Retry-After header rather than queueing without limit.
+
+Configuration (environment):
+    REVIEW_WORKERS      - concurrent review pipelines per process (default 8)
+    REVIEW_MAX_PENDING  - max running + queued reviews (default 64)
+"""
+import os
+import asyncio
+import threading
+import contextvars
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import HTTPException
+
+RETRY_AFTER_SECONDS = 5
+
+
+class ReviewCapacityExceeded(HTTPException):
+    """503 raised when REVIEW_MAX_PENDING reviews are already admitted"""
+
+    def __init__(self):
+        super().__init__(
+            status_code=503,
+            detail="Review capacity exhausted, retry shortly",
+            headers={"Retry-After": str(RETRY_AFTER_SECONDS)},
+        )
+
+
+class ReviewExecutor:
+    """Thread pool with an admission limit, awaited from async handlers"""
+
+    def __init__(self, workers: Optional[int] = None, max_pending: Optional[int] = None):
+        self.workers = workers or int(os.getenv("REVIEW_WORKERS", "8"))
+        self.max_pending = max_pending or int(os.getenv("REVIEW_MAX_PENDING", "64"))
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._completed = 0
+        self._rejected = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="review")
+            return self._executor
+
+    def _release(self, _future):
+        with self._lock:
+            self._pending -= 1
+            self._completed += 1
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run fn(*args, **kwargs) on a review thread and await its result."""
+        executor = self._get_executor()
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._rejected += 1
+                raise ReviewCapacityExceeded()
+            self._pending += 1
+        # Carry request context (e.g. GitHub request priority) onto the thread
+        context = contextvars.copy_context()
+        future = executor.submit(context.run, functools.partial(fn, *args, **kwargs))
+        # Released when the work finishes, even if the awaiting request is cancelled
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "pending": self._pending,
+                "completed": self._completed,
+                "rejected": self._rejected,
+            }
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+# Global review executor
+review_executor = ReviewExecutor()
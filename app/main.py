@@ -3,10 +3,12 @@ Task Review AI - Production Maintenance Mode
 Updated on: 2026-02-05
 Version: 1.1.1
 """
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, status
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from .api import task_submit, task_review, next_task, orchestration, lifecycle, tts, bridge
+from .core.dependencies import engines
 from fastapi.middleware.cors import CORSMiddleware
 import logging
 import sys
@@ -23,10 +25,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger("task_review_system")
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Build the shared review engines before the first request arrives
+    engines.startup()
+    yield
+
 app = FastAPI(
     title="Task Review AI - Production Demo",
     description="Deterministic Engineering Task Analysis System (Locked)",
-    version="1.1.0"
+    version="1.1.0",
+    lifespan=lifespan
 )
 
 # Security: CORS Middleware
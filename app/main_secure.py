@@ -27,6 +27,12 @@ from app.security import (
 # Import API routes
 from app.api import lifecycle
 from app.api import tts
+from app.services.repo_cache import repo_cache
+from app.services.evaluation_cache import evaluation_cache, stage_cache
+from app.services.stage_graph import stage_metrics
+from app.core.review_executor import review_executor
+from app.core.dependencies import engines
+from app.services.github_client import github_client
 
 # Configure logging
 logging.basicConfig(
@@ -43,8 +49,10 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     """Application lifespan events"""
     logger.info("Task Review Agent starting up...")
+    engines.startup()
     yield
     logger.info("Task Review Agent shutting down...")
+    review_executor.shutdown()
 
 # Create FastAPI app with security configuration
 app = FastAPI(
@@ -86,7 +94,7 @@ async def rate_limit_middleware(request: Request, call_next):
         return response
     
     try:
-        check_rate_limit(client_ip)
+        check_rate_limit(client_ip, request.url.path)
     except HTTPException as e:
         logger.warning(f"Rate limit exceeded for IP: {client_ip}")
         return JSONResponse(
@@ -188,9 +196,24 @@ async def system_info(current_user: dict = Depends(require_admin)):
         "authorization": "Role-based",
         "rate_limiting": "Enabled",
         "cors_origins": ALLOWED_ORIGINS,
-        "trusted_hosts": ALLOWED_HOSTS
+        "trusted_hosts": ALLOWED_HOSTS,
+        "repo_cache": repo_cache.stats(),
+        "evaluation_cache": evaluation_cache.stats(),
+        "evaluation_stage_cache": stage_cache.stats(),
+        "evaluation_stage_timings": stage_metrics.stats(),
+        "review_executor": review_executor.stats(),
+        "engine_generation": engines.get().generation,
+        "github_rate_limits": github_client.scheduler.stats()
     }
 
+# Engine reload endpoint (admin only)
+@app.post("/system/engines/reload", tags=["System"])
+async def reload_engines(current_user: dict = Depends(require_admin)):
+    """Rebuild the shared review engines from the current configuration (admin only)"""
+    reloaded = engines.reload()
+    logger.info(f"Review engines reloaded by {current_user.get('username')} (generation {reloaded.generation})")
+    return {"status": "reloaded", "engine_generation": reloaded.generation}
+
 # Include API routers with authentication
 app.include_router(
     lifecycle.router,
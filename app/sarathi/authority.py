@@ -2,16 +2,19 @@
 Sarathi — Authority Validator
 
 Cryptographic authority validation layer.
-Accepts JWT tokens signed with RSA private key.
+Accepts JWT tokens signed with the Sarathi private key (RS256, ES256 or EdDSA,
+see SARATHI_ALGORITHM in key_manager).
 Validates: signature, expiry, issuer, audience, replay attacks.
 
 HARD FAIL on any violation. No bypass possible.
 """
+import os
 import jwt
 import time
 import logging
-from typing import Dict, Any, Optional, Tuple
-from cryptography.hazmat.primitives import serialization
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 
 from .key_manager import sarathi_keys
 from .replay_detector import replay_detector
@@ -19,9 +22,20 @@ from .replay_detector import replay_detector
 logger = logging.getLogger("sarathi_authority")
 
 SARATHI_ISSUER = "tantra-sarathi"
-SARATHI_ALGORITHM = "RS256"
+SARATHI_ALGORITHM = sarathi_keys.get_algorithm()
 SARATHI_CLOCK_SKEW = 30
 SARATHI_AUDIENCE = "tantra-bridge"
+SARATHI_BATCH_WORKERS = min(8, os.cpu_count() or 1)
+SARATHI_DECODE_OPTIONS = {
+    "require_exp": True,
+    "require_iat": True,
+    "require_iss": True,
+    "require_aud": True,
+    "verify_exp": True,
+    "verify_iat": True,
+    "verify_iss": True,
+    "verify_aud": True,
+}
 
 
 class SarathiValidationError(Exception):
@@ -42,32 +56,44 @@ class SarathiAuthority:
     def __init__(self):
         if not hasattr(self, "_initialized"):
             self._initialized = True
-
-    def validate_token(self, authority_token: str) -> Dict[str, Any]:
+            self._executor: Optional[ThreadPoolExecutor] = None
+            self._executor_lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=SARATHI_BATCH_WORKERS,
+                    thread_name_prefix="sarathi-verify",
+                )
+            return self._executor
+
+    def _resolve_key(self, token: str) -> Tuple[str, Any]:
+        """Select the pre-parsed verification key from the token's kid header."""
+        kid = jwt.get_unverified_header(token).get("kid")
+        if kid is not None and not isinstance(kid, str):
+            raise jwt.InvalidTokenError("Invalid kid header")
+        entry = sarathi_keys.get_verification_key(kid)
+        if entry is None:
+            raise SarathiValidationError("Unknown signing key", "UNKNOWN_KEY_ID")
+        return entry
+
+    def _decode(self, authority_token: str) -> Dict[str, Any]:
+        """Verify signature and registered claims. Does not touch the replay store."""
         if not authority_token or not isinstance(authority_token, str) or authority_token.strip() == "":
             raise SarathiValidationError("Missing authority_token", "MISSING_TOKEN")
 
         token = authority_token.strip()
 
-        public_key_pem = sarathi_keys.get_public_key_pem()
-
         try:
+            algorithm, verification_key = self._resolve_key(token)
             payload = jwt.decode(
                 token,
-                public_key_pem,
-                algorithms=[SARATHI_ALGORITHM],
+                verification_key,
+                algorithms=[algorithm],
                 issuer=SARATHI_ISSUER,
                 audience=SARATHI_AUDIENCE,
-                options={
-                    "require_exp": True,
-                    "require_iat": True,
-                    "require_iss": True,
-                    "require_aud": True,
-                    "verify_exp": True,
-                    "verify_iat": True,
-                    "verify_iss": True,
-                    "verify_aud": True,
-                },
+                options=SARATHI_DECODE_OPTIONS,
                 leeway=SARATHI_CLOCK_SKEW,
             )
         except jwt.ExpiredSignatureError:
@@ -79,20 +105,59 @@ class SarathiAuthority:
         except jwt.InvalidTokenError as e:
             raise SarathiValidationError(f"Token invalid: {str(e)}", "INVALID_TOKEN")
 
+        return payload
+
+    def validate_token(self, authority_token: str) -> Dict[str, Any]:
+        payload = self._decode(authority_token)
+
         jti = payload.get("jti")
         if not jti:
             raise SarathiValidationError("Token missing jti claim", "MISSING_JTI")
 
-        if replay_detector.is_replayed(jti):
+        if not replay_detector.check_and_mark(jti):
             raise SarathiValidationError("Token replay detected", "REPLAY_ATTACK")
 
-        replay_detector.mark_used(jti)
-        replay_detector.cleanup_expired()
-
         logger.info(f"[SARATHI] authority validated jti={jti}")
 
         return payload
 
+    def _try_decode(self, authority_token: str) -> Dict[str, Any]:
+        try:
+            payload = self._decode(authority_token)
+        except SarathiValidationError as e:
+            return {"valid": False, "code": e.code, "reason": e.reason}
+        if not payload.get("jti"):
+            return {"valid": False, "code": "MISSING_JTI", "reason": "Token missing jti claim"}
+        return {"valid": True, "payload": payload}
+
+    def validate_tokens(self, authority_tokens: List[str]) -> List[Dict[str, Any]]:
+        """
+        Batch form of validate_token.
+
+        Signatures are verified concurrently; all surviving JTIs are then
+        checked and marked against the replay store in one atomic operation.
+        Returns one result per token, in input order:
+          {"valid": True, "payload": {...}}
+          {"valid": False, "code": "<SarathiValidationError code>", "reason": "..."}
+        """
+        if len(authority_tokens) > 1:
+            results = list(self._get_executor().map(self._try_decode, authority_tokens))
+        else:
+            results = [self._try_decode(token) for token in authority_tokens]
+
+        verified = [r for r in results if r["valid"]]
+        accepted = replay_detector.check_and_mark_many([r["payload"]["jti"] for r in verified])
+        for result, fresh in zip(verified, accepted):
+            if not fresh:
+                result.clear()
+                result.update({"valid": False, "code": "REPLAY_ATTACK", "reason": "Token replay detected"})
+
+        logger.info(
+            f"[SARATHI] batch validated {sum(r['valid'] for r in results)}/{len(results)} tokens"
+        )
+
+        return results
+
     def issue_token(
         self,
         subject: str = "tantra-core",
@@ -120,7 +185,12 @@ class SarathiAuthority:
                     payload[key] = extra_claims[key]
 
         private_key = sarathi_keys.get_private_key()
-        token = jwt.encode(payload, private_key, algorithm=SARATHI_ALGORITHM)
+        token = jwt.encode(
+            payload,
+            private_key,
+            algorithm=sarathi_keys.get_algorithm(),
+            headers={"kid": sarathi_keys.get_kid()},
+        )
 
         logger.info(f"[SARATHI] token issued jti={jti} ttl={ttl_seconds}s")
 
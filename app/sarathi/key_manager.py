@@ -1,21 +1,91 @@
 """
 Sarathi — Cryptographic Key Manager
 
-Manages RSA key pairs for authority token signing and verification.
+Manages key pairs for authority token signing and verification.
 Keys are generated on first load; public key is exported for Core to sign tokens.
+
+The signing algorithm is selected with SARATHI_ALGORITHM:
+  RS256 (default) — keys/sarathi_private.pem, keys/sarathi_public.pem
+  ES256           — keys/sarathi_es256_private.pem, keys/sarathi_es256_public.pem
+  EdDSA (Ed25519) — keys/sarathi_ed25519_private.pem, keys/sarathi_ed25519_public.pem
+
+Verification keys are held as pre-parsed key objects in a keyset indexed by
+key id (kid), so token validation never re-parses PEM. The keyset contains:
+  - the active signing key
+  - the public keys of the other algorithms, if present on disk
+  - additional trusted public keys (keys/sarathi_public_*.pem)
+  - keys retired by reload_keys(), kept for zero-downtime rotation
 """
 import os
+import glob
 import base64
-from cryptography.hazmat.primitives.asymmetric import rsa, padding
+import hashlib
+from typing import Dict, Optional, Tuple
+from cryptography.hazmat.primitives.asymmetric import rsa, ec, ed25519, padding
 from cryptography.hazmat.primitives import serialization, hashes
 from cryptography.hazmat.backends import default_backend
 
+MAX_RETIRED_KEYS = 2
+
+SARATHI_ALGORITHM_ENV = "SARATHI_ALGORITHM"
+DEFAULT_ALGORITHM = "RS256"
+KEY_FILE_PREFIXES = {
+    "RS256": "sarathi",
+    "ES256": "sarathi_es256",
+    "EdDSA": "sarathi_ed25519",
+}
+
+
+def configured_algorithm() -> str:
+    algorithm = os.environ.get(SARATHI_ALGORITHM_ENV, DEFAULT_ALGORITHM)
+    if algorithm not in KEY_FILE_PREFIXES:
+        raise ValueError(
+            f"Unsupported {SARATHI_ALGORITHM_ENV}={algorithm}; "
+            f"expected one of {', '.join(KEY_FILE_PREFIXES)}"
+        )
+    return algorithm
+
+
+def generate_private_key(algorithm: str):
+    if algorithm == "RS256":
+        return rsa.generate_private_key(
+            public_exponent=65537,
+            key_size=2048,
+            backend=default_backend()
+        )
+    if algorithm == "ES256":
+        return ec.generate_private_key(ec.SECP256R1(), backend=default_backend())
+    if algorithm == "EdDSA":
+        return ed25519.Ed25519PrivateKey.generate()
+    raise ValueError(f"Unsupported Sarathi algorithm: {algorithm}")
+
+
+def compute_kid(public_key) -> str:
+    """Key id: truncated SHA-256 of the DER-encoded SubjectPublicKeyInfo."""
+    der = public_key.public_bytes(
+        encoding=serialization.Encoding.DER,
+        format=serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    return hashlib.sha256(der).hexdigest()[:16]
+
+
+def key_algorithm(public_key) -> str:
+    if isinstance(public_key, rsa.RSAPublicKey):
+        return "RS256"
+    if isinstance(public_key, ec.EllipticCurvePublicKey) and isinstance(public_key.curve, ec.SECP256R1):
+        return "ES256"
+    if isinstance(public_key, ed25519.Ed25519PublicKey):
+        return "EdDSA"
+    raise ValueError(f"Unsupported Sarathi key type: {type(public_key).__name__}")
+
 
 class SarathiKeyManager:
     _instance = None
     _private_key = None
     _public_key = None
     _public_key_pem = None
+    _kid = None
+    _algorithm = None
 
     def __new__(cls):
         if cls._instance is None:
@@ -24,14 +94,21 @@ class SarathiKeyManager:
 
     def __init__(self):
         if self._private_key is None:
+            self._keyset: Dict[str, Tuple[str, object]] = {}
+            self._retired_keys: Dict[str, Tuple[str, object]] = {}
             self._load_or_generate_keys()
 
+    def _key_dir(self) -> str:
+        return os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "keys")
+
     def _load_or_generate_keys(self):
-        key_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "keys")
+        key_dir = self._key_dir()
         os.makedirs(key_dir, exist_ok=True)
 
-        private_path = os.path.join(key_dir, "sarathi_private.pem")
-        public_path = os.path.join(key_dir, "sarathi_public.pem")
+        self._algorithm = configured_algorithm()
+        prefix = KEY_FILE_PREFIXES[self._algorithm]
+        private_path = os.path.join(key_dir, f"{prefix}_private.pem")
+        public_path = os.path.join(key_dir, f"{prefix}_public.pem")
 
         if os.path.exists(private_path) and os.path.exists(public_path):
             with open(private_path, "rb") as f:
@@ -43,11 +120,7 @@ class SarathiKeyManager:
                     f.read(), backend=default_backend()
                 )
         else:
-            self._private_key = rsa.generate_private_key(
-                public_exponent=65537,
-                key_size=2048,
-                backend=default_backend()
-            )
+            self._private_key = generate_private_key(self._algorithm)
             self._public_key = self._private_key.public_key()
 
             priv_pem = self._private_key.private_bytes(
@@ -69,6 +142,23 @@ class SarathiKeyManager:
             encoding=serialization.Encoding.PEM,
             format=serialization.PublicFormat.SubjectPublicKeyInfo
         )
+        self._kid = compute_kid(self._public_key)
+        self._build_keyset(key_dir)
+
+    def _build_keyset(self, key_dir: str):
+        keyset = dict(self._retired_keys)
+        trusted_paths = [
+            os.path.join(key_dir, f"{prefix}_public.pem") for prefix in KEY_FILE_PREFIXES.values()
+        ]
+        trusted_paths += sorted(glob.glob(os.path.join(key_dir, "sarathi_public_*.pem")))
+        for path in trusted_paths:
+            if not os.path.exists(path):
+                continue
+            with open(path, "rb") as f:
+                public_key = serialization.load_pem_public_key(f.read(), backend=default_backend())
+            keyset[compute_kid(public_key)] = (key_algorithm(public_key), public_key)
+        keyset[self._kid] = (key_algorithm(self._public_key), self._public_key)
+        self._keyset = keyset
 
     def get_private_key(self):
         return self._private_key
@@ -82,7 +172,24 @@ class SarathiKeyManager:
     def get_public_key_b64(self):
         return base64.b64encode(self._public_key_pem).decode("utf-8")
 
+    def get_algorithm(self) -> str:
+        return self._algorithm
+
+    def get_kid(self) -> str:
+        return self._kid
+
+    def get_verification_key(self, kid: Optional[str] = None) -> Optional[Tuple[str, object]]:
+        """Return (algorithm, pre-parsed public key) for kid; the active key if kid is None."""
+        return self._keyset.get(kid if kid is not None else self._kid)
+
+    def get_keyset(self) -> Dict[str, Tuple[str, object]]:
+        return dict(self._keyset)
+
     def sign_payload(self, payload_bytes: bytes) -> bytes:
+        if self._algorithm == "ES256":
+            return self._private_key.sign(payload_bytes, ec.ECDSA(hashes.SHA256()))
+        if self._algorithm == "EdDSA":
+            return self._private_key.sign(payload_bytes)
         signature = self._private_key.sign(
             payload_bytes,
             padding.PKCS1v15(),
@@ -91,9 +198,15 @@ class SarathiKeyManager:
         return signature
 
     def reload_keys(self):
+        previous = self._keyset.get(self._kid) if self._kid else None
+        if previous is not None:
+            self._retired_keys[self._kid] = previous
+            while len(self._retired_keys) > MAX_RETIRED_KEYS:
+                del self._retired_keys[next(iter(self._retired_keys))]
         self._private_key = None
         self._public_key = None
         self._public_key_pem = None
+        self._kid = None
         self._load_or_generate_keys()
 
 
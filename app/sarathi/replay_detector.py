@@ -1,18 +1,50 @@
 """
-Sarathi — Replay Attack Detector (PERSISTENT)
+Sarathi — Replay Attack Detector (PERSISTENT, SHARED)
 
 File-backed persistent JTI store. Survives process restarts.
 Thread-safe with TTL-based cleanup.
+
+The store is shared by every worker process on the host: all access goes
+through an exclusive OS file lock, and the in-memory view is refreshed from
+disk whenever another process has rewritten the file. `check_and_mark`
+performs check-and-insert as a single atomic operation.
 """
 import os
 import json
 import time
 import threading
-from typing import Optional
+from contextlib import contextmanager
+from typing import List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
 
 REPLAY_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "data")
 os.makedirs(REPLAY_DIR, exist_ok=True)
 REPLAY_FILE = os.path.join(REPLAY_DIR, "sarathi_replay_store.json")
+REPLAY_LOCK_FILE = REPLAY_FILE + ".lock"
+
+
+@contextmanager
+def _interprocess_lock():
+    with open(REPLAY_LOCK_FILE, "a+") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
 
 
 class ReplayDetector:
@@ -28,9 +60,28 @@ class ReplayDetector:
             self._initialized = True
             self._lock = threading.Lock()
             self._ttl_seconds: int = 300
+            self._store_stamp: Optional[tuple] = None
+            self._load_store()
+
+    @contextmanager
+    def _locked(self):
+        with self._lock, _interprocess_lock():
+            self._refresh()
+            yield
+
+    def _file_stamp(self) -> Optional[tuple]:
+        try:
+            st = os.stat(REPLAY_FILE)
+        except OSError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def _refresh(self):
+        if self._file_stamp() != self._store_stamp:
             self._load_store()
 
     def _load_store(self):
+        self._store_stamp = self._file_stamp()
         if os.path.exists(REPLAY_FILE):
             try:
                 with open(REPLAY_FILE, "r", encoding="utf-8") as f:
@@ -47,45 +98,80 @@ class ReplayDetector:
             "used_jtis": self._used_jtis,
             "ttl_seconds": self._ttl_seconds,
         }
-        with open(REPLAY_FILE, "w", encoding="utf-8") as f:
+        tmp_path = f"{REPLAY_FILE}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2)
+        os.replace(tmp_path, REPLAY_FILE)
+        self._store_stamp = self._file_stamp()
+
+    def _purge_expired(self, now: float) -> bool:
+        expired = [jti for jti, ts in self._used_jtis.items() if now - ts > self._ttl_seconds]
+        for jti in expired:
+            del self._used_jtis[jti]
+        return bool(expired)
+
+    def check_and_mark(self, jti: str) -> bool:
+        """Atomically record jti as used. Returns False if it was already used."""
+        with self._locked():
+            if jti in self._used_jtis:
+                return False
+            now = time.time()
+            self._purge_expired(now)
+            self._used_jtis[jti] = now
+            self._save_store()
+            return True
+
+    def check_and_mark_many(self, jtis: List[str]) -> List[bool]:
+        """Batch form of check_and_mark: one lock acquisition and one store write.
+
+        Returns one flag per jti in input order; a jti repeated within the
+        batch is accepted only at its first occurrence.
+        """
+        with self._locked():
+            now = time.time()
+            self._purge_expired(now)
+            accepted = []
+            for jti in jtis:
+                fresh = jti not in self._used_jtis
+                if fresh:
+                    self._used_jtis[jti] = now
+                accepted.append(fresh)
+            if any(accepted):
+                self._save_store()
+            return accepted
 
     def is_replayed(self, jti: str) -> bool:
-        with self._lock:
+        with self._locked():
             return jti in self._used_jtis
 
     def mark_used(self, jti: str):
-        with self._lock:
+        with self._locked():
             self._used_jtis[jti] = time.time()
             self._save_store()
 
     def cleanup_expired(self):
-        with self._lock:
-            now = time.time()
-            expired = [jti for jti, ts in self._used_jtis.items() if now - ts > self._ttl_seconds]
-            for jti in expired:
-                del self._used_jtis[jti]
-            if expired:
+        with self._locked():
+            if self._purge_expired(time.time()):
                 self._save_store()
 
     def set_ttl(self, seconds: int):
-        with self._lock:
+        with self._locked():
             self._ttl_seconds = seconds
             self._save_store()
 
     def clear(self):
-        with self._lock:
+        with self._locked():
             self._used_jtis.clear()
             self._save_store()
 
     @property
     def count(self):
-        with self._lock:
+        with self._locked():
             return len(self._used_jtis)
 
     @property
     def used_jtis(self):
-        with self._lock:
+        with self._locked():
             return dict(self._used_jtis)
 
 
@@ -12,6 +12,7 @@ from .middleware import (
     add_security_headers,
     rate_limiter
 )
+from .shared_rate_limit import SharedRateLimitStore
 
 __all__ = [
     "SecurityConfig",
@@ -22,5 +23,6 @@ __all__ = [
     "check_rate_limit",
     "InputSanitizer",
     "add_security_headers",
-    "rate_limiter"
+    "rate_limiter",
+    "SharedRateLimitStore"
 ]
\ No newline at end of file
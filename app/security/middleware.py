@@ -7,7 +7,12 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError, jwt
 from datetime import datetime, timedelta
 from typing import Optional, List
+from collections import OrderedDict
 import os
+import hashlib
+import threading
+import time
+from .shared_rate_limit import SharedRateLimitStore
 from enum import Enum
 
 # Security configuration
@@ -17,6 +22,59 @@ ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
 security = HTTPBearer()
 
+class TokenCache:
+    """
+    Bounded LRU cache of verified access tokens.
+
+    Keyed by the SHA-256 digest of the token string; each entry holds the
+    decoded user claims and is served only until the token's `exp`, so a
+    token is JWT-decoded once instead of on every request. Cleared by
+    SecurityConfig.rotate_secret().
+    """
+
+    def __init__(self, max_size: int = 4096):
+        self.max_size = max_size
+        self._entries: "OrderedDict[bytes, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def get(self, token: str) -> Optional[dict]:
+        key = self._digest(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, claims = entry
+            if time.time() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return dict(claims)
+
+    def put(self, token: str, claims: dict, expires_at) -> None:
+        # Tokens without a numeric exp are never cached
+        if not isinstance(expires_at, (int, float)):
+            return
+        key = self._digest(token)
+        with self._lock:
+            self._entries[key] = (expires_at, dict(claims))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+token_cache = TokenCache()
+
 class UserRole(str, Enum):
     ADMIN = "admin"
     USER = "user"
@@ -41,8 +99,13 @@ class SecurityConfig:
     @staticmethod
     def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
         """Verify JWT token"""
+        token = credentials.credentials
+        cached = token_cache.get(token)
+        if cached is not None:
+            return cached
+
         try:
-            payload = jwt.decode(credentials.credentials, SECRET_KEY, algorithms=[ALGORITHM])
+            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
             username: str = payload.get("sub")
             role: str = payload.get("role", UserRole.USER)
             
@@ -53,7 +116,9 @@ class SecurityConfig:
                     headers={"WWW-Authenticate": "Bearer"},
                 )
             
-            return {"username": username, "role": role}
+            user = {"username": username, "role": role}
+            token_cache.put(token, user, payload.get("exp"))
+            return dict(user)
             
         except JWTError:
             raise HTTPException(
@@ -62,6 +127,13 @@ class SecurityConfig:
                 headers={"WWW-Authenticate": "Bearer"},
             )
     
+    @staticmethod
+    def rotate_secret(new_secret: str):
+        """Switch the signing secret and drop every cached verification"""
+        global SECRET_KEY
+        SECRET_KEY = new_secret
+        token_cache.clear()
+    
     @staticmethod
     def require_roles(allowed_roles: List[UserRole]):
         """Decorator to require specific roles"""
@@ -89,39 +161,98 @@ def require_user_or_admin(current_user: dict = Depends(SecurityConfig.require_ro
 
 # Rate limiting
 class RateLimiter:
-    """Simple in-memory rate limiter"""
-    
-    def __init__(self):
-        self.requests = {}
-    
-    def is_allowed(self, client_ip: str, max_requests: int = 100, window_minutes: int = 60) -> bool:
+    """
+    In-memory token-bucket rate limiter.
+
+    Each client gets a bucket of `max_requests` tokens that refills
+    continuously over the window, so a check is O(1) regardless of traffic.
+    Time comes from time.monotonic(). Buckets are kept in LRU order and the
+    least recently seen clients are evicted beyond `max_clients`, which
+    bounds memory under scanning traffic (an evicted client simply starts
+    again with a full bucket).
+
+    Per-route limits are registered with set_route_limit(); the longest
+    matching path prefix wins and gets its own bucket per client.
+
+    With a shared_store the local bucket is only a fast pre-check: a local
+    denial is final (this process alone has used the whole budget), while a
+    local allow is confirmed against the bucket shared by all workers.
+    """
+
+    def __init__(self, max_clients: int = 10000, shared_store: Optional[SharedRateLimitStore] = None):
+        self.max_clients = max_clients
+        self.shared_store = shared_store
+        self._buckets: "OrderedDict[tuple, list]" = OrderedDict()
+        self._route_limits: List[tuple] = []
+        self._lock = threading.Lock()
+
+    def set_route_limit(self, path_prefix: str, max_requests: int, window_seconds: float):
+        """Apply a dedicated limit to requests whose path starts with path_prefix"""
+        with self._lock:
+            self._route_limits = [r for r in self._route_limits if r[0] != path_prefix]
+            self._route_limits.append((path_prefix, max_requests, window_seconds))
+            self._route_limits.sort(key=lambda r: len(r[0]), reverse=True)
+
+    def _match_route(self, path: Optional[str]) -> Optional[tuple]:
+        if path:
+            for route in self._route_limits:
+                if path.startswith(route[0]):
+                    return route
+        return None
+
+    def is_allowed(
+        self,
+        client_ip: str,
+        max_requests: int = 100,
+        window_minutes: int = 60,
+        path: Optional[str] = None,
+    ) -> bool:
         """Check if request is allowed based on rate limit"""
-        now = datetime.utcnow()
-        window_start = now - timedelta(minutes=window_minutes)
-        
-        # Clean old entries
-        if client_ip in self.requests:
-            self.requests[client_ip] = [
-                req_time for req_time in self.requests[client_ip] 
-                if req_time > window_start
-            ]
-        else:
-            self.requests[client_ip] = []
-        
-        # Check rate limit
-        if len(self.requests[client_ip]) >= max_requests:
-            return False
-        
-        # Add current request
-        self.requests[client_ip].append(now)
-        return True
+        now = time.monotonic()
+        with self._lock:
+            route = self._match_route(path)
+            if route is not None:
+                key = (client_ip, route[0])
+                capacity, window_seconds = route[1], route[2]
+            else:
+                key = (client_ip, None)
+                capacity, window_seconds = max_requests, window_minutes * 60
+
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = [float(capacity), now]
+                self._buckets[key] = bucket
+                if len(self._buckets) > self.max_clients:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(key)
+                refill = (now - bucket[1]) * capacity / window_seconds
+                bucket[0] = min(float(capacity), bucket[0] + refill)
+                bucket[1] = now
+
+            if bucket[0] < 1.0:
+                return False
+            bucket[0] -= 1.0
+
+        if self.shared_store is None:
+            return True
+        shared_key = f"{key[0]}|{key[1] or ''}"
+        return self.shared_store.consume(shared_key, capacity, window_seconds)
+
+    @property
+    def tracked_clients(self) -> int:
+        with self._lock:
+            return len(self._buckets)
 
 # Global rate limiter instance
-rate_limiter = RateLimiter()
+# RATE_LIMIT_BACKEND=shared keeps limits correct across multiple uvicorn workers
+rate_limiter = RateLimiter(
+    shared_store=SharedRateLimitStore() if os.getenv("RATE_LIMIT_BACKEND", "local") == "shared" else None
+)
 
-def check_rate_limit(client_ip: str):
+def check_rate_limit(client_ip: str, path: Optional[str] = None):
     """Check rate limit for client IP"""
-    if not rate_limiter.is_allowed(client_ip):
+    if not rate_limiter.is_allowed(client_ip, path=path):
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
             detail="Rate limit exceeded. Please try again later."
@@ -0,0 +1,100 @@
+"""
+Shared Rate Limit Store
+Cross-process token buckets backed by SQLite (on tmpfs where available)
+
+Every uvicorn worker on a host opens the same database file, so a client's
+budget is shared by all workers instead of being multiplied by their number.
+Each check runs in a BEGIN IMMEDIATE transaction, which makes the
+read-refill-decrement of a bucket atomic across processes.
+"""
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Optional
+
+RATE_LIMIT_DB_ENV = "RATE_LIMIT_DB_PATH"
+
+
+def default_db_path() -> str:
+    """Prefer tmpfs: counters are ephemeral and must be cheap to update"""
+    base_dir = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(base_dir, "task_review_rate_limit.db")
+
+
+class SharedRateLimitStore:
+    """SQLite token-bucket table shared by all worker processes"""
+
+    def __init__(self, path: Optional[str] = None, prune_interval: int = 1000):
+        self.path = path or os.getenv(RATE_LIMIT_DB_ENV) or default_db_path()
+        self.prune_interval = prune_interval
+        self._local = threading.local()
+        # Guards the in-process counters below; bucket updates are serialized by SQLite
+        self._lock = threading.Lock()
+        self._calls = 0
+        self._max_window = 0.0
+        self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        # Connections must not cross a fork; reopen in the child process
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+        conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS rate_buckets ("
+            "key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+        )
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    def consume(self, key: str, capacity: int, window_seconds: float) -> bool:
+        """Atomically take one token from the shared bucket for key"""
+        conn = self._connect()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT tokens, updated FROM rate_buckets WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                tokens = float(capacity)
+            else:
+                elapsed = max(0.0, now - row[1])
+                tokens = min(float(capacity), row[0] + elapsed * capacity / window_seconds)
+
+            allowed = tokens >= 1.0
+            if allowed:
+                tokens -= 1.0
+            conn.execute(
+                "INSERT INTO rate_buckets (key, tokens, updated) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET tokens = excluded.tokens, updated = excluded.updated",
+                (key, tokens, now),
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+        with self._lock:
+            self._max_window = max(self._max_window, window_seconds)
+            self._calls += 1
+            prune_due = self._calls % self.prune_interval == 0
+        if prune_due:
+            self.prune()
+        return allowed
+
+    def prune(self, idle_seconds: Optional[float] = None):
+        """Drop buckets idle long enough to have refilled completely"""
+        cutoff = time.time() - (idle_seconds if idle_seconds is not None else self._max_window)
+        self._connect().execute("DELETE FROM rate_buckets WHERE updated < ?", (cutoff,))
+
+    def count(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM rate_buckets").fetchone()[0]
+
+    def clear(self):
+        self._connect().execute("DELETE FROM rate_buckets")
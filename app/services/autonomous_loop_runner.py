@@ -12,6 +12,7 @@ from enum import Enum
 from ..models.schemas import Task, TaskCreate
 from ..models.persistent_storage import TaskSubmission, ReviewRecord, NextTaskRecord
 from .review_orchestrator import ReviewOrchestrator
+from .github_scheduler import github_priority, PRIORITY_BACKGROUND
 from .registry_validator import registry_validator
 
 logger = logging.getLogger("autonomous_loop")
@@ -119,8 +120,9 @@ class AutonomousLoopRunner:
             # Step 3: Create Task with State Context
             task = self._create_task_with_context(submission, builder_state)
             
-            # Step 4: Process through Orchestrator
-            result = self.orchestrator.process_submission(task)
+            # Step 4: Process through Orchestrator (GitHub budget yields to interactive reviews)
+            with github_priority(PRIORITY_BACKGROUND):
+                result = self.orchestrator.process_submission(task)
             
             # Step 5: Update Builder State
             self._update_builder_state(builder_state, result, task)
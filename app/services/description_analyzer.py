@@ -2,10 +2,11 @@
 Description Analyzer - Dynamic Scoring Module
 Analyzes description quality based on measurable features
 """
-import re
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 import logging
 
+from .text_features import TextBlock, TextFeatures
+
 logger = logging.getLogger("description_analyzer")
 
 class DescriptionAnalyzer:
@@ -27,19 +28,19 @@ class DescriptionAnalyzer:
             'finally', 'objective', 'requirement', 'constraint', 'goal', 'target'
         ]
     
-    def analyze(self, description: str) -> Dict[str, Any]:
+    def analyze(self, description: str, features: Optional[TextFeatures] = None) -> Dict[str, Any]:
         """Analyze description and return dynamic metrics"""
-        words = re.findall(r'\b\w+\b', description.lower())
-        sentences = re.split(r'[.!?]+', description)
+        text = features.description if features is not None else TextBlock(description)
+        words = text.words
         
         word_count = len(words)
-        sentence_count = len([s for s in sentences if s.strip()])
+        sentence_count = text.sentence_count
         
         # Calculate metrics
         technical_term_ratio = self._calculate_technical_ratio(words)
-        step_indicator_count = self._count_step_indicators(words, description)
-        code_block_count = self._count_code_blocks(description)
-        section_headers = self._count_section_headers(description)
+        step_indicator_count = self._count_step_indicators(words, text)
+        code_block_count = len(text.code_block_spans)
+        section_headers = text.section_headers
         
         # depth: markdown descriptions are token-sparse; 150 words is a solid threshold
         depth_score = min(word_count / 150, 1.0)
@@ -93,33 +94,11 @@ class DescriptionAnalyzer:
         technical_count = sum(1 for word in words if word in self.technical_terms)
         return technical_count / len(words)
     
-    def _count_step_indicators(self, words: List[str], description: str = "") -> int:
+    def _count_step_indicators(self, words: List[str], text: TextBlock) -> int:
         """Count step/process indicators including numbered list items"""
         word_hits = sum(1 for word in words if word in self.step_indicators)
-        # Count numbered list lines: lines starting with '1.' '2.' etc.
-        numbered_items = len(re.findall(r'^\s*\d+\.', description, re.MULTILINE))
-        return word_hits + numbered_items
-    
-    def _count_code_blocks(self, description: str) -> int:
-        """Count code blocks (``` or ` patterns)"""
-        code_block_pattern = r'```[\s\S]*?```|`[^`]+`'
-        return len(re.findall(code_block_pattern, description))
-    
-    def _count_section_headers(self, description: str) -> int:
-        """Count section headers (# patterns or ALL CAPS lines)"""
-        lines = description.split('\n')
-        header_count = 0
-        
-        for line in lines:
-            line = line.strip()
-            # Markdown headers
-            if line.startswith('#'):
-                header_count += 1
-            # ALL CAPS headers (> 5 chars)
-            elif line.isupper() and len(line) > 5:
-                header_count += 1
-        
-        return header_count
+        # Numbered list lines: lines starting with '1.' '2.' etc.
+        return word_hits + text.numbered_items
     
     def _calculate_clarity_score(self, sentence_count: int, word_count: int) -> float:
         """Calculate clarity based on sentence/word ratio"""
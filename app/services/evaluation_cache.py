@@ -0,0 +1,139 @@
+"""
+Evaluation Result Cache
+Persistent, content-addressed cache for deterministic evaluation results.
+
+A result is keyed by the SHA-256 of everything that determines it: title,
+description, PDF text, the repository URL and head commit SHA, and the
+engine/rules version of the producer. Identical inputs therefore map to
+the stored result, and any edit, new commit or rules change maps to a new
+key; entries are never invalidated, only evicted (least recently used
+beyond EVAL_CACHE_MAX_ENTRIES, or older than EVAL_CACHE_TTL).
+
+Submissions whose repository head cannot be pinned are not cached: local
+checkouts (analyzed from disk under REPO_LOCAL_ROOTS, with no commit to key
+on) and GitHub repositories whose lookup failed.
+
+stage_cache keeps the per-stage results of EvaluationEngine (intent,
+repository signals, feature match, PDF/title/description analysis) in a
+separate table of the same file, each keyed by that stage's own inputs, so
+a resubmission that changes one input recomputes only the stages that
+depend on it.
+
+Configuration (environment):
+    EVAL_CACHE_PATH         - SQLite file (default data/evaluation_cache.db)
+    EVAL_CACHE_TTL          - entry lifetime in seconds (default 604800)
+    EVAL_CACHE_MAX_ENTRIES  - max stored results (default 2000)
+"""
+import os
+import json
+import hashlib
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from .repo_cache import CACHE_DIR
+
+CACHE_FILE = os.path.join(CACHE_DIR, "evaluation_cache.db")
+
+
+def evaluation_key(namespace: str, version: str, **inputs: Any) -> str:
+    """Digest of the producer (namespace + version) and its canonicalized inputs."""
+    payload = json.dumps(inputs, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    return f"{namespace}@{version}:{digest}"
+
+
+class EvaluationCache:
+    """SQLite-backed evaluation result store with TTL, LRU bound and hit metrics"""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        table: str = "evaluations",
+    ):
+        self.table = table
+        self.path = path or os.getenv("EVAL_CACHE_PATH") or CACHE_FILE
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else float(os.getenv("EVAL_CACHE_TTL", "604800"))
+        self.max_entries = max_entries or int(os.getenv("EVAL_CACHE_MAX_ENTRIES", "2000"))
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "expired": 0, "evictions": 0, "uncacheable": 0}
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        # Connections must not cross a fork; reopen in the child process
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table} ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL, accessed REAL NOT NULL)"
+        )
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    def _count(self, stat: str, amount: int = 1):
+        with self._stats_lock:
+            self._stats[stat] += amount
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        conn = self._connect()
+        row = conn.execute(f"SELECT value, created FROM {self.table} WHERE key = ?", (key,)).fetchone()
+        now = time.time()
+        if row is None:
+            self._count("misses")
+            return None
+        if now - row[1] > self.ttl_seconds:
+            conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+            self._count("expired")
+            self._count("misses")
+            return None
+        conn.execute(f"UPDATE {self.table} SET accessed = ? WHERE key = ?", (now, key))
+        self._count("hits")
+        return json.loads(row[0])
+
+    def put(self, key: str, value: Dict[str, Any]):
+        conn = self._connect()
+        now = time.time()
+        conn.execute(
+            f"INSERT OR REPLACE INTO {self.table} (key, value, created, accessed) VALUES (?, ?, ?, ?)",
+            (key, json.dumps(value), now, now),
+        )
+        overflow = conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0] - self.max_entries
+        if overflow > 0:
+            conn.execute(
+                f"DELETE FROM {self.table} WHERE key IN "
+                f"(SELECT key FROM {self.table} ORDER BY accessed ASC LIMIT ?)",
+                (overflow,),
+            )
+            self._count("evictions", overflow)
+
+    def record_uncacheable(self):
+        self._count("uncacheable")
+
+    def stats(self) -> Dict[str, Any]:
+        conn = self._connect()
+        with self._stats_lock:
+            stats = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        stats["entries"] = conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+        return stats
+
+    def clear(self):
+        conn = self._connect()
+        conn.execute(f"DELETE FROM {self.table}")
+        with self._stats_lock:
+            for stat in self._stats:
+                self._stats[stat] = 0
+
+
+# Global evaluation result cache and per-stage memo
+evaluation_cache = EvaluationCache()
+stage_cache = EvaluationCache(table="stages")
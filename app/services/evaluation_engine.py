@@ -1,21 +1,37 @@
 """
 Deterministic Evaluation Engine - Upgraded v5.0 (PDF Support)
 Orchestrates the upgraded 10-step deterministic evaluation process with PDF insights.
+
+Results are cached by a digest of title, description, PDF text, repository
+head commit and ENGINE_VERSION (see evaluation_cache); bump ENGINE_VERSION
+whenever scoring rules change so stored results are not reused. On a miss
+each stage is memoized on its own inputs, so editing only the description
+reuses the repository analysis and pushing only new commits reuses the
+intent and PDF analysis. The repository and match stages are keyed on the
+head commit (match also on the intent's inputs); repository metadata such
+as stars is not memoized but taken from each pin. Stages run as a StageGraph: the repository fetch
+is in flight while the text stages run, and only matching waits for it.
 """
 import logging
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional, Union
 
 from .intent_extractor import IntentExtractor
-from .repository_analyzer import RepositoryAnalyzer
+from .repository_analyzer import RepositoryAnalyzer, RepositorySnapshot
 from .feature_matcher import FeatureMatcher
 from .scoring_engine import ScoringEngine
 from .pdf_analyzer import PDFAnalyzer
 from .title_analyzer import TitleAnalyzer
 from .description_analyzer import DescriptionAnalyzer
+from .text_features import TextFeatures
+from .evaluation_cache import evaluation_cache, evaluation_key, stage_cache
+from .stage_graph import StageGraph
 
 logger = logging.getLogger("evaluation_engine")
 
 class EvaluationEngine:
+    ENGINE_VERSION = "5.1"
+    CACHE_NAMESPACE = "evaluation_engine"
+
     def __init__(self):
         self.intent_extractor = IntentExtractor()
         self.repository_analyzer = RepositoryAnalyzer()
@@ -24,13 +40,85 @@ class EvaluationEngine:
         self.pdf_analyzer = PDFAnalyzer()
         self.title_analyzer = TitleAnalyzer()
         self.description_analyzer = DescriptionAnalyzer()
+        self.cache = evaluation_cache
+        self.stage_cache = stage_cache
     
     def evaluate(
         self, 
         task_title: str, 
         task_description: str, 
         repository_url: str = None,
-        pdf_text: str = ""
+        pdf_text: str = "",
+        features: Optional[TextFeatures] = None,
+        repository: Optional[RepositorySnapshot] = None
+    ) -> Dict[str, Any]:
+        """
+        Evaluate a submission, reusing the stored result for identical inputs.
+
+        The repository is pinned by its head commit; when it cannot be
+        resolved the evaluation runs uncached. features, if given, must be
+        the TextFeatures of this title, description and PDF text; repository,
+        if given, an already-taken snapshot of repository_url, used instead
+        of fetching the repository again.
+        """
+        # One lookup pins the repository; the same snapshot feeds the repository stage
+        head_sha, repository = self.repository_analyzer.pin(repository_url, repository)
+        if head_sha is None:
+            self.cache.record_uncacheable()
+            return self._evaluate(
+                task_title, task_description, repository_url, pdf_text, head_sha, features, repository
+            )
+
+        cache_key = evaluation_key(
+            self.CACHE_NAMESPACE, self.ENGINE_VERSION,
+            title=task_title, description=task_description, pdf_text=pdf_text,
+            repository_url=repository_url or "", head_sha=head_sha,
+            analysis_mode=self.repository_analyzer.mode,
+        )
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"Evaluation cache hit for: {task_title}")
+            return cached
+
+        result = self._evaluate(
+            task_title, task_description, repository_url, pdf_text, head_sha, features, repository
+        )
+        self.cache.put(cache_key, result)
+        return result
+
+    def _stage(
+        self, name: str, compute: Callable[[], Any], store: Optional[Callable[[Any], bool]] = None, **inputs
+    ) -> Any:
+        """Result of one pipeline stage, memoized on a digest of its inputs."""
+        key = self._stage_key(name, **inputs)
+        cached = self.stage_cache.get(key)
+        if cached is not None:
+            logger.info(f"Stage '{name}' reused from cache")
+            return cached["value"]
+        value = compute()
+        if store is None or store(value):
+            self.stage_cache.put(key, {"value": value})
+        return value
+
+    def _stage_key(self, name: str, **inputs) -> str:
+        return evaluation_key(f"{self.CACHE_NAMESPACE}.{name}", self.ENGINE_VERSION, **inputs)
+
+    @staticmethod
+    def _listing_signals(signals: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Repository signals without the metadata block (not determined by the commit)."""
+        if not signals:
+            return signals
+        return {k: v for k, v in signals.items() if k != "metadata"}
+
+    def _evaluate(
+        self, 
+        task_title: str, 
+        task_description: str, 
+        repository_url: str = None,
+        pdf_text: str = "",
+        head_sha: Optional[str] = "",
+        features: Optional[TextFeatures] = None,
+        repository: Union[RepositorySnapshot, Exception, None] = None
     ) -> Dict[str, Any]:
         """
         Full upgraded evaluation pipeline (v5.1):
@@ -41,25 +129,87 @@ class EvaluationEngine:
         """
         logger.info(f"Starting requirement-matching evaluation for: {task_title}")
         
+        # Tokenize title, description and PDF once, and only for stages that run
+        features = features or TextFeatures(task_title, task_description, pdf_text)
+
         # Step 1: Requirement Extraction (Title + Description + PDF)
-        intent = self.intent_extractor.extract(task_title, task_description, pdf_text)
-        logger.info(f"Step 1: Extracted {len(intent['expected_features'])} features from requirements.")
-        
-        # Step 2: GitHub Repository Analysis
-        repo_signals = self.repository_analyzer.analyze(repository_url)
-        repo_available = repo_signals and not repo_signals.get('error') and repo_signals.get('structure', {}).get('total_files', 0) > 0
-        logger.info(f"Step 2: Repo Analysis Complete - Architecture Layers: {repo_signals.get('architecture', {}).get('layer_count', 0) if repo_signals else 0}")
+        intent_inputs = dict(title=task_title, description=task_description, pdf_text=pdf_text)
+
+        def extract_intent():
+            intent = self._stage(
+                "intent", lambda: self.intent_extractor.extract(task_title, task_description, pdf_text, features),
+                **intent_inputs,
+            )
+            logger.info(f"Step 1: Extracted {len(intent['expected_features'])} features from requirements.")
+            return intent
 
-        # Step 3: Requirement Matching
-        match_results = self.feature_matcher.compute_match(intent, repo_signals or {})
-        logger.info(f"Step 3: Requirement Match Ratio: {match_results['feature_match_ratio']}")
+        # Inputs that pin what the repository stage derives from the file listing
+        pinned_tree = dict(
+            repository_url=repository_url or "", head_sha=head_sha,
+            analysis_mode=self.repository_analyzer.mode,
+        )
+
+        # Step 2: GitHub Repository Analysis (memoized only when pinned to a commit)
+        def analyze_repository():
+            fetch = lambda: self.repository_analyzer.analyze(repository_url, snapshot=repository)
+            if head_sha is None:
+                repo_signals = fetch()
+            else:
+                # Only the listing's signals are memoized per commit; metadata (stars,
+                # size) is revalidated with every pin and merged on top
+                repo_signals = self._stage(
+                    "repository", lambda: self._listing_signals(fetch()),
+                    store=lambda signals: not (signals or {}).get('error'),
+                    **pinned_tree,
+                )
+                if repo_signals and isinstance(repository, RepositorySnapshot):
+                    repo_signals = dict(repo_signals, metadata=repository.metadata)
+            logger.info(f"Step 2: Repo Analysis Complete - Architecture Layers: {repo_signals.get('architecture', {}).get('layer_count', 0) if repo_signals else 0}")
+            return repo_signals
+
+        # Step 3: Requirement Matching (intent and the listing at head_sha determine it)
+        def match_requirements(intent, repo_signals):
+            compute = lambda: self.feature_matcher.compute_match(intent, repo_signals or {})
+            if head_sha is None:
+                match_results = compute()
+            else:
+                match_results = self._stage(
+                    "match", compute,
+                    store=lambda _: not (repo_signals or {}).get('error'),
+                    intent=self._stage_key("intent", **intent_inputs), **pinned_tree,
+                )
+            logger.info(f"Step 3: Requirement Match Ratio: {match_results['feature_match_ratio']}")
+            return match_results
+
+        # Only matching waits for the repository; the text stages run inline while it is fetched
+        graph = StageGraph(self.CACHE_NAMESPACE)
+        graph.add("repository", analyze_repository, io=True)
+        graph.add("intent", extract_intent)
+        graph.add("match", match_requirements, deps=("intent", "repository"))
+        graph.add("pdf", lambda: self._stage(
+            "pdf", lambda: self.pdf_analyzer.analyze_content(pdf_text, features), pdf_text=pdf_text,
+        ))
+        graph.add("title", lambda: self._stage(
+            "title", lambda: self.title_analyzer.analyze(task_title, task_description, features),
+            title=task_title, description=task_description,
+        ))
+        graph.add("description", lambda: self._stage(
+            "description", lambda: self.description_analyzer.analyze(task_description, features),
+            description=task_description,
+        ))
+        stages, _ = graph.run()
+
+        intent = stages["intent"]
+        repo_signals = stages["repository"]
+        match_results = stages["match"]
+        repo_available = repo_signals and not repo_signals.get('error') and repo_signals.get('structure', {}).get('total_files', 0) > 0
 
         # Step 4: Scoring
-        pdf_analysis = self.pdf_analyzer.analyze_content(pdf_text)
+        pdf_analysis = stages["pdf"]
+        title_result = stages["title"]
+        desc_result = stages["description"]
 
         if repo_available:
-            title_result = self.title_analyzer.analyze(task_title, task_description)
-            desc_result = self.description_analyzer.analyze(task_description)
             final_result = self.scoring_engine.calculate_final_score(
                 intent,
                 repo_signals,
@@ -74,8 +224,6 @@ class EvaluationEngine:
             )
         else:
             logger.warning("Repo unavailable or empty — falling back to title+description scoring.")
-            title_result = self.title_analyzer.analyze(task_title, task_description)
-            desc_result = self.description_analyzer.analyze(task_description)
 
             title_score = title_result['title_score']
             desc_score = desc_result['description_score']
@@ -1,8 +1,37 @@
 """
 Feature Matcher - Step 3 of Deterministic Evaluation
 Compares task intent with repository implementation to calculate coverage.
+
+Repository paths are lowercased once and joined with NUL (as in
+path_classifier), so each feature or synonym lookup is one C-level
+substring search over the joined text instead of a Python loop over the
+paths with a lower() per path and term.
 """
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterable
+
+SEPARATOR = "\0"
+
+
+class PathText:
+    """Lowercased, NUL-joined repository paths answering "is term a substring of any path?"."""
+
+    def __init__(self, paths: Iterable[str]):
+        paths = list(paths)
+        self.count = len(paths)
+        self.text = SEPARATOR.join(paths).lower()
+
+    def contains(self, term: str) -> bool:
+        term = term.lower()
+        if not term:
+            return self.count > 0
+        if SEPARATOR in term:
+            # A hit could span two paths; confirm against the individual paths
+            return term in self.text and any(term in p for p in self.text.split(SEPARATOR))
+        return term in self.text
+
+    def contains_any(self, terms: Iterable[str]) -> bool:
+        return any(self.contains(t) for t in terms)
+
 
 class FeatureMatcher:
     def __init__(self):
@@ -32,15 +61,13 @@ class FeatureMatcher:
                 
         implemented_features = []
         missing_features = []
+        path_text = PathText(repo_paths)
         
         for feature in expected_features:
-            is_found = False
-            if any(feature.lower() in p.lower() for p in repo_paths):
-                is_found = True
-            else:
+            is_found = path_text.contains(feature)
+            if not is_found:
                 synonyms = self.feature_file_patterns.get(feature.lower(), [])
-                if any(syn in p.lower() for p in repo_paths for syn in synonyms):
-                    is_found = True
+                is_found = path_text.contains_any(synonyms)
             
             if is_found:
                 implemented_features.append(feature)
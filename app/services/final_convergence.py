@@ -6,8 +6,14 @@ This orchestrator ensures:
 1. Sri Satya (Assignment) = AUTHORITATIVE
 2. Ishan (Signals) = SUPPORTING ONLY
 3. Shraddha (Validation) = FINAL WRAPPER
+
+Signal collection and the assignment decision are cached by a digest of
+title, description, PDF text, repository head commit and ENGINE_VERSION
+(see evaluation_cache); the validation gate still runs per submission so
+submission IDs and timestamps stay fresh, and a reused assignment is
+re-stamped with the time of the submission it now answers.
 """
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import logging
 from datetime import datetime
 
@@ -15,6 +21,7 @@ from .assignment_authority import assignment_authority
 from .shraddha_validation import validation_gate
 from .signal_collector import signal_collector
 from .registry_validator import registry_validator, ValidationStatus
+from .evaluation_cache import evaluation_cache, evaluation_key
 
 logger = logging.getLogger("final_convergence")
 
@@ -29,6 +36,8 @@ class FinalConvergenceOrchestrator:
     
     NO parallel logic paths - single unified flow
     """
+    ENGINE_VERSION = "1.0"
+    CACHE_NAMESPACE = "final_convergence"
     
     def __init__(self):
         self.hierarchy_level = "CONVERGENCE_ORCHESTRATOR"
@@ -39,6 +48,7 @@ class FinalConvergenceOrchestrator:
             "SUPPORTING": "signal_collector", 
             "FINAL_GATE": "validation_gate"
         }
+        self.cache = evaluation_cache
     
     def process_with_convergence(
         self, 
@@ -92,21 +102,9 @@ class FinalConvergenceOrchestrator:
             }
             return validation_gate.validate_final_output(rejection_result, "registry_rejection")
         
-        # STEP 2: Signal Collection (SUPPORTING DATA ONLY)
-        logger.info("[FINAL CONVERGENCE] Step 2: Signal Collection (Supporting Data)")
-        supporting_signals = signal_collector.collect_supporting_signals(
-            task_title=task_title,
-            task_description=task_description,
-            repository_url=repository_url,
-            pdf_text=pdf_text
-        )
-        
-        # STEP 3: Assignment Authority Evaluation (PRIMARY DECISION MAKER)
-        logger.info("[FINAL CONVERGENCE] Step 3: Assignment Authority Evaluation (PRIMARY)")
-        assignment_result = assignment_authority.evaluate_assignment_readiness(
-            task_title=task_title,
-            task_description=task_description,
-            supporting_signals=supporting_signals
+        # STEP 2 + 3: Signal Collection and Assignment Authority (cached per input digest)
+        supporting_signals, assignment_result = self._collect_and_assign(
+            task_title, task_description, repository_url, pdf_text
         )
         
         # STEP 4: Validation Gate (FINAL WRAPPER)
@@ -127,6 +125,61 @@ class FinalConvergenceOrchestrator:
         logger.info(f"[FINAL CONVERGENCE] Convergence complete - Final Status: {converged_result.get('status')}")
         return converged_result
     
+    def _collect_and_assign(
+        self,
+        task_title: str,
+        task_description: str,
+        repository_url: Optional[str],
+        pdf_text: str
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Supporting signals and the assignment decision for a submission,
+        reused for identical inputs at the same repository head commit.
+        """
+        # One lookup pins the repository; the same snapshot feeds signal collection
+        head_sha, repository = signal_collector.repository_analyzer.pin(repository_url)
+        cache_key = None
+        if head_sha is None:
+            self.cache.record_uncacheable()
+        else:
+            cache_key = evaluation_key(
+                self.CACHE_NAMESPACE, self.ENGINE_VERSION,
+                title=task_title, description=task_description, pdf_text=pdf_text,
+                repository_url=repository_url or "", head_sha=head_sha,
+                analysis_mode=signal_collector.repository_analyzer.mode,
+            )
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.info("[FINAL CONVERGENCE] Evaluation cache hit - reusing signals and assignment")
+                # The decision is reused, but it is made (and stamped) for this submission
+                assignment_result = dict(cached["assignment_result"], evaluated_at=datetime.now().isoformat())
+                return cached["supporting_signals"], assignment_result
+
+        # STEP 2: Signal Collection (SUPPORTING DATA ONLY)
+        logger.info("[FINAL CONVERGENCE] Step 2: Signal Collection (Supporting Data)")
+        supporting_signals = signal_collector.collect_supporting_signals(
+            task_title=task_title,
+            task_description=task_description,
+            repository_url=repository_url,
+            pdf_text=pdf_text,
+            repository=repository
+        )
+        
+        # STEP 3: Assignment Authority Evaluation (PRIMARY DECISION MAKER)
+        logger.info("[FINAL CONVERGENCE] Step 3: Assignment Authority Evaluation (PRIMARY)")
+        assignment_result = assignment_authority.evaluate_assignment_readiness(
+            task_title=task_title,
+            task_description=task_description,
+            supporting_signals=supporting_signals
+        )
+
+        if cache_key:
+            self.cache.put(cache_key, {
+                "supporting_signals": supporting_signals,
+                "assignment_result": assignment_result,
+            })
+        return supporting_signals, assignment_result
+    
     def _convert_assignment_to_api_format(
         self, 
         assignment_result: Dict[str, Any], 
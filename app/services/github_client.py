@@ -0,0 +1,198 @@
+"""
+GitHub Client - Shared HTTP Layer for Repository Analysis
+One process-wide requests.Session with a keep-alive connection pool, so
+repeated GitHub API calls reuse TCP/TLS connections instead of paying DNS,
+connect and handshake on every request.
+
+Configuration (environment):
+    GITHUB_TOKEN            - optional API token
+    GITHUB_TOKENS           - optional comma-separated token pool (overrides GITHUB_TOKEN)
+    GITHUB_HTTP_POOL_SIZE   - max pooled connections per host (default 10)
+    GITHUB_HTTP_TIMEOUT     - default request timeout in seconds (default 10)
+    GITHUB_HTTP_RETRIES     - in-process retries for connection errors and 5xx (default 2)
+
+Independent calls can be run concurrently with submit(); the worker pool is
+sized to the connection pool so concurrent calls never wait for a socket.
+
+get(..., conditional=True) revalidates against the last 200 response stored
+in the repository cache using If-None-Match; a 304 is answered from the
+stored body (and does not count against the GitHub rate limit).
+
+Every request takes its token from the rate-limit scheduler, which rotates
+across the token pool and defers work before a budget runs out instead of
+reacting to 403s (see github_scheduler).
+"""
+import os
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+import contextvars
+from typing import Callable, Dict, Any, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from dotenv import load_dotenv
+
+from .github_scheduler import GitHubRateScheduler
+from .repo_cache import RepoAnalysisCache, repo_cache
+
+logger = logging.getLogger("github_client")
+
+load_dotenv()
+
+GITHUB_API_BASE = "https://api.github.com"
+PLACEHOLDER_TOKENS = {"", "your_github_token_here", "ghp_your_github_token_here"}
+# Response headers replayed with a body served from the ETag store
+CACHED_RESPONSE_HEADERS = ("Content-Type", "Link")
+
+
+def configured_tokens() -> List[str]:
+    raw = os.getenv("GITHUB_TOKENS") or os.getenv("GITHUB_TOKEN", "")
+    tokens = [t.strip() for t in raw.split(",")]
+    return [t for t in dict.fromkeys(tokens) if t not in PLACEHOLDER_TOKENS]
+
+
+class GitHubClient:
+    """Process-wide pooled HTTP client for the GitHub REST API"""
+
+    def __init__(
+        self,
+        pool_size: Optional[int] = None,
+        timeout: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        etag_store: Optional[RepoAnalysisCache] = None,
+        scheduler: Optional[GitHubRateScheduler] = None,
+    ):
+        self.pool_size = pool_size or int(os.getenv("GITHUB_HTTP_POOL_SIZE", "10"))
+        self.timeout = timeout or float(os.getenv("GITHUB_HTTP_TIMEOUT", "10"))
+        self.max_retries = max_retries if max_retries is not None else int(os.getenv("GITHUB_HTTP_RETRIES", "2"))
+
+        self.scheduler = scheduler or GitHubRateScheduler(configured_tokens())
+        self.etag_store = etag_store or repo_cache
+
+        self._session_lock = threading.Lock()
+        self._session: Optional[requests.Session] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _build_session(self) -> requests.Session:
+        retry = Retry(
+            total=self.max_retries,
+            connect=self.max_retries,
+            read=self.max_retries,
+            status=self.max_retries,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            backoff_factor=0.3,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+            max_retries=retry,
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({
+            "Accept": "application/vnd.github.v3+json",
+            "User-Agent": "Task-Review-Agent",
+        })
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._build_session()
+        return self._session
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._session_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.pool_size,
+                    thread_name_prefix="github-fetch",
+                )
+            return self._executor
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """Run fn (typically one or more GitHub calls) on the shared fetch pool.
+
+        The caller's context (including request priority) is carried over.
+        """
+        context = contextvars.copy_context()
+        return self._get_executor().submit(context.run, fn, *args, **kwargs)
+
+    def _send(self, url: str, headers: Dict[str, str], timeout: float, **kwargs) -> requests.Response:
+        """Send one GET with a token chosen by the rate-limit scheduler."""
+        budget = self.scheduler.acquire()
+        if budget.token:
+            headers["Authorization"] = f"token {budget.token}"
+        response = self.session.get(url, headers=headers, timeout=timeout, **kwargs)
+        self.scheduler.record(budget, response.headers, response.status_code)
+        return response
+
+    def get(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        conditional: bool = False,
+        **kwargs,
+    ) -> requests.Response:
+        """GET through the shared pool. Retries transient failures in-process.
+
+        With conditional=True the request carries If-None-Match for a
+        previously seen ETag, and a 304 is returned as the cached 200.
+        """
+        timeout = timeout or self.timeout
+        request_headers = dict(headers or {})
+        if not conditional:
+            return self._send(url, request_headers, timeout, **kwargs)
+
+        cache_key = f"{request_headers.get('Accept', '')}|{url}"
+        cached = self.etag_store.get_etag(cache_key)
+        if cached:
+            request_headers["If-None-Match"] = cached["etag"]
+
+        response = self._send(url, request_headers, timeout, **kwargs)
+        if response.status_code == 304 and cached:
+            self.etag_store.record_revalidation()
+            return self._cached_response(url, cached)
+        etag = response.headers.get("ETag")
+        if response.status_code == 200 and etag:
+            kept = {h: response.headers[h] for h in CACHED_RESPONSE_HEADERS if h in response.headers}
+            self.etag_store.put_etag(cache_key, etag, response.text, kept)
+        return response
+
+    @staticmethod
+    def _cached_response(url: str, cached: Dict[str, Any]) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response.encoding = "utf-8"
+        response._content = cached["body"].encode("utf-8")
+        response.headers.update(cached["headers"])
+        response.headers["ETag"] = cached["etag"]
+        return response
+
+    def get_json(self, url: str, timeout: Optional[float] = None, **kwargs) -> Any:
+        """GET and decode JSON, raising requests.HTTPError on non-2xx responses."""
+        response = self.get(url, timeout=timeout, **kwargs)
+        response.raise_for_status()
+        return response.json()
+
+    def close(self):
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+
+# Global GitHub client shared by all analyzers
+github_client = GitHubClient()
@@ -0,0 +1,186 @@
+"""
+GitHub Rate-Limit Scheduler
+Tracks the X-RateLimit-* budget of every configured token and decides which
+token each GitHub request uses, before the request is sent.
+
+- Tokens come from GITHUB_TOKENS (comma-separated) or GITHUB_TOKEN; with no
+  token the pool holds a single unauthenticated slot.
+- Each request takes the token with the most remaining budget. The budget is
+  decremented optimistically and corrected from the response headers.
+- GITHUB_RATE_RESERVE requests per token are held back for interactive
+  traffic: background work (e.g. the autonomous loop re-scoring submissions)
+  only runs while a token has more than the reserve left.
+- When no token can serve a request it waits for the earliest reset, up to
+  GITHUB_RATE_MAX_WAIT seconds (interactive) or immediately defers
+  (background) by raising GitHubRateLimited with a retry-after hint.
+  Waiting interactive requests are served before background ones.
+
+Priority is carried in a context variable; GitHubClient.submit copies the
+caller's context into the fetch pool.
+"""
+import os
+import time
+import threading
+import contextvars
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, List, Optional
+
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_BACKGROUND = "background"
+
+# GitHub's documented hourly budgets
+AUTHENTICATED_LIMIT = 5000
+UNAUTHENTICATED_LIMIT = 60
+
+_priority: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "github_priority", default=PRIORITY_INTERACTIVE
+)
+
+
+def current_priority() -> str:
+    return _priority.get()
+
+
+@contextmanager
+def github_priority(priority: str):
+    """Run GitHub calls made inside the block at the given priority"""
+    reset_token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(reset_token)
+
+
+class GitHubRateLimited(Exception):
+    """No token has budget left for this request within the allowed wait"""
+
+    def __init__(self, retry_after: float, priority: str):
+        self.retry_after = max(0.0, retry_after)
+        self.priority = priority
+        super().__init__(
+            f"GitHub rate limit budget exhausted for {priority} requests; "
+            f"retry after {int(self.retry_after)}s"
+        )
+
+
+class TokenBudget:
+    """Last known rate-limit state of one token"""
+
+    def __init__(self, token: Optional[str]):
+        self.token = token
+        self.limit = AUTHENTICATED_LIMIT if token else UNAUTHENTICATED_LIMIT
+        self.remaining = self.limit
+        self.reset_at = 0.0
+
+    def available(self, now: float) -> int:
+        # A passed reset means the window rolled over since the last response
+        if self.reset_at and now >= self.reset_at:
+            return self.limit
+        return self.remaining
+
+    def label(self) -> str:
+        return f"...{self.token[-4:]}" if self.token else "anonymous"
+
+
+class GitHubRateScheduler:
+    """Token pool with per-token rate budgets and priority-aware admission"""
+
+    def __init__(
+        self,
+        tokens: Iterable[Optional[str]],
+        reserve: Optional[int] = None,
+        max_wait: Optional[float] = None,
+    ):
+        self.budgets: List[TokenBudget] = [TokenBudget(t) for t in tokens] or [TokenBudget(None)]
+        self.reserve = reserve if reserve is not None else int(os.getenv("GITHUB_RATE_RESERVE", "100"))
+        self.max_wait = max_wait if max_wait is not None else float(os.getenv("GITHUB_RATE_MAX_WAIT", "30"))
+        self._cond = threading.Condition()
+        self._interactive_waiting = 0
+        self._deferred = 0
+
+    @property
+    def tokens(self) -> List[Optional[str]]:
+        return [b.token for b in self.budgets]
+
+    def _floor(self, budget: TokenBudget, priority: str) -> int:
+        """Remaining budget that must be kept back for this priority"""
+        if priority == PRIORITY_INTERACTIVE:
+            return 0
+        return min(self.reserve, budget.limit // 2)
+
+    def _pick(self, priority: str, now: float) -> Optional[TokenBudget]:
+        if priority == PRIORITY_BACKGROUND and self._interactive_waiting:
+            return None
+        best = max(self.budgets, key=lambda b: b.available(now))
+        if best.available(now) > self._floor(best, priority):
+            return best
+        return None
+
+    def _next_reset(self, now: float) -> float:
+        resets = [b.reset_at - now for b in self.budgets if b.reset_at > now]
+        return min(resets) if resets else 1.0
+
+    def acquire(self, priority: Optional[str] = None) -> TokenBudget:
+        """Reserve one request on the best token, waiting or deferring if none has budget"""
+        priority = priority or current_priority()
+        max_wait = self.max_wait if priority == PRIORITY_INTERACTIVE else 0.0
+        deadline = time.monotonic() + max_wait
+        with self._cond:
+            waiting = False
+            try:
+                while True:
+                    now = time.time()
+                    budget = self._pick(priority, now)
+                    if budget is not None:
+                        if budget.reset_at and now >= budget.reset_at:
+                            budget.remaining, budget.reset_at = budget.limit, 0.0
+                        budget.remaining -= 1
+                        return budget
+
+                    wait = deadline - time.monotonic()
+                    retry_after = self._next_reset(now)
+                    if wait <= 0 or retry_after > wait:
+                        self._deferred += 1
+                        raise GitHubRateLimited(retry_after, priority)
+                    if priority == PRIORITY_INTERACTIVE and not waiting:
+                        waiting = True
+                        self._interactive_waiting += 1
+                    self._cond.wait(timeout=min(wait, retry_after))
+            finally:
+                if waiting:
+                    self._interactive_waiting -= 1
+                    self._cond.notify_all()
+
+    def record(self, budget: TokenBudget, headers: Dict[str, Any], status_code: int):
+        """Update a token's budget from GitHub's X-RateLimit-* response headers"""
+        with self._cond:
+            try:
+                if "X-RateLimit-Limit" in headers:
+                    budget.limit = int(headers["X-RateLimit-Limit"])
+                if "X-RateLimit-Remaining" in headers:
+                    budget.remaining = int(headers["X-RateLimit-Remaining"])
+                if "X-RateLimit-Reset" in headers:
+                    budget.reset_at = float(headers["X-RateLimit-Reset"])
+            except (TypeError, ValueError):
+                pass
+            if status_code in (403, 429) and str(headers.get("X-RateLimit-Remaining")) == "0":
+                budget.remaining = 0
+            self._cond.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            now = time.time()
+            return {
+                "tokens": [
+                    {
+                        "token": b.label(),
+                        "remaining": b.available(now),
+                        "limit": b.limit,
+                        "reset_in": max(0, int(b.reset_at - now)) if b.reset_at else None,
+                    }
+                    for b in self.budgets
+                ],
+                "reserve": self.reserve,
+                "deferred": self._deferred,
+                "interactive_waiting": self._interactive_waiting,
+            }
@@ -1,9 +1,68 @@
 """
 Intent Extractor - Step 1 of Deterministic Evaluation
 Extracts core objectives and expected features from task metadata
+
+Word tokens of title, description and PDF text come from the submission's
+shared TextFeatures; feature, tech and architecture keywords (all single
+words) are looked up in that token set instead of one regex search per
+keyword. Module phrases ("<name> service") come from one precompiled
+lookahead pass, with each suffix's matches then trimmed to what a separate non-overlapping findall per suffix would return.
 """
 import re
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Set
+
+from .text_features import TextFeatures
+
+TECH_KEYWORDS = frozenset({
+    'python', 'javascript', 'typescript', 'fastapi', 'flask', 'django',
+    'react', 'vue', 'angular', 'node', 'express', 'postgresql', 'sql',
+    'mongodb', 'nosql', 'docker', 'kubernetes', 'aws', 'azure', 'gcp', 'java', 'go', 'rust'
+})
+
+# (architecture, single-word markers, multi-word phrases), checked in order
+ARCH_PATTERNS = (
+    ('mvc', ('mvc',), (('model-view-controller', ('model', 'view', 'controller')),)),
+    ('microservices', ('microservice', 'microservices'), ()),
+    ('layered', ('layered', 'tiered', 'separation'), ()),
+    ('clean', ('hexagonal',), (('clean architecture', ('clean', 'architecture')),)),
+)
+_ARCH_PHRASES = {
+    phrase: re.compile(r'\b' + re.escape(phrase) + r'\b')
+    for _, _, phrases in ARCH_PATTERNS for phrase, _ in phrases
+}
+
+MODULE_SUFFIXES = ('module', 'system', 'service', 'layer', 'engine')
+_MODULE_RE = re.compile(r'\b(\w+)\s+(?=(' + '|'.join(MODULE_SUFFIXES) + '))')
+
+
+def _detect_architecture(text: str, tokens: Set[str]) -> str:
+    for arch, words, phrases in ARCH_PATTERNS:
+        if any(w in tokens for w in words):
+            return arch
+        for phrase, parts in phrases:
+            if all(p in tokens for p in parts) and _ARCH_PHRASES[phrase].search(text):
+                return arch
+    return "Standard"
+
+
+def _find_modules(text: str) -> Set[str]:
+    """Names captured by re.findall(r'(\\w+)\\s+<suffix>') for each suffix, len > 3."""
+    modules = set()
+    resume = dict.fromkeys(MODULE_SUFFIXES, 0)
+    for match in _MODULE_RE.finditer(text):
+        suffix = match.group(2)
+        start, end = match.span(1)
+        pos = resume[suffix]
+        if end <= pos:
+            continue  # Consumed by the previous match for this suffix
+        # A suffix match can end inside the next word ("moduleX"); findall then
+        # resumes there and captures only the rest of that word
+        name = text[max(start, pos):end]
+        resume[suffix] = match.end() + len(suffix)
+        if len(name) > 3:
+            modules.add(name)
+    return modules
+
 
 class IntentExtractor:
     def __init__(self):
@@ -16,7 +75,9 @@ class IntentExtractor:
             'history', 'lifecycle', 'migration', 'client', 'server'
         }
         
-    def extract(self, title: str, description: str, pdf_text: str = "") -> Dict[str, Any]:
+    def extract(
+        self, title: str, description: str, pdf_text: str = "", features: Optional[TextFeatures] = None
+    ) -> Dict[str, Any]:
         """
         Extract structured intent and requirements from all inputs.
         """
@@ -25,50 +86,22 @@ class IntentExtractor:
         
         # 2. Expected Features Extraction
         # Combine all text inputs for comprehensive requirement detection
-        combined_text = (title + " " + description + " " + pdf_text).lower()
-        found_features = set()
-        for keyword in self.feature_keywords:
-            if re.search(r'\b' + re.escape(keyword) + r'\b', combined_text):
-                found_features.add(keyword)
+        features = features or TextFeatures(title, description, pdf_text)
+        combined_text = features.combined_lower
+        tokens = features.combined_tokens
+        found_features = self.feature_keywords & tokens
         
         # 3. Expected Tech Stack Detection
-        tech_keywords = {
-            'python', 'javascript', 'typescript', 'fastapi', 'flask', 'django',
-            'react', 'vue', 'angular', 'node', 'express', 'postgresql', 'sql',
-            'mongodb', 'nosql', 'docker', 'kubernetes', 'aws', 'azure', 'gcp', 'java', 'go', 'rust'
-        }
-        expected_stack = [tech for tech in tech_keywords if re.search(r'\b' + re.escape(tech) + r'\b', combined_text)]
+        expected_stack = TECH_KEYWORDS & tokens
 
         # 4. Expected Architecture Detection
-        arch_patterns = {
-            'mvc': r'\bmvc\b|\bmodel-view-controller\b',
-            'microservices': r'\bmicroservice\b|\bmicroservices\b',
-            'layered': r'\blayered\b|\btiered\b|\bseparation\b',
-            'clean': r'\bclean architecture\b|\bhexagonal\b'
-        }
-        expected_arch = "Standard"
-        for arch, pattern in arch_patterns.items():
-            if re.search(pattern, combined_text):
-                expected_arch = arch
-                break
+        expected_arch = _detect_architecture(combined_text, tokens)
 
         # 5. Expected Modules Detection
-        modules = []
-        module_patterns = [
-            r'(\w+)\s+module',
-            r'(\w+)\s+system',
-            r'(\w+)\s+service',
-            r'(\w+)\s+layer',
-            r'(\w+)\s+engine'
-        ]
-        for pattern in module_patterns:
-            matches = re.findall(pattern, combined_text)
-            for match in matches:
-                if len(match) > 3:
-                    modules.append(match)
+        modules = _find_modules(combined_text)
         
         # 6. Expected Complexity Estimation
-        words = combined_text.split()
+        words = features.combined_words
         complex_keywords = {'microservice', 'distributed', 'orchestration', 'asynchronous', 'concurrency', 'optimization'}
         complex_count = sum(1 for w in words if w in complex_keywords)
         
@@ -82,8 +115,8 @@ class IntentExtractor:
         return {
             "task_objective": objective,
             "expected_features": sorted(list(found_features)),
-            "expected_modules": sorted(list(set(modules))),
-            "expected_tech_stack": sorted(list(set(expected_stack))),
+            "expected_modules": sorted(modules),
+            "expected_tech_stack": sorted(expected_stack),
             "expected_architecture": expected_arch,
             "expected_complexity": complexity
         }
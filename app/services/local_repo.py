@@ -0,0 +1,240 @@
+"""
+Local Repository Backend
+Offline source for RepositoryAnalyzer: a working directory or a bare git
+repository, given as an absolute path or a file:// URL. Once
+REPO_LOCAL_ROOTS is set, RepositoryAnalyzer.analyze routes such URLs here,
+so EvaluationEngine and SignalCollector evaluate local checkouts the same
+way as GitHub repositories (uncached: there is no head commit to pin).
+
+Only directories inside one of the REPO_LOCAL_ROOTS are analyzed: the path
+is resolved (symlinks and '..' included) before it is checked, and nothing
+is walked or archived when it falls outside them. With no roots configured
+local analysis is disabled.
+
+- Working directories are walked once with os.scandir; .gitignore files
+  (root and nested) are honoured as they are met, and .git is skipped.
+- Bare repositories are read with `git archive HEAD`, streamed through the
+  same tar scanner used for GitHub tarballs.
+
+Both produce the git/trees-shaped listing and content metrics of
+repo_archive.ArchiveScanner, so the signals match the GitHub modes.
+
+Configuration (environment):
+    REPO_LOCAL_ROOTS  - os.pathsep-separated directories local analysis may
+                        read (default: none, local analysis disabled)
+"""
+import os
+import re
+import subprocess
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import unquote, urlparse
+
+from .repo_archive import ArchiveScanner, MAX_SCAN_FILE_BYTES, scan_tar_stream
+
+# Extension -> language, for the metadata block GitHub would otherwise supply
+LANGUAGE_EXTENSIONS = {
+    "py": "Python", "js": "JavaScript", "jsx": "JavaScript", "ts": "TypeScript",
+    "tsx": "TypeScript", "java": "Java", "go": "Go", "rs": "Rust", "rb": "Ruby",
+    "php": "PHP", "c": "C", "h": "C", "cpp": "C++", "cc": "C++", "cs": "C#",
+    "kt": "Kotlin", "swift": "Swift", "scala": "Scala", "dart": "Dart",
+}
+
+
+class LocalRepositoryNotAllowed(PermissionError):
+    """Raised for local paths outside REPO_LOCAL_ROOTS"""
+
+
+def is_local_repository(url: str) -> bool:
+    return url.startswith("file://") or os.path.isabs(url)
+
+
+def local_path(url: str) -> str:
+    if url.startswith("file://"):
+        return unquote(urlparse(url).path)
+    return url
+
+
+def allowed_roots() -> List[str]:
+    """Resolved REPO_LOCAL_ROOTS entries."""
+    roots = os.getenv("REPO_LOCAL_ROOTS", "")
+    return [os.path.realpath(root) for root in roots.split(os.pathsep) if root.strip()]
+
+
+def resolve_local_repository(url: str, roots: Optional[List[str]] = None) -> str:
+    """Real path of a local repository, checked against the allowed roots."""
+    roots = allowed_roots() if roots is None else roots
+    if not roots:
+        raise LocalRepositoryNotAllowed("Local repository analysis is disabled (REPO_LOCAL_ROOTS not set)")
+    path = os.path.realpath(local_path(url))
+    if not any(os.path.commonpath([path, root]) == root for root in roots):
+        raise LocalRepositoryNotAllowed(f"Local repository is outside REPO_LOCAL_ROOTS: {url}")
+    return path
+
+
+def _glob_to_regex(pattern: str) -> str:
+    regex = ""
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            regex += "(?:.*/)?"
+            i += 3
+        elif pattern.startswith("/**", i) and i + 3 == len(pattern):
+            regex += "/.*"
+            i += 3
+        elif pattern.startswith("**", i):
+            regex += ".*"
+            i += 2
+        elif pattern[i] == "*":
+            regex += "[^/]*"
+            i += 1
+        elif pattern[i] == "?":
+            regex += "[^/]"
+            i += 1
+        elif pattern[i] == "[" and "]" in pattern[i + 1:]:
+            end = pattern.index("]", i + 1)
+            regex += "[" + pattern[i + 1:end].replace("!", "^", 1) + "]"
+            i = end + 1
+        else:
+            regex += re.escape(pattern[i])
+            i += 1
+    return regex
+
+
+class GitIgnoreRule:
+    """One .gitignore line, matched against paths relative to its directory"""
+
+    def __init__(self, line: str, base: str):
+        self.base = base
+        self.negate = line.startswith("!")
+        if self.negate:
+            line = line[1:]
+        self.dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        anchored = "/" in line
+        line = line.lstrip("/")
+        body = _glob_to_regex(line)
+        self.regex = re.compile(("^" if anchored else "^(?:.*/)?") + body + "$")
+
+    def matches(self, rel_path: str, is_dir: bool) -> bool:
+        if self.dir_only and not is_dir:
+            return False
+        if self.base:
+            if not rel_path.startswith(self.base + "/"):
+                return False
+            rel_path = rel_path[len(self.base) + 1:]
+        return bool(self.regex.match(rel_path))
+
+
+def _read_gitignore(path: str, base: str) -> List[GitIgnoreRule]:
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return []
+    rules = []
+    for line in lines:
+        line = line.rstrip()
+        if line.startswith("\\#") or line.startswith("\\!"):
+            line = line[1:]
+        elif not line or line.startswith("#"):
+            continue
+        rules.append(GitIgnoreRule(line, base))
+    return rules
+
+
+def _ignored(rules: List[GitIgnoreRule], rel_path: str, is_dir: bool) -> bool:
+    ignored = False
+    for rule in rules:
+        if rule.matches(rel_path, is_dir):
+            ignored = not rule.negate
+    return ignored
+
+
+def is_bare_repository(path: str) -> bool:
+    return all(os.path.exists(os.path.join(path, p)) for p in ("HEAD", "objects", "refs")) \
+        and not os.path.exists(os.path.join(path, ".git"))
+
+
+def walk_directory(root: str) -> Tuple[List[Dict[str, Any]], Dict[str, Any], int]:
+    """Single os.scandir pass over a working tree, honouring .gitignore."""
+    scanner = ArchiveScanner(strip_root=False)
+    total_bytes = 0
+    stack = [(root, "", _read_gitignore(os.path.join(root, ".gitignore"), ""))]
+    while stack:
+        directory, rel_dir, rules = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name == ".git" or entry.is_symlink():
+                    continue
+                rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                is_dir = entry.is_dir(follow_symlinks=False)
+                if _ignored(rules, rel_path, is_dir):
+                    continue
+                if is_dir:
+                    scanner.add_dir(rel_path)
+                    nested = _read_gitignore(os.path.join(entry.path, ".gitignore"), rel_path)
+                    stack.append((entry.path, rel_path, rules + nested))
+                elif entry.is_file(follow_symlinks=False):
+                    size = entry.stat(follow_symlinks=False).st_size
+                    total_bytes += size
+                    if size > MAX_SCAN_FILE_BYTES:
+                        scanner.add_file(rel_path, size, None)
+                        continue
+                    with open(entry.path, "rb") as stream:
+                        scanner.add_file(rel_path, size, stream)
+    files, content = scanner.result()
+    return files, content, total_bytes
+
+
+def archive_bare_repository(path: str) -> Tuple[List[Dict[str, Any]], Dict[str, Any], int]:
+    """Stream `git archive HEAD` of a bare repository through the tar scanner."""
+    process = subprocess.Popen(
+        ["git", f"--git-dir={path}", "archive", "--format=tar", "HEAD"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    try:
+        files, content = scan_tar_stream(process.stdout, strip_root=False)
+    finally:
+        process.stdout.close()
+        stderr = process.stderr.read().decode("utf-8", errors="replace")
+        process.stderr.close()
+        returncode = process.wait()
+    if returncode != 0:
+        raise RuntimeError(f"git archive failed for {path}: {stderr.strip()}")
+    total_bytes = sum(f.get("size", 0) for f in files if f["type"] == "blob")
+    return files, content, total_bytes
+
+
+def _dominant_language(files: List[Dict[str, Any]]) -> Optional[str]:
+    counts: Dict[str, int] = {}
+    for f in files:
+        if f["type"] != "blob" or "." not in f["path"]:
+            continue
+        language = LANGUAGE_EXTENSIONS.get(f["path"].rsplit(".", 1)[-1].lower())
+        if language:
+            counts[language] = counts.get(language, 0) + f.get("size", 0)
+    return max(sorted(counts), key=counts.get) if counts else None
+
+
+def scan_local_repository(
+    url: str, roots: Optional[List[str]] = None
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any], Dict[str, Any]]:
+    """Return (tree listing, content metrics, metadata) for an allowed local repository."""
+    path = resolve_local_repository(url, roots)
+    if not os.path.isdir(path):
+        raise FileNotFoundError(f"Local repository not found: {path}")
+
+    if is_bare_repository(path):
+        files, content, total_bytes = archive_bare_repository(path)
+    else:
+        files, content, total_bytes = walk_directory(path)
+
+    name = os.path.basename(path.rstrip(os.sep))
+    metadata = {
+        "name": name[:-4] if name.endswith(".git") else name,
+        "language": _dominant_language(files),
+        "stars": None,
+        "size": total_bytes // 1024,
+    }
+    return files, content, metadata
@@ -0,0 +1,111 @@
+"""
+Path Classifier - Single-Pass Repository Signal Extraction
+Produces the structure, components, architecture and quality signals of
+RepositoryAnalyzer from a git/trees-shaped listing, replacing the
+per-signal rescans (each with its own lowercased path list) of the tree.
+
+The listing is walked once to collect paths and types, joined with NUL
+(which git paths cannot contain) and lowercased in a single call. Whole-tree
+questions (layers, license, interfaces, README) become substring scans of
+that text; keyword matchers drop keywords that do not occur anywhere in the
+tree before the per-path filters run; doc/code counts come from the
+extension histogram. The output is identical to the original implementation.
+"""
+from collections import Counter
+from itertools import repeat
+from typing import Any, Dict, List, Optional, Sequence
+
+SEPARATOR = "\0"
+COMMON_LAYERS = ('api', 'service', 'model', 'repository', 'core', 'infra', 'domain', 'app')
+CODE_EXTENSIONS = frozenset({'py', 'js', 'ts', 'java', 'go'})
+
+COMPONENT_KEYWORDS = {
+    "routes": ('route', 'api', 'controller'),
+    "services": ('service', 'manager'),
+    "models": ('model', 'schema', 'entity'),
+    "tests": ('test',),
+}
+
+
+def _select(paths: List[str], text: str, keywords: Sequence[str]) -> List[str]:
+    """Paths containing any keyword; keywords absent from the whole tree are skipped."""
+    active = [k for k in keywords if k in text]
+    if not active:
+        return []
+    if len(active) == 1:
+        a, = active
+        return [p for p in paths if a in p]
+    if len(active) == 2:
+        a, b = active
+        return [p for p in paths if a in p or b in p]
+    if len(active) == 3:
+        a, b, c = active
+        return [p for p in paths if a in p or b in p or c in p]
+    return [p for p in paths if any(k in p for k in active)]
+
+
+def _readme_index(lower_text: str) -> Optional[int]:
+    """Index of the first entry whose name starts with readme.md."""
+    start = lower_text.find('readme.md')
+    while start != -1:
+        end = lower_text.find(SEPARATOR, start)
+        name_rest = lower_text[start:end if end != -1 else len(lower_text)]
+        if (start == 0 or lower_text[start - 1] in ('/', SEPARATOR)) and '/' not in name_rest:
+            return lower_text.count(SEPARATOR, 0, start)
+        start = lower_text.find('readme.md', start + 1)
+    return None
+
+
+def classify_tree(files: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Return {"structure", "components", "architecture", "quality"} for files."""
+    paths = [f['path'] for f in files]
+    types = [f['type'] for f in files]
+
+    text = SEPARATOR.join(paths)
+    lower_text = text.lower()
+    lower_paths = lower_text.split(SEPARATOR) if paths else []
+    blob_paths = [p for p, t in zip(lower_paths, types) if t == 'blob']
+    blob_text = SEPARATOR.join(blob_paths)
+
+    languages = dict(Counter([p.rpartition('.')[2] for p in paths if '.' in p]))
+    doc_count = sum(n for ext, n in languages.items() if ext.lower() == 'md')
+    code_count = sum(n for ext, n in languages.items() if ext.lower() in CODE_EXTENSIONS)
+
+    found_layers = [
+        layer for layer in COMMON_LAYERS
+        if lower_text.startswith(layer + '/') or f"{SEPARATOR}{layer}/" in lower_text
+    ]
+
+    readme_score = 0
+    readme = _readme_index(lower_text)
+    if readme is not None:
+        readme_score = 1  # Base score for exists
+        size = files[readme].get('size', 0)
+        if size > 1000: readme_score = 3
+        elif size > 500: readme_score = 2
+
+    components = {key: _select(blob_paths, blob_text, kw) for key, kw in COMPONENT_KEYWORDS.items()}
+    components["docs"] = [p for p in blob_paths if p.endswith('.md') or 'docs/' in p]
+
+    return {
+        "structure": {
+            "total_files": len(blob_paths),
+            "total_dirs": types.count('tree'),
+            "max_depth": max(map(str.count, paths, repeat('/'))) if paths else 0,
+            "languages": languages,
+        },
+        "components": components,
+        "architecture": {
+            "has_layers": len(found_layers) >= 3,
+            "layer_count": len(found_layers),
+            "found_layers": sorted(found_layers),
+            "modular": '/' in text,
+            "interface_usage": 'interface' in lower_text or 'abstract' in lower_text,
+        },
+        "quality": {
+            "readme_score": readme_score,
+            "documentation_density": doc_count / code_count if code_count > 0 else 0,
+            "naming_consistency": 0.8,  # Placeholder for more complex logic
+            "has_license": 'license' in lower_text,
+        },
+    }
@@ -10,6 +10,8 @@ import pdfplumber
 from typing import Dict, Any, List, Optional
 from fastapi import UploadFile, HTTPException
 
+from .text_features import TextFeatures
+
 logger = logging.getLogger("pdf_analyzer")
 
 class PDFAnalyzer:
@@ -68,7 +70,7 @@ class PDFAnalyzer:
             logger.error(f"Extraction failed: {e}")
             return ""
 
-    def analyze_content(self, text: str) -> Dict[str, Any]:
+    def analyze_content(self, text: str, features: Optional[TextFeatures] = None) -> Dict[str, Any]:
         """
         Deterministic analysis of PDF text.
         """
@@ -80,7 +82,7 @@ class PDFAnalyzer:
                 "implementation_steps": []
             }
 
-        text_lower = text.lower()
+        text_lower = features.pdf.lower if features is not None else text.lower()
         
         # 1. Technical Stack Discovery
         found_stack = [word for word in self.stack_keywords if word in text_lower]
@@ -1,19 +1,29 @@
 import requests
 import re
-import logging
 import os
-from typing import Dict, Any, Optional
+import logging
+from typing import Dict, Any
 from fastapi import HTTPException
 
+from .github_client import github_client
+from .github_scheduler import GitHubRateLimited
+from .repo_cache import repo_cache
+from .repository_analyzer import RepositoryAnalyzer, RepositorySnapshot
+
 logger = logging.getLogger("task_review_system.repo_analyzer")
 
 class RepoAnalyzer:
     """
     Deterministic GitHub repository analyzer using REST API.
     Extracts metrics without AI or external dependencies beyond requests.
+
+    The metrics are a summary of a RepositoryAnalyzer snapshot; the same
+    snapshot also carries the architecture/quality signals, so callers that
+    need both fetch the repository only once.
     """
 
-    BASE_URL = "https://api.github.com"
+    DEADLINE_SECONDS = float(os.getenv("GITHUB_ANALYSIS_DEADLINE", "15"))
+    cache = repo_cache
 
     @staticmethod
     def _parse_url(url: str) -> tuple[str, str]:
@@ -28,115 +38,70 @@ class RepoAnalyzer:
             repo = repo[:-4]
         return owner, repo
 
-    @staticmethod
-    def _get_commit_count(owner: str, repo: str, headers: Dict) -> int:
-        """Heuristic to get total commit count using Link header."""
-        url = f"{RepoAnalyzer.BASE_URL}/repos/{owner}/{repo}/commits?per_page=1"
-        try:
-            response = requests.get(url, headers=headers, timeout=10)
-            if response.status_code != 200:
-                return 0
-            
-            if "Link" in response.headers:
-                # Format: <...page=123>; rel="last"
-                links = response.headers["Link"]
-                match = re.search(r'page=(\d+)>; rel="last"', links)
-                if match:
-                    return int(match.group(1))
-            
-            # If no link header, there's likely only 1 page
-            return len(response.json())
-        except Exception as e:
-            logger.warning(f"Could not fetch commit count: {e}")
-            return 0
-
     @staticmethod
     def analyze_repo(url: str) -> Dict[str, Any]:
         """
         Main analysis entry point.
         Returns structured metrics for the repository.
         """
-        try:
-            owner, repo = RepoAnalyzer._parse_url(url)
-            headers = {
-                "Accept": "application/vnd.github.v3+json",
-                "User-Agent": "Task-Review-Agent"
-            }
-            
-            # Use GITHUB_TOKEN if available to avoid rate limits
-            token = os.getenv("GITHUB_TOKEN")
-            if token and token != "your_github_token_here":
-                headers["Authorization"] = f"token {token}"
-
-            # 1. Fetch Basic Metadata
-            repo_res = requests.get(f"{RepoAnalyzer.BASE_URL}/repos/{owner}/{repo}", headers=headers, timeout=10)
-            
-            if repo_res.status_code == 404:
-                raise HTTPException(status_code=404, detail="Repository not found or is private.")
-            elif repo_res.status_code == 403:
-                raise HTTPException(status_code=429, detail="GitHub API rate limit exceeded. Please try again later.")
-            
-            repo_res.raise_for_status()
-            repo_data = repo_res.json()
-
-            default_branch = repo_data.get("default_branch", "main")
-            
-            # 2. Fetch Languages
-            lang_res = requests.get(f"{RepoAnalyzer.BASE_URL}/repos/{owner}/{repo}/languages", headers=headers, timeout=10)
-            languages = lang_res.json() if lang_res.status_code == 200 else {}
-
-            # 3. Fetch Commit Count
-            commit_count = RepoAnalyzer._get_commit_count(owner, repo, headers)
+        return RepoAnalyzer.snapshot(url).metrics
 
-            # 4. Fetch Tree for Files/Structure Analysis
-            tree_url = f"{RepoAnalyzer.BASE_URL}/repos/{owner}/{repo}/git/trees/{default_branch}?recursive=1"
-            tree_res = requests.get(tree_url, headers=headers, timeout=10)
-            
-            has_readme = False
-            has_tests = False
-            file_count = 0
-            
-            if tree_res.status_code == 200:
-                tree_data = tree_res.json().get("tree", [])
-                for item in tree_data:
-                    path = item.get("path", "").lower()
-                    if item.get("type") == "blob":
-                        file_count += 1
-                        if "readme" in path:
-                            has_readme = True
-                    
-                    if item.get("type") == "tree":
-                        if any(t in path for t in ["test", "tests", "spec", "specs"]):
-                            has_tests = True
+    @staticmethod
+    def snapshot(url: str) -> RepositorySnapshot:
+        """
+        Fetch the repository (metadata, head commit, languages, commit count
+        and tree) with every call sharing one deadline
+        (GITHUB_ANALYSIS_DEADLINE seconds). Optional lookups that miss it
+        degrade to empty values; the tree summary is cached per head commit.
 
-            metrics = {
-                "repo_name": repo_data.get("full_name"),
-                "default_branch": default_branch,
-                "commit_count": commit_count,
-                "has_readme": has_readme,
-                "has_tests": has_tests,
-                "file_count": file_count,
-                "languages": list(languages.keys()),
-                "stars": repo_data.get("stargazers_count", 0),
-                "forks": repo_data.get("forks_count", 0),
-                "is_private": repo_data.get("private", False),
-                "last_updated": repo_data.get("updated_at")
-            }
+        Concurrent snapshots of the same repository are coalesced into one
+        set of GitHub fetches.
+        """
+        try:
+            RepoAnalyzer._parse_url(url)
+            provider = RepositoryAnalyzer(client=github_client, cache=RepoAnalyzer.cache)
+            snapshot = provider.snapshot(url, activity=True, deadline_seconds=RepoAnalyzer.DEADLINE_SECONDS)
+            if snapshot is None:
+                raise ValueError("Invalid GitHub URL format")
 
-            logger.info(f"Analyzed repository: {metrics['repo_name']} with {file_count} files.")
-            return metrics
+            logger.info(f"Analyzed repository: {snapshot.repo_info.get('full_name')} with {snapshot.metrics['file_count']} files.")
+            return snapshot
 
-        except HTTPException:
-            raise
+        except GitHubRateLimited as e:
+            logger.warning(str(e))
+            raise HTTPException(
+                status_code=429,
+                detail="GitHub API rate limit budget exhausted. Please try again later.",
+                headers={"Retry-After": str(int(e.retry_after) + 1)},
+            )
         except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
-        except requests.exceptions.RequestException as e:
-            logger.error(f"GitHub API Error: {str(e)}")
-            raise HTTPException(status_code=502, detail="External service (GitHub) error.")
         except Exception as e:
+            # Not only requests.HTTPError carries the GitHub response (futures and
+            # single-flight re-raise wrapped errors), so map on the status itself
+            status = RepoAnalyzer._response_status(e)
+            if status == 404:
+                raise HTTPException(status_code=404, detail="Repository not found or is private.")
+            elif status == 403:
+                raise HTTPException(status_code=429, detail="GitHub API rate limit exceeded. Please try again later.")
+            if isinstance(e, requests.exceptions.RequestException):
+                logger.error(f"GitHub API Error: {str(e)}")
+                raise HTTPException(status_code=502, detail="External service (GitHub) error.")
             logger.error(f"Unexpected error analyzing repo: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Internal analysis failure: {str(e)}")
 
+    @staticmethod
+    def _response_status(error: BaseException):
+        """Status code of the GitHub response behind error (or its cause), if any."""
+        seen = set()
+        while error is not None and id(error) not in seen:
+            seen.add(id(error))
+            status = getattr(getattr(error, "response", None), "status_code", None)
+            if isinstance(status, int):
+                return status
+            error = error.__cause__ or error.__context__
+        return None
+
 if __name__ == "__main__":
     # Local dry run
     import json
@@ -0,0 +1,172 @@
+"""
+Repository Archive Scanner
+Builds the file list used by RepositoryAnalyzer, plus content metrics, from
+a repository archive read as a stream. Nothing is extracted to disk: tar
+archives are read member by member straight off the HTTP response.
+
+The file list has the same shape as the GitHub git/trees API
+({"path", "type": "blob" | "tree", "size"}), so the existing path-based
+signal extraction works unchanged.
+"""
+import io
+import re
+import os
+import tarfile
+from typing import IO, Any, Dict, List, Optional, Tuple
+
+MAX_ARCHIVE_BYTES = int(os.getenv("REPO_ARCHIVE_MAX_BYTES", str(200 * 1024 * 1024)))
+# Larger files are listed but not read for content metrics
+MAX_SCAN_FILE_BYTES = 1024 * 1024
+BINARY_SNIFF_BYTES = 8192
+
+COMMENT_PREFIXES = {
+    "#": {"py", "sh", "bash", "rb", "yml", "yaml", "toml", "r", "pl", "cfg", "ini", "dockerfile"},
+    "//": {"js", "jsx", "ts", "tsx", "java", "go", "c", "h", "cc", "cpp", "hpp", "cs", "kt",
+           "swift", "rs", "scala", "php", "dart"},
+    "--": {"sql", "lua", "hs"},
+}
+BLOCK_COMMENT_EXTS = COMMENT_PREFIXES["//"] | {"css", "scss"}
+TODO_PATTERN = re.compile(r"\b(TODO|FIXME|XXX)\b")
+TEST_FUNCTION_PATTERN = re.compile(r"^\s*(def test_|async def test_|it\(|test\(|@Test\b|func Test)")
+
+
+class ArchiveTooLarge(ValueError):
+    pass
+
+
+class _LimitedReader(io.RawIOBase):
+    """File-like wrapper that aborts once more than limit bytes were read"""
+
+    def __init__(self, raw: IO[bytes], limit: int):
+        self._raw = raw
+        self._limit = limit
+        self.bytes_read = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._raw.read(size)
+        self.bytes_read += len(chunk)
+        if self.bytes_read > self._limit:
+            raise ArchiveTooLarge(f"Repository archive exceeds {self._limit} bytes")
+        return chunk
+
+    def readinto(self, buffer) -> int:
+        chunk = self.read(len(buffer))
+        buffer[:len(chunk)] = chunk
+        return len(chunk)
+
+
+class ArchiveScanner:
+    """Accumulates the tree listing and content metrics for one archive"""
+
+    def __init__(self, strip_root: bool = True):
+        self.strip_root = strip_root
+        self._dirs = set()
+        self._files: List[Dict[str, Any]] = []
+        self.metrics = {
+            "files_scanned": 0,
+            "binary_files": 0,
+            "skipped_large_files": 0,
+            "total_lines": 0,
+            "code_lines": 0,
+            "blank_lines": 0,
+            "comment_lines": 0,
+            "max_file_lines": 0,
+            "todo_count": 0,
+            "test_functions": 0,
+            "readme_lines": 0,
+        }
+
+    def _normalize(self, name: str) -> Optional[str]:
+        path = name.replace("\\", "/")
+        while path.startswith("./"):
+            path = path[2:]
+        path = path.strip("/")
+        if self.strip_root:
+            path = path.partition("/")[2]
+        return path or None
+
+    def _add_parents(self, path: str):
+        parent = path.rpartition("/")[0]
+        while parent and parent not in self._dirs:
+            self._dirs.add(parent)
+            parent = parent.rpartition("/")[0]
+
+    def add_dir(self, name: str):
+        path = self._normalize(name)
+        if path:
+            self._dirs.add(path)
+            self._add_parents(path)
+
+    def add_file(self, name: str, size: int, stream: Optional[IO[bytes]]):
+        path = self._normalize(name)
+        if not path:
+            return
+        self._add_parents(path)
+        self._files.append({"path": path, "type": "blob", "size": size})
+
+        if size > MAX_SCAN_FILE_BYTES:
+            self.metrics["skipped_large_files"] += 1
+            return
+        if stream is None:
+            return
+        data = stream.read()
+        if b"\0" in data[:BINARY_SNIFF_BYTES]:
+            self.metrics["binary_files"] += 1
+            return
+        self._count_lines(path, data.decode("utf-8", errors="replace"))
+
+    def _count_lines(self, path: str, text: str):
+        name = path.rsplit("/", 1)[-1].lower()
+        ext = name.rsplit(".", 1)[-1] if "." in name else name
+        prefixes = tuple(p for p, exts in COMMENT_PREFIXES.items() if ext in exts)
+        if ext in BLOCK_COMMENT_EXTS:
+            prefixes += ("/*", "*")
+
+        m = self.metrics
+        lines = text.splitlines()
+        m["files_scanned"] += 1
+        m["total_lines"] += len(lines)
+        m["max_file_lines"] = max(m["max_file_lines"], len(lines))
+        if name.startswith("readme"):
+            m["readme_lines"] += len(lines)
+        for line in lines:
+            stripped = line.strip()
+            if not stripped:
+                m["blank_lines"] += 1
+            elif prefixes and stripped.startswith(prefixes):
+                m["comment_lines"] += 1
+            else:
+                m["code_lines"] += 1
+            if "TODO" in line or "FIXME" in line or "XXX" in line:
+                m["todo_count"] += len(TODO_PATTERN.findall(line))
+            if TEST_FUNCTION_PATTERN.match(line):
+                m["test_functions"] += 1
+
+    def result(self) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        files = [{"path": d, "type": "tree"} for d in sorted(self._dirs)]
+        files += sorted(self._files, key=lambda f: f["path"])
+        metrics = dict(self.metrics)
+        scanned = metrics["files_scanned"]
+        metrics["avg_file_lines"] = round(metrics["total_lines"] / scanned, 2) if scanned else 0
+        metrics["comment_ratio"] = (
+            round(metrics["comment_lines"] / metrics["code_lines"], 4) if metrics["code_lines"] else 0
+        )
+        return files, metrics
+
+
+def scan_tar_stream(fileobj: IO[bytes], strip_root: bool = True,
+                    max_bytes: int = MAX_ARCHIVE_BYTES) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """Scan a (optionally compressed) tar stream member by member."""
+    scanner = ArchiveScanner(strip_root=strip_root)
+    reader = io.BufferedReader(_LimitedReader(fileobj, max_bytes))
+    with tarfile.open(fileobj=reader, mode="r|*") as archive:
+        for member in archive:
+            if member.isdir():
+                scanner.add_dir(member.name)
+            elif member.isfile():
+                stream = archive.extractfile(member) if member.size <= MAX_SCAN_FILE_BYTES else None
+                scanner.add_file(member.name, member.size, stream)
+    return scanner.result()
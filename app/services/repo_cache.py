@@ -0,0 +1,156 @@
+"""
+Repository Analysis Cache
+Persistent cache for GitHub repository analysis, shared by all workers.
+
+Two tables in one SQLite file:
+  analyses  - analyzer results keyed by namespace:owner/repo@head-commit-sha.
+              A commit SHA pins the tree, so an entry never goes stale
+              until the TTL (which bounds analyzer-logic drift) expires.
+  etags     - last 200 response body + ETag per conditional GitHub URL, used
+              by GitHubClient to send If-None-Match. A 304 reply does not
+              count against the GitHub rate limit.
+
+Both tables are size-bounded with least-recently-used eviction.
+
+Configuration (environment):
+    REPO_CACHE_PATH         - SQLite file (default data/repo_analysis_cache.db)
+    REPO_CACHE_TTL          - analysis entry lifetime in seconds (default 86400)
+    REPO_CACHE_MAX_ENTRIES  - max rows per table (default 500)
+"""
+import os
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "data")
+CACHE_FILE = os.path.join(CACHE_DIR, "repo_analysis_cache.db")
+
+
+def analysis_key(namespace: str, owner: str, repo: str, sha: str) -> str:
+    return f"{namespace}:{owner.lower()}/{repo.lower()}@{sha}"
+
+
+class RepoAnalysisCache:
+    """SQLite-backed analysis + ETag cache with TTL, LRU bounds and hit metrics"""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None,
+    ):
+        self.path = path or os.getenv("REPO_CACHE_PATH") or CACHE_FILE
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else float(os.getenv("REPO_CACHE_TTL", "86400"))
+        self.max_entries = max_entries or int(os.getenv("REPO_CACHE_MAX_ENTRIES", "500"))
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "expired": 0, "evictions": 0, "revalidated": 0}
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        # Connections must not cross a fork; reopen in the child process
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS analyses ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL, accessed REAL NOT NULL)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS etags ("
+            "key TEXT PRIMARY KEY, etag TEXT NOT NULL, body TEXT NOT NULL, "
+            "headers TEXT NOT NULL, accessed REAL NOT NULL)"
+        )
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    def _count(self, stat: str, amount: int = 1):
+        with self._stats_lock:
+            self._stats[stat] += amount
+
+    def _evict(self, conn: sqlite3.Connection, table: str):
+        overflow = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] - self.max_entries
+        if overflow > 0:
+            conn.execute(
+                f"DELETE FROM {table} WHERE key IN "
+                f"(SELECT key FROM {table} ORDER BY accessed ASC LIMIT ?)",
+                (overflow,),
+            )
+            self._count("evictions", overflow)
+
+    # --- analysis results ---
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        conn = self._connect()
+        row = conn.execute("SELECT value, created FROM analyses WHERE key = ?", (key,)).fetchone()
+        now = time.time()
+        if row is None:
+            self._count("misses")
+            return None
+        if now - row[1] > self.ttl_seconds:
+            conn.execute("DELETE FROM analyses WHERE key = ?", (key,))
+            self._count("expired")
+            self._count("misses")
+            return None
+        conn.execute("UPDATE analyses SET accessed = ? WHERE key = ?", (now, key))
+        self._count("hits")
+        return json.loads(row[0])
+
+    def put(self, key: str, value: Dict[str, Any]):
+        conn = self._connect()
+        now = time.time()
+        conn.execute(
+            "INSERT OR REPLACE INTO analyses (key, value, created, accessed) VALUES (?, ?, ?, ?)",
+            (key, json.dumps(value), now, now),
+        )
+        self._evict(conn, "analyses")
+
+    # --- conditional request validators ---
+
+    def get_etag(self, key: str) -> Optional[Dict[str, Any]]:
+        conn = self._connect()
+        row = conn.execute("SELECT etag, body, headers FROM etags WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        conn.execute("UPDATE etags SET accessed = ? WHERE key = ?", (time.time(), key))
+        return {"etag": row[0], "body": row[1], "headers": json.loads(row[2])}
+
+    def put_etag(self, key: str, etag: str, body: str, headers: Dict[str, str]):
+        conn = self._connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO etags (key, etag, body, headers, accessed) VALUES (?, ?, ?, ?, ?)",
+            (key, etag, body, json.dumps(headers), time.time()),
+        )
+        self._evict(conn, "etags")
+
+    def record_revalidation(self):
+        self._count("revalidated")
+
+    # --- metrics ---
+
+    def stats(self) -> Dict[str, Any]:
+        conn = self._connect()
+        with self._stats_lock:
+            stats = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        stats["entries"] = conn.execute("SELECT COUNT(*) FROM analyses").fetchone()[0]
+        stats["etag_entries"] = conn.execute("SELECT COUNT(*) FROM etags").fetchone()[0]
+        return stats
+
+    def clear(self):
+        conn = self._connect()
+        conn.execute("DELETE FROM analyses")
+        conn.execute("DELETE FROM etags")
+        with self._stats_lock:
+            for stat in self._stats:
+                self._stats[stat] = 0
+
+
+# Global repository analysis cache
+repo_cache = RepoAnalysisCache()
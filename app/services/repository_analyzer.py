@@ -1,96 +1,361 @@
 """
 Repository Analyzer - Deterministic Evaluation Module
 Extracts measurable signals from GitHub repositories for architecture and quality analysis.
+
+Two analysis modes (REPO_ANALYSIS_MODE, or the mode argument of analyze):
+  tree     - recursive git/trees API listing (default)
+  tarball  - one archive download, scanned as a stream; adds a "content"
+             signal block with line/comment/test metrics and is not subject
+             to the tree API's truncation on large repositories
+
+analyze() only accepts GitHub URLs. Local directories and bare git
+repositories are analyzed offline through the explicit analyze_local(),
+restricted to REPO_LOCAL_ROOTS (see local_repo), with the same signal
+schema as tarball mode.
+
+RepositoryAnalyzer is the single source of GitHub repository data: one
+snapshot() fetches metadata and head commit (plus languages and commit
+count when activity=True); the file listing at that commit is fetched on
+first use, and both the architecture/quality signals and RepoAnalyzer's
+metrics summary are derived from it. Callers pin() a submission's
+repository once, key their caches on the snapshot's head SHA and hand the
+same snapshot to the analysis stages, so a review fetches the repository
+once and its signals always belong to the commit they are cached under.
 """
-import requests
-import subprocess
-import json as _json
+import os
 import re
+import time
 import base64
-from typing import Dict, Any, Optional, List
+import threading
+from concurrent.futures import Future, TimeoutError as FuturesTimeoutError
+from typing import Callable, Dict, Any, List, Optional, Tuple, Union
 import logging
-import os
 from dotenv import load_dotenv
 
+from .github_client import github_client, GITHUB_API_BASE
+from .local_repo import allowed_roots, is_local_repository, scan_local_repository
+from .path_classifier import classify_tree
+from .repo_archive import scan_tar_stream
+from .repo_cache import analysis_key, repo_cache
+from .single_flight import analysis_flights
+
 logger = logging.getLogger("repository_analyzer")
 
 load_dotenv()
 
-def _curl_get(url: str, headers: dict, timeout: int = 15) -> Optional[dict]:
-    """Fallback HTTP GET using curl.exe (uses WinINet DNS, bypasses broken system DNS)."""
-    try:
-        args = ["curl.exe", "-s", "--max-time", str(timeout)]
-        for k, v in headers.items():
-            args += ["-H", f"{k}: {v}"]
-        args.append(url)
-        result = subprocess.run(args, capture_output=True, text=True, timeout=timeout + 5)
-        if result.returncode == 0 and result.stdout:
-            return _json.loads(result.stdout)
-    except Exception as e:
-        logger.warning(f"curl fallback failed: {e}")
-    return None
+ANALYSIS_MODES = ("tree", "tarball")
+
+
+def summarize_tree(files: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """README/test-directory presence and file count, as reported by RepoAnalyzer."""
+    has_readme = False
+    has_tests = False
+    file_count = 0
+
+    for item in files:
+        path = item.get("path", "").lower()
+        if item.get("type") == "blob":
+            file_count += 1
+            if "readme" in path:
+                has_readme = True
+
+        if item.get("type") == "tree":
+            if any(t in path for t in ["test", "tests", "spec", "specs"]):
+                has_tests = True
+
+    return {"has_readme": has_readme, "has_tests": has_tests, "file_count": file_count}
+
+
+class _Lazy:
+    """Value loaded once on first get(); shared (not copied) by copies of its snapshot"""
+
+    def __init__(self, load: Callable[[], Any]):
+        self._load = load
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._value = None
+
+    def get(self) -> Any:
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self._value = self._load()
+                    self._loaded = True
+        return self._value
+
+    def __deepcopy__(self, memo):
+        # single-flight followers get copies of the snapshot; they share one listing fetch
+        return self
+
+
+class RepositorySnapshot:
+    """One fetch of a GitHub repository and everything derived from it"""
+
+    def __init__(
+        self,
+        url: str,
+        mode: str,
+        repo_info: Dict[str, Any],
+        head_sha: Optional[str],
+        derived: Union[Dict[str, Any], Callable[[], Dict[str, Any]]],
+        languages: Optional[Dict[str, int]] = None,
+        commit_count: Optional[int] = None,
+    ):
+        self.url = url
+        self.mode = mode
+        self.repo_info = repo_info
+        self.head_sha = head_sha
+        # derived may be a loader, called on first use (fetches the file listing)
+        self._derived = _Lazy(derived if callable(derived) else lambda: derived)
+        self.languages = languages
+        self.commit_count = commit_count
+
+    @property
+    def derived(self) -> Dict[str, Any]:
+        """{"signals": ..., "summary": ...} of the file listing at head_sha."""
+        return self._derived.get()
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Metadata block of signals, from repo_info (no file listing needed)."""
+        return {
+            "name": self.repo_info.get('name'),
+            "language": self.repo_info.get('language'),
+            "stars": self.repo_info.get('stargazers_count'),
+            "size": self.repo_info.get('size'),
+        }
+
+    @property
+    def signals(self) -> Dict[str, Any]:
+        """Architecture/quality signals (RepositoryAnalyzer.analyze schema)."""
+        signals = dict(self.derived["signals"])
+        signals["metadata"] = self.metadata
+        return signals
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        """Metrics summary (RepoAnalyzer.analyze_repo schema)."""
+        summary = self.derived["summary"]
+        return {
+            "url": self.url,
+            "repo_name": self.repo_info.get("full_name"),
+            "default_branch": self.repo_info.get("default_branch", "main"),
+            "commit_count": self.commit_count or 0,
+            "has_readme": summary["has_readme"],
+            "has_tests": summary["has_tests"],
+            "file_count": summary["file_count"],
+            "languages": list((self.languages or {}).keys()),
+            "stars": self.repo_info.get("stargazers_count", 0),
+            "forks": self.repo_info.get("forks_count", 0),
+            "is_private": self.repo_info.get("private", False),
+            "last_updated": self.repo_info.get("updated_at")
+        }
+
 
 class RepositoryAnalyzer:
-    def __init__(self):
-        self.github_api_base = "https://api.github.com/repos"
-        token = os.getenv("GITHUB_TOKEN")
-        self.headers = {"Accept": "application/vnd.github.v3+json"}
-        if token:
-            self.headers["Authorization"] = f"token {token}"
-            logger.info("GitHub Token found and initialized.")
-        http_proxy = os.getenv("HTTP_PROXY") or os.getenv("http_proxy")
-        https_proxy = os.getenv("HTTPS_PROXY") or os.getenv("https_proxy")
-        self.proxies = {}
-        if https_proxy:
-            self.proxies["https"] = https_proxy
-        if http_proxy:
-            self.proxies["http"] = http_proxy
-
-    def analyze(self, repository_url: Optional[str]) -> Optional[Dict[str, Any]]:
+    CACHE_NAMESPACE = "repository_snapshot"
+
+    def __init__(self, mode: Optional[str] = None, client=None, cache=None):
+        # HTTP pooling, auth (GITHUB_TOKEN), proxies (HTTP(S)_PROXY) and
+        # retries are handled by the shared github_client.
+        self.github_api_base = f"{GITHUB_API_BASE}/repos"
+        self.client = client or github_client
+        self.cache = cache or repo_cache
+        self.mode = mode or os.getenv("REPO_ANALYSIS_MODE", "tree")
+        if self.mode not in ANALYSIS_MODES:
+            raise ValueError(f"Unsupported repository analysis mode: {self.mode}")
+
+    def analyze(
+        self,
+        repository_url: Optional[str],
+        mode: Optional[str] = None,
+        snapshot: Union[RepositorySnapshot, Exception, None] = None,
+    ) -> Optional[Dict[str, Any]]:
         """
-        Analyze GitHub repository and return structured measurable signals.
+        Analyze GitHub repository and return structured measurable signals:
+        those of snapshot if given (e.g. the one pin() returned), otherwise
+        of a fresh snapshot(). The error pin() returned for a repository it
+        could not resolve becomes error signals without fetching again.
+
+        Local paths and file:// URLs are analyzed offline by analyze_local()
+        once REPO_LOCAL_ROOTS is configured (see local_repo); otherwise they
+        are not repositories and give None. They have no head commit to pin,
+        so their evaluations are never cached.
         """
         if not repository_url:
             return None
-            
+        if isinstance(snapshot, Exception):
+            return self._error_signals(snapshot)
+        if is_local_repository(repository_url):
+            return self.analyze_local(repository_url) if allowed_roots() else None
+
         try:
-            owner, repo = self._parse_github_url(repository_url)
-            if not owner or not repo:
-                return None
-                
-            # 1. Fetch File Tree (Recursive)
-            # Use 'main' or 'master' or fetch default branch first
-            repo_info = self._get_repo_info(owner, repo)
-            default_branch = repo_info.get('default_branch', 'main')
-            tree_data = self._fetch_recursive_tree(owner, repo, default_branch)
-            
-            # 2. Extract Measurable Signals
-            files = tree_data.get('tree', [])
-            
-            signals = {
-                "structure": self._analyze_structure(files),
-                "components": self._analyze_components(files),
-                "architecture": self._analyze_architecture(files),
-                "quality": self._analyze_quality(owner, repo, files),
-                "metadata": {
-                    "name": repo_info.get('name'),
-                    "language": repo_info.get('language'),
-                    "stars": repo_info.get('stargazers_count'),
-                    "size": repo_info.get('size'),
-                }
-            }
-            
-            return signals
-            
+            if snapshot is None:
+                snapshot = self.snapshot(repository_url, mode)
+            return snapshot.signals if snapshot else None
         except Exception as e:
             logger.error(f"Repository analysis failed: {e}")
-            return {
-                "error": str(e),
-                "structure": {"total_files": 0, "total_dirs": 0},
-                "components": {"routes": [], "services": [], "models": []},
-                "architecture": {"has_layers": False, "modular": False},
-                "quality": {"readme_score": 0, "documentation_density": 0}
-            }
+            return self._error_signals(e)
+
+    def pin(
+        self, repository_url: Optional[str], snapshot: Optional[RepositorySnapshot] = None
+    ) -> Tuple[Optional[str], Union[RepositorySnapshot, Exception, None]]:
+        """
+        (head SHA, snapshot) of a submission's repository, for cache keys:
+        ("", None) without a repository, (None, None) for a URL that is not
+        a GitHub repository and (None, error) when the lookup failed; pass
+        the second item on to analyze() so a failed lookup is not retried.
+        An already-taken snapshot in this analyzer's mode is reused as-is.
+
+        Costs one round trip (metadata and head commit are fetched
+        concurrently); the file listing is only fetched once the snapshot's
+        signals are read, at the pinned commit.
+        """
+        if not repository_url:
+            return "", None
+        if snapshot is None or snapshot.mode != self.mode:
+            try:
+                snapshot = self.snapshot(repository_url)
+            except Exception as e:
+                logger.warning(f"Could not resolve repository: {e}")
+                return None, e
+        if snapshot is None:
+            return None, None
+        return snapshot.head_sha, snapshot
+
+    def snapshot(
+        self,
+        repository_url: str,
+        mode: Optional[str] = None,
+        activity: bool = False,
+        deadline_seconds: Optional[float] = None,
+    ) -> Optional[RepositorySnapshot]:
+        """
+        Fetch a GitHub repository once; None for URLs that are not GitHub
+        repositories. Fetch errors on the metadata call are raised.
+
+        The file listing is fetched at the head commit when the snapshot's
+        signals or metrics are first read; the derived signals and summary
+        are cached per head commit SHA. Metadata and the SHA are revalidated
+        with conditional requests, so an unchanged repository costs two 304s
+        and no tree fetch.
+        activity=True adds languages and commit count (fetched concurrently).
+        With deadline_seconds every call shares one deadline and optional
+        lookups that miss it degrade to empty values. Concurrent snapshots
+        of the same repository share one execution.
+        """
+        mode = mode or self.mode
+        if is_local_repository(repository_url):
+            return None
+        owner, repo = self._parse_github_url(repository_url)
+        if not owner or not repo:
+            return None
+        kind = f"{mode}+activity" if activity else mode
+        flight_key = f"{self.CACHE_NAMESPACE}.{kind}:{owner.lower()}/{repo.lower()}@HEAD"
+        return analysis_flights.do(
+            flight_key, self._snapshot, repository_url, owner, repo, mode, activity, deadline_seconds
+        )
+
+    def head_revision(self, repository_url: Optional[str]) -> Optional[str]:
+        """
+        Head commit SHA of the repository's default branch, or None when the
+        analyzed content cannot be pinned to a commit (see pin()).
+        """
+        if not repository_url:
+            return None
+        return self.pin(repository_url)[0]
+
+    def _snapshot(
+        self,
+        repository_url: str,
+        owner: str,
+        repo: str,
+        mode: str,
+        activity: bool,
+        deadline_seconds: Optional[float],
+    ) -> RepositorySnapshot:
+        deadline = time.monotonic() + deadline_seconds if deadline_seconds else None
+
+        # Independent calls run on the shared fetch pool
+        sha_future = self.client.submit(self._get_head_sha, owner, repo, "HEAD", self._timeout(deadline))
+        if activity:
+            lang_future = self.client.submit(self._get_languages, owner, repo, self._timeout(deadline))
+            commit_future = self.client.submit(self._get_commit_count, owner, repo, self._timeout(deadline))
+
+        repo_info = self._get_repo_info(owner, repo, self._timeout(deadline))
+        default_branch = repo_info.get('default_branch', 'main')
+
+        head_sha = self._await(sha_future, deadline, None, "head commit")
+        namespace = self.CACHE_NAMESPACE if mode == "tree" else f"{self.CACHE_NAMESPACE}.{mode}"
+        cache_key = analysis_key(namespace, owner, repo, head_sha) if head_sha else None
+
+        def load_derived() -> Dict[str, Any]:
+            derived = self.cache.get(cache_key) if cache_key else None
+            if derived is None:
+                # At the pinned commit, so a concurrent push cannot change what is cached under it
+                derived, complete = self._derive(owner, repo, head_sha or default_branch, mode, deadline)
+                if cache_key and complete:
+                    self.cache.put(cache_key, derived)
+            return derived
+
+        return RepositorySnapshot(
+            url=repository_url,
+            mode=mode,
+            repo_info=repo_info,
+            head_sha=head_sha,
+            derived=load_derived,
+            languages=self._await(lang_future, deadline, {}, "languages") if activity else None,
+            commit_count=self._await(commit_future, deadline, 0, "commit count") if activity else None,
+        )
+
+    def _derive(self, owner: str, repo: str, ref: str, mode: str, deadline: Optional[float]) -> tuple:
+        """(signals and summary of ref's file listing, whether the listing was fetched)"""
+        content = None
+        archive = None
+        if mode == "tarball":
+            archive = self._await(
+                self.client.submit(self._fetch_archive, owner, repo, ref, self._timeout(deadline, 60)),
+                deadline, None, "archive",
+            )
+        if archive is not None:
+            files, content = archive
+            tree_data = {"tree": files}
+        else:
+            tree_data = self._await(
+                self.client.submit(self._fetch_recursive_tree, owner, repo, ref, self._timeout(deadline, 15)),
+                deadline, None, "tree",
+            )
+
+        files = (tree_data or {}).get('tree', [])
+        signals = classify_tree(files)
+        if content is not None:
+            signals["content"] = content
+        return {"signals": signals, "summary": summarize_tree(files)}, tree_data is not None
+
+    @staticmethod
+    def _error_signals(error: Exception) -> Dict[str, Any]:
+        return {
+            "error": str(error),
+            "structure": {"total_files": 0, "total_dirs": 0},
+            "components": {"routes": [], "services": [], "models": []},
+            "architecture": {"has_layers": False, "modular": False},
+            "quality": {"readme_score": 0, "documentation_density": 0}
+        }
+
+    def analyze_local(self, path: str) -> Dict[str, Any]:
+        """
+        Offline analysis of a local working tree or bare repository (no cache,
+        no network). Only paths that resolve inside REPO_LOCAL_ROOTS are read.
+        """
+        try:
+            files, content, metadata = scan_local_repository(path)
+            signals = classify_tree(files)
+            signals["metadata"] = metadata
+            signals["content"] = content
+            return signals
+        except Exception as e:
+            logger.error(f"Local repository analysis failed: {e}")
+            return self._error_signals(e)
 
     def _parse_github_url(self, url: str) -> tuple:
         pattern = r'github\.com/([^/]+)/([^/]+)'
@@ -102,98 +367,92 @@ class RepositoryAnalyzer:
             return match.group(1), repo.rstrip('/')
         return None, None
 
-    def _get(self, url: str, timeout: int = 10) -> dict:
-        """GET with requests, falling back to curl.exe on failure."""
+    def _timeout(self, deadline: Optional[float], default: Optional[float] = None) -> Optional[float]:
+        """Per-call timeout, capped so no single call outlives the deadline."""
+        default = default or self.client.timeout
+        if deadline is None:
+            return default
+        return max(0.1, min(default, deadline - time.monotonic()))
+
+    @staticmethod
+    def _await(future: Future, deadline: Optional[float], default: Any, label: str) -> Any:
+        """Collect a concurrent fetch; fall back to default if the deadline passes."""
         try:
-            resp = requests.get(url, headers=self.headers, proxies=self.proxies, timeout=timeout)
-            resp.raise_for_status()
-            return resp.json()
-        except Exception as e:
-            logger.warning(f"requests failed ({e}), trying curl.exe fallback")
-            data = _curl_get(url, self.headers, timeout)
-            if data is None:
-                raise RuntimeError(f"Both requests and curl failed for {url}")
-            return data
+            return future.result(timeout=None if deadline is None else max(0.0, deadline - time.monotonic()))
+        except FuturesTimeoutError:
+            future.cancel()
+            logger.warning(f"GitHub {label} fetch exceeded the analysis deadline")
+            return default
 
-    def _get_repo_info(self, owner: str, repo: str) -> Dict:
-        return self._get(f"{self.github_api_base}/{owner}/{repo}")
+    def _get(self, url: str, timeout: Optional[float] = 10, conditional: bool = False) -> dict:
+        """GET JSON via the shared pooled client (transient failures retried in-process)."""
+        return self.client.get_json(url, timeout=timeout, conditional=conditional)
 
-    def _fetch_recursive_tree(self, owner: str, repo: str, branch: str) -> Dict:
-        url = f"{self.github_api_base}/{owner}/{repo}/git/trees/{branch}?recursive=1"
+    def _get_repo_info(self, owner: str, repo: str, timeout: Optional[float] = None) -> Dict:
+        return self._get(f"{self.github_api_base}/{owner}/{repo}", timeout=timeout, conditional=True)
+
+    def _get_head_sha(self, owner: str, repo: str, ref: str, timeout: Optional[float] = None) -> Optional[str]:
+        """Commit SHA of ref (revalidated with ETag, so usually a free 304)."""
         try:
-            return self._get(url, timeout=15)
-        except Exception:
-            logger.warning("Recursive tree fetch failed, falling back")
-            return {"tree": []}
+            response = self.client.get(
+                f"{self.github_api_base}/{owner}/{repo}/commits/{ref}",
+                headers={"Accept": "application/vnd.github.sha"},
+                timeout=timeout,
+                conditional=True,
+            )
+            sha = response.text.strip() if response.status_code == 200 else ""
+            return sha if re.fullmatch(r"[0-9a-f]{40}", sha) else None
+        except Exception as e:
+            logger.warning(f"Could not resolve head commit: {e}")
+            return None
 
-    def _analyze_structure(self, files: List[Dict]) -> Dict:
-        paths = [f['path'] for f in files]
-        return {
-            "total_files": len([f for f in files if f['type'] == 'blob']),
-            "total_dirs": len([f for f in files if f['type'] == 'tree']),
-            "max_depth": max([p.count('/') for p in paths]) if paths else 0,
-            "languages": self._detect_languages(paths)
-        }
+    def _get_languages(self, owner: str, repo: str, timeout: Optional[float] = None) -> Dict[str, int]:
+        response = self.client.get(
+            f"{self.github_api_base}/{owner}/{repo}/languages", timeout=timeout, conditional=True
+        )
+        return response.json() if response.status_code == 200 else {}
 
-    def _detect_languages(self, paths: List[str]) -> Dict:
-        exts = {}
-        for p in paths:
-            if '.' in p:
-                ext = p.split('.')[-1]
-                exts[ext] = exts.get(ext, 0) + 1
-        return exts
+    def _get_commit_count(self, owner: str, repo: str, timeout: Optional[float] = None) -> int:
+        """Heuristic to get total commit count using Link header."""
+        try:
+            response = self.client.get(
+                f"{self.github_api_base}/{owner}/{repo}/commits?per_page=1", timeout=timeout, conditional=True
+            )
+            if response.status_code != 200:
+                return 0
 
-    def _analyze_components(self, files: List[Dict]) -> Dict:
-        paths = [f['path'].lower() for f in files if f['type'] == 'blob']
-        return {
-            "routes": [p for p in paths if 'route' in p or 'api' in p or 'controller' in p],
-            "services": [p for p in paths if 'service' in p or 'manager' in p],
-            "models": [p for p in paths if 'model' in p or 'schema' in p or 'entity' in p],
-            "tests": [p for p in paths if 'test' in p or '_test' in p],
-            "docs": [p for p in paths if p.endswith('.md') or 'docs/' in p]
-        }
+            if "Link" in response.headers:
+                # Format: <...page=123>; rel="last"
+                match = re.search(r'page=(\d+)>; rel="last"', response.headers["Link"])
+                if match:
+                    return int(match.group(1))
 
-    def _analyze_architecture(self, files: List[Dict]) -> Dict:
-        paths = [f['path'].lower() for f in files]
-        
-        # Check for layer separation (e.g., app/, domain/, infra/ or similar)
-        common_layers = {'api', 'service', 'model', 'repository', 'core', 'infra', 'domain', 'app'}
-        found_layers = set()
-        for p in paths:
-            parts = p.split('/')
-            if len(parts) > 1 and parts[0] in common_layers:
-                found_layers.add(parts[0])
-        
-        return {
-            "has_layers": len(found_layers) >= 3,
-            "layer_count": len(found_layers),
-            "found_layers": sorted(list(found_layers)),
-            "modular": any('/' in p for p in paths),
-            "interface_usage": any('interface' in p or 'abstract' in p for p in paths)
-        }
+            # If no link header, there's likely only 1 page
+            return len(response.json())
+        except Exception as e:
+            logger.warning(f"Could not fetch commit count: {e}")
+            return 0
 
-    def _analyze_quality(self, owner: str, repo: str, files: List[Dict]) -> Dict:
-        paths = [f['path'].lower() for f in files]
-        
-        # README analysis
-        readme_path = next((f['path'] for f in files if f['path'].lower().split('/')[-1].startswith('readme.md')), None)
-        readme_score = 0
-        if readme_path:
-            readme_score = 1  # Base score for exists
-            # Could fetch content to check length but tree API gives size
-            size = next((f['size'] for f in files if f['path'] == readme_path), 0)
-            if size > 1000: readme_score = 3
-            elif size > 500: readme_score = 2
-            
-        # Doc string heuristic (checking for doc/ or .md files)
-        doc_count = len([p for p in paths if p.endswith('.md')])
-        code_count = len([p for p in paths if p.endswith(('.py', '.js', '.ts', '.java', '.go'))])
-        
-        doc_density = doc_count / code_count if code_count > 0 else 0
-        
-        return {
-            "readme_score": readme_score,
-            "documentation_density": doc_density,
-            "naming_consistency": 0.8, # Placeholder for more complex logic
-            "has_license": any('license' in p for p in paths)
-        }
\ No newline at end of file
+    def _fetch_recursive_tree(self, owner: str, repo: str, ref: str, timeout: Optional[float] = 15) -> Optional[Dict]:
+        """Recursive tree for ref; None if the fetch failed (result is then not cached)."""
+        url = f"{self.github_api_base}/{owner}/{repo}/git/trees/{ref}?recursive=1"
+        try:
+            return self._get(url, timeout=timeout)
+        except Exception:
+            logger.warning("Recursive tree fetch failed, falling back")
+            return None
+
+    def _fetch_archive(self, owner: str, repo: str, ref: str, timeout: Optional[float] = 60) -> Optional[tuple]:
+        """Download the tarball once and scan it as a stream; None if it failed (tree fallback)."""
+        url = f"{self.github_api_base}/{owner}/{repo}/tarball/{ref}"
+        try:
+            response = self.client.get(url, timeout=timeout, stream=True)
+            try:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                return scan_tar_stream(response.raw)
+            finally:
+                response.close()
+        except Exception as e:
+            logger.warning(f"Archive analysis failed ({e}), falling back to tree API")
+            return None
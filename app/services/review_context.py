@@ -0,0 +1,102 @@
+"""
+Review Context
+Typed inputs of one review, carried from ReviewOrchestrator to the review
+engine as-is: submission text, repository URL, metrics and the snapshot
+they were derived from, extracted PDF text and the shared text features.
+Replaces embedding the metrics (as JSON) and PDF text in the task
+description behind '--- ... ---' markers and parsing them back out in the
+engine.
+
+from_task() still reads those markers, so tasks stored or submitted in the
+legacy format review the same way.
+
+It lives in the services layer because it carries service objects (the
+repository snapshot, text features); models and the engine interface only
+refer to it for type checking.
+"""
+import json
+import logging
+import uuid
+from datetime import datetime
+from functools import cached_property
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from ..models.schemas import Task
+from .repository_analyzer import RepositorySnapshot
+from .text_features import TextFeatures
+
+logger = logging.getLogger("review_context")
+
+METRICS_MARKER = "--- GitHub Repository Metrics ---"
+PDF_MARKER = "--- Extracted PDF Content ---"
+
+
+class ReviewContext(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    task_id: str = Field(default_factory=lambda: "orch-" + str(uuid.uuid4())[:8])
+    title: str
+    description: str = ""
+    submitted_by: str = "Anonymous"
+    timestamp: datetime = Field(default_factory=datetime.now)
+    github_url: Optional[str] = None
+    repo_metrics: Dict[str, Any] = Field(default_factory=dict)
+    pdf_text: str = ""
+    # Already-fetched repository; the engine derives its signals from it instead of refetching
+    repository: Optional[RepositorySnapshot] = Field(default=None, exclude=True)
+
+    @cached_property
+    def features(self) -> TextFeatures:
+        """Tokenization of title, description and PDF text, shared by the analyzers."""
+        return TextFeatures(self.title, self.description, self.pdf_text)
+
+    @classmethod
+    def from_task(cls, task: Task) -> "ReviewContext":
+        """Context of a stored/ad-hoc task, unpacking legacy description markers."""
+        description = task.task_description
+        repo_metrics: Dict[str, Any] = {}
+        pdf_text = task.pdf_extracted_text or ""
+
+        if PDF_MARKER in description:
+            description, embedded_pdf = description.split(PDF_MARKER, 1)
+            pdf_text = pdf_text or embedded_pdf.strip()
+
+        if METRICS_MARKER in description:
+            description, embedded_metrics = description.split(METRICS_MARKER, 1)
+            try:
+                repo_metrics = json.loads(embedded_metrics.strip())
+            except ValueError as e:
+                logger.warning(f"Failed to parse embedded repository metrics: {e}")
+
+        github_url = task.github_repo_link or repo_metrics.get("url")
+        if not github_url and repo_metrics.get("repo_name"):
+            github_url = f"https://github.com/{repo_metrics['repo_name']}"
+
+        return cls(
+            task_id=task.task_id,
+            title=task.task_title,
+            description=description.strip(),
+            submitted_by=task.submitted_by,
+            timestamp=task.timestamp,
+            github_url=github_url,
+            repo_metrics=repo_metrics,
+            pdf_text=pdf_text,
+        )
+
+    def to_task(self) -> Task:
+        """Legacy Task form (markers embedded) for engines that only accept task dicts."""
+        description = self.description
+        if self.repo_metrics:
+            description += f"\n\n{METRICS_MARKER}\n{json.dumps(self.repo_metrics, indent=2)}"
+        if self.pdf_text:
+            description += f"\n\n{PDF_MARKER}\n\n{self.pdf_text}"
+        return Task(
+            task_id=self.task_id,
+            task_title=self.title,
+            task_description=description,
+            submitted_by=self.submitted_by,
+            timestamp=self.timestamp,
+            github_repo_link=self.github_url,
+        )
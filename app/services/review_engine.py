@@ -4,6 +4,7 @@ Bridges the upgraded EvaluationEngine with the ReviewOutput schema.
 """
 from typing import Optional
 from ..models.schemas import Task, ReviewOutput, Analysis, Meta
+from .review_context import ReviewContext
 from ..core.interfaces.review_engine_interface import ReviewEngineInterface
 from .evaluation_engine import EvaluationEngine
 from .pdf_analyzer import PDFAnalyzer
@@ -17,46 +18,21 @@ class ReviewEngine(ReviewEngineInterface):
         self.evaluation_engine = EvaluationEngine()
 
     def evaluate(self, task: dict) -> dict:
-        task_obj = Task(**task)
-        result = self.review_task(task_obj)
-        return result.model_dump()
+        return self.review_task(Task(**task)).model_dump()
 
     def review_task(self, task: Task) -> ReviewOutput:
-        start_time = time.time()
-
-        # Clean description — strip legacy GitHub marker if present
-        description = task.task_description
-        github_url = None
-        clean_description = description
+        return self.review(ReviewContext.from_task(task))
 
-        if "--- GitHub Repository Metrics ---" in description:
-            try:
-                marker = "--- GitHub Repository Metrics ---"
-                parts = description.split(marker)
-                clean_description = parts[0].strip()
-                content = parts[1].strip()
-                import json
-                if "---" in content:
-                    content = content.split("---")[0].strip()
-                metrics = json.loads(content)
-                github_url = metrics.get('url')
-            except Exception as e:
-                logger.warning(f"Failed to extract GitHub URL from description: {e}")
-
-        # PDF text
-        pdf_text = getattr(task, 'pdf_extracted_text', "") or ""
-        if not pdf_text and "--- Extracted PDF Content ---" in description:
-            try:
-                pdf_text = description.split("--- Extracted PDF Content ---")[1].strip()
-            except:
-                pass
+    def review(self, context: ReviewContext) -> ReviewOutput:
+        start_time = time.time()
 
-        # Run evaluation
         eval_result = self.evaluation_engine.evaluate(
-            task_title=task.task_title,
-            task_description=clean_description,
-            repository_url=task.github_repo_link or github_url,
-            pdf_text=pdf_text
+            task_title=context.title,
+            task_description=context.description,
+            repository_url=context.github_url,
+            pdf_text=context.pdf_text,
+            features=context.features,
+            repository=context.repository
         )
 
         score = int(eval_result['score'])
@@ -2,13 +2,11 @@ from ..core.interfaces.review_engine_interface import ReviewEngineInterface
 from ..core.interfaces.next_task_interface import NextTaskGeneratorInterface
 from ..models.schemas import Task, ReviewOutput, Analysis, Meta, TaskCreate
 from ..models.orchestration import OrchestrationResult, V2NextTask
+from .review_context import ReviewContext
 from ..models.task_templates import SYSTEM_FALLBACK_TASK
 from .pdf_processor import PDFProcessor
 from .repo_analyzer import RepoAnalyzer
 import logging
-import uuid
-from datetime import datetime
-import json
 from fastapi import UploadFile, HTTPException
 
 logger = logging.getLogger("orchestrator")
@@ -90,9 +88,12 @@ class ReviewOrchestrator:
 
         # 3. GitHub Analysis (Fallback if fails)
         repo_metrics = {}
+        repository = None
         if github_url:
             try:
-                repo_metrics = self._repo_analyzer.analyze_repo(github_url)
+                # One snapshot serves both the metrics summary and the engine's repository signals
+                repository = self._repo_analyzer.snapshot(github_url)
+                repo_metrics = repository.metrics
                 logger.info(f"Repo Metrics Fetched: Commits={repo_metrics.get('commit_count')}, Files={repo_metrics.get('file_count')}, Tests={repo_metrics.get('has_tests')}")
             except HTTPException as e:
                 # 404 remains a rejection/not found, but others might fallback
@@ -103,33 +104,32 @@ class ReviewOrchestrator:
                 logger.warning(f"GitHub Analysis failed: {str(e)} - Falling back to deterministic zero-metrics logic")
                 repo_metrics = {}
 
-        # 4. Construct Combined Payload
-        # We follow the ReviewEngine's format: [Desc] \n\n --- [Marker] --- \n [Content]
-        final_description = description or ""
-        if repo_metrics:
-            final_description += f"\n\n--- GitHub Repository Metrics ---\n{json.dumps(repo_metrics, indent=2)}"
-        if extracted_text:
-            final_description += f"\n\n--- Extracted PDF Content ---\n\n{extracted_text}"
-
-        # 5. Create Task object for ReviewEngine
-        task = Task(
-            task_id="orch-" + str(uuid.uuid4())[:8],
-            task_title=f"Review: {github_url if github_url else 'Document Submission'}",
-            task_description=final_description,
+        # 4. Typed review context (no metrics/PDF round-trip through the description)
+        context = ReviewContext(
+            title=f"Review: {github_url if github_url else 'Document Submission'}",
+            description=description or "",
             submitted_by=submitted_by,
-            timestamp=datetime.now()
+            github_url=github_url,
+            repo_metrics=repo_metrics,
+            repository=repository,
+            pdf_text=extracted_text
         )
 
-        return self.process_submission(task)
+        return self.process_context(context)
 
     def process_submission(self, task: Task) -> OrchestrationResult:
+        """
+        Evaluate a stored or ad-hoc task and generate the next step.
+        """
+        return self.process_context(ReviewContext.from_task(task))
+
+    def process_context(self, context: ReviewContext) -> OrchestrationResult:
         """
         Core logic for evaluating a task and generating the next step.
         """
         try:
             # 1. Call ReviewEngine
-            review_result_dict = self._review_engine.evaluate(task.model_dump())
-            review_output = ReviewOutput(**review_result_dict)
+            review_output = self._review_engine.review(context)
             logger.info(f"Review Logic Result: Score={review_output.score}, Status={review_output.status}")
         except Exception as e:
             logger.error(f"ReviewEngine failed: {str(e)}", exc_info=True)
@@ -4,15 +4,17 @@ NO SCORING AUTHORITY - Signals support Assignment Authority decisions only
 
 This replaces evaluation_engine.py and scoring_engine.py as primary authorities
 """
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 import logging
 
 from .intent_extractor import IntentExtractor
-from .repository_analyzer import RepositoryAnalyzer
+from .repository_analyzer import RepositoryAnalyzer, RepositorySnapshot
 from .feature_matcher import FeatureMatcher
 from .pdf_analyzer import PDFAnalyzer
 from .title_analyzer import TitleAnalyzer
 from .description_analyzer import DescriptionAnalyzer
+from .text_features import TextFeatures
+from .stage_graph import StageGraph
 
 logger = logging.getLogger("signal_collector")
 
@@ -42,13 +44,18 @@ class SignalCollector:
         task_title: str, 
         task_description: str, 
         repository_url: Optional[str] = None,
-        pdf_text: str = ""
+        pdf_text: str = "",
+        repository: Union[RepositorySnapshot, Exception, None] = None
     ) -> Dict[str, Any]:
         """
         Collect supporting signals for Assignment Authority evaluation
         
         IMPORTANT: This method DOES NOT determine final scores or classifications.
         It only provides technical signals for Assignment Authority to consider.
+
+        repository, if given, is what the caller's pin() of repository_url
+        returned (the snapshot, or the lookup error); it is used instead of
+        fetching the repository again.
         
         Returns:nt
             Supporting signals dictionary (NOT evaluation result)
@@ -56,17 +63,47 @@ class SignalCollector:
         logger.info(f"[SIGNAL COLLECTOR] Collecting supporting signals for: {task_title[:50]}...")
         logger.warning("[SIGNAL COLLECTOR] NO SCORING AUTHORITY - Signals only")
         
+        # Tokenize title, description and PDF once for every analyzer
+        features = TextFeatures(task_title, task_description, pdf_text)
+
         # Step 1: Extract Requirements Intent
-        intent = self.intent_extractor.extract(task_title, task_description, pdf_text)
-        logger.info(f"[SIGNAL COLLECTOR] Extracted {len(intent.get('expected_features', []))} expected features")
+        def extract_intent():
+            intent = self.intent_extractor.extract(task_title, task_description, pdf_text, features)
+            logger.info(f"[SIGNAL COLLECTOR] Extracted {len(intent.get('expected_features', []))} expected features")
+            return intent
         
         # Step 2: Analyze Repository (if available)
-        repo_signals = self.repository_analyzer.analyze(repository_url) if repository_url else {}
+        def analyze_repository():
+            repo_signals = self.repository_analyzer.analyze(repository_url, snapshot=repository) if repository_url else {}
+
+            # FIX: handle None safely
+            if repo_signals is None:
+                logger.warning("[SIGNAL COLLECTOR] repo_signals is None — analyzer failed")
+                repo_signals = {}
+            return repo_signals
+        
+        # Step 3: Match Requirements to Implementation
+        def match_requirements(intent, repo_signals):
+            match_results = self.feature_matcher.compute_match(intent, repo_signals or {})
+            logger.info(f"[SIGNAL COLLECTOR] Feature match ratio: {match_results.get('feature_match_ratio', 0)}")
+            return match_results
+        
+        # Step 4: Analyze Individual Components (inline, while the repository is fetched)
+        graph = StageGraph("signal_collector")
+        graph.add("repository", analyze_repository, io=True)
+        graph.add("intent", extract_intent)
+        graph.add("match", match_requirements, deps=("intent", "repository"))
+        graph.add("title", lambda: self.title_analyzer.analyze(task_title, task_description, features))
+        graph.add("description", lambda: self.description_analyzer.analyze(task_description, features))
+        graph.add("pdf", lambda: self.pdf_analyzer.analyze_content(pdf_text, features))
+        stages, _ = graph.run()
 
-        # FIX: handle None safely
-        if repo_signals is None:
-            logger.warning("[SIGNAL COLLECTOR] repo_signals is None — analyzer failed")
-            repo_signals = {}
+        intent = stages["intent"]
+        repo_signals = stages["repository"]
+        match_results = stages["match"]
+        title_signals = stages["title"]
+        desc_signals = stages["description"]
+        pdf_signals = stages["pdf"]
 
         repo_available = bool(
             repo_signals and
@@ -75,15 +112,6 @@ class SignalCollector:
         )
         logger.info(f"[SIGNAL COLLECTOR] Repository available: {repo_available}")
         
-        # Step 3: Match Requirements to Implementation
-        match_results = self.feature_matcher.compute_match(intent, repo_signals or {})
-        logger.info(f"[SIGNAL COLLECTOR] Feature match ratio: {match_results.get('feature_match_ratio', 0)}")
-        
-        # Step 4: Analyze Individual Components
-        title_signals = self.title_analyzer.analyze(task_title, task_description)
-        desc_signals = self.description_analyzer.analyze(task_description)
-        pdf_signals = self.pdf_analyzer.analyze_content(pdf_text)
-        
         # Step 5: Package SUPPORTING SIGNALS (NO SCORING)
         supporting_signals = {
             # SIGNAL METADATA
@@ -0,0 +1,60 @@
+"""
+Single Flight - In-Flight Call Coalescing
+Concurrent calls with the same key share one execution: the first caller
+runs the function, later callers block until it finishes and receive a
+copy of its result (or its exception). Nothing is cached once the call
+completes; persistent caching is the job of repo_cache.
+"""
+import copy
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict
+
+
+class SingleFlight:
+    """Coalesces concurrent calls per key within this process"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, Future] = {}
+        self._coalesced = 0
+
+    def do(self, key: str, fn: Callable, *args, **kwargs) -> Any:
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            # Followers get their own copy so callers can mutate results freely
+            return copy.deepcopy(future.result())
+
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    @property
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+    @property
+    def coalesced(self) -> int:
+        """Number of calls that were served by another caller's execution"""
+        return self._coalesced
+
+
+# Global coalescer for repository analyses
+analysis_flights = SingleFlight()
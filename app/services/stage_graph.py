@@ -0,0 +1,148 @@
+"""
+Stage Graph - Dependency-Ordered Concurrent Pipeline Stages
+Runs the stages of an evaluation pipeline as a small DAG: each stage names
+the stages it depends on and starts as soon as they have finished.
+
+Network-bound stages (io=True) are submitted to a shared thread pool with
+the caller's context (so GitHub request priority carries over); CPU-bound
+stages run inline on the calling thread while those are in flight. A review
+therefore takes roughly as long as its slowest network stage plus whatever
+CPU work depends on it, instead of the sum of all stages.
+
+Every run records per-stage wall time; stage_metrics aggregates them for
+/system/info.
+
+Configuration (environment):
+    EVAL_STAGE_WORKERS  - thread pool size for network stages (default 8)
+"""
+import os
+import time
+import logging
+import threading
+import contextvars
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger("stage_graph")
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=int(os.getenv("EVAL_STAGE_WORKERS", "8")),
+                thread_name_prefix="eval-stage",
+            )
+        return _executor
+
+
+class Stage:
+    """One pipeline step: fn receives the results of its dependencies by name"""
+
+    def __init__(self, name: str, fn: Callable[..., Any], deps: Sequence[str] = (), io: bool = False):
+        self.name = name
+        self.fn = fn
+        self.deps = tuple(deps)
+        self.io = io
+
+
+class StageMetrics:
+    """Per-stage run counts and timings across all graph runs"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stages: Dict[str, Dict[str, float]] = {}
+
+    def record(self, graph: str, timings: Dict[str, float]):
+        with self._lock:
+            for stage, ms in timings.items():
+                entry = self._stages.setdefault(f"{graph}.{stage}", {"runs": 0, "total_ms": 0.0, "max_ms": 0.0})
+                entry["runs"] += 1
+                entry["total_ms"] += ms
+                entry["max_ms"] = max(entry["max_ms"], ms)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {
+                name: {
+                    "runs": int(e["runs"]),
+                    "avg_ms": round(e["total_ms"] / e["runs"], 2),
+                    "max_ms": round(e["max_ms"], 2),
+                }
+                for name, e in sorted(self._stages.items())
+            }
+
+
+class StageGraph:
+    """Declare stages with add(), then run() them in dependency order"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.stages: Dict[str, Stage] = {}
+
+    def add(self, name: str, fn: Callable[..., Any], deps: Sequence[str] = (), io: bool = False) -> "StageGraph":
+        if name in self.stages:
+            raise ValueError(f"Duplicate stage: {name}")
+        missing = [d for d in deps if d not in self.stages]
+        if missing:
+            # Dependencies must be declared first, which also rules out cycles
+            raise ValueError(f"Stage {name} depends on undeclared stages: {missing}")
+        self.stages[name] = Stage(name, fn, deps, io)
+        return self
+
+    def _timed(self, stage: Stage, results: Dict[str, Any]) -> Tuple[Any, float]:
+        start = time.perf_counter()
+        value = stage.fn(*[results[d] for d in stage.deps])
+        return value, (time.perf_counter() - start) * 1000
+
+    def run(self) -> Tuple[Dict[str, Any], Dict[str, float]]:
+        """
+        Execute every stage; returns (results by stage name, wall ms by stage).
+        The first stage exception is re-raised once in-flight stages finish.
+        """
+        results: Dict[str, Any] = {}
+        timings: Dict[str, float] = {}
+        pending = list(self.stages.values())
+        running: Dict[Future, Stage] = {}
+
+        def ready() -> List[Stage]:
+            return [s for s in pending if all(d in results for d in s.deps)]
+
+        try:
+            while pending or running:
+                for stage in [s for s in ready() if s.io]:
+                    pending.remove(stage)
+                    context = contextvars.copy_context()
+                    running[_get_executor().submit(context.run, self._timed, stage, results)] = stage
+
+                inline = [s for s in ready() if not s.io]
+                if inline:
+                    stage = inline[0]
+                    pending.remove(stage)
+                    results[stage.name], timings[stage.name] = self._timed(stage, results)
+                    continue
+
+                if not running:
+                    break
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage = running.pop(future)
+                    results[stage.name], timings[stage.name] = future.result()
+        finally:
+            if running:
+                wait(list(running))
+
+        stage_metrics.record(self.name, timings)
+        logger.info(
+            f"[{self.name}] stage timings (ms): "
+            + ", ".join(f"{name}={ms:.1f}" for name, ms in timings.items())
+        )
+        return results, timings
+
+
+# Global stage timing aggregate
+stage_metrics = StageMetrics()
@@ -0,0 +1,102 @@
+"""
+Text Features - Shared Tokenization for Submission Analyzers
+Lowercasing, word tokenization, sentence/line splitting, headers and code
+block spans of the title, description and PDF text, computed once per
+submission and passed to TitleAnalyzer, DescriptionAnalyzer,
+IntentExtractor and PDFAnalyzer instead of each re-deriving them.
+
+Every feature is computed lazily on first access and then reused, so an
+analyzer that never asks for, say, PDF sentences does not pay for them.
+"""
+import re
+from functools import cached_property
+from typing import List, Set, Tuple
+
+WORD_PATTERN = re.compile(r'\b\w+\b')
+SENTENCE_SPLIT_PATTERN = re.compile(r'[.!?]+')
+NUMBERED_ITEM_PATTERN = re.compile(r'^\s*\d+\.', re.MULTILINE)
+CODE_BLOCK_PATTERN = re.compile(r'```[\s\S]*?```|`[^`]+`')
+
+
+class TextBlock:
+    """Derived views of one piece of submission text"""
+
+    def __init__(self, text: str):
+        self.text = text or ""
+
+    @cached_property
+    def lower(self) -> str:
+        return self.text.lower()
+
+    @cached_property
+    def words(self) -> List[str]:
+        """\\b\\w+\\b tokens of the lowercased text, in order."""
+        return WORD_PATTERN.findall(self.lower)
+
+    @cached_property
+    def word_set(self) -> Set[str]:
+        return set(self.words)
+
+    @cached_property
+    def split_words(self) -> List[str]:
+        """Whitespace-separated words of the lowercased text."""
+        return self.lower.split()
+
+    @cached_property
+    def sentences(self) -> List[str]:
+        return SENTENCE_SPLIT_PATTERN.split(self.text)
+
+    @cached_property
+    def sentence_count(self) -> int:
+        return len([s for s in self.sentences if s.strip()])
+
+    @cached_property
+    def lines(self) -> List[str]:
+        return self.text.split('\n')
+
+    @cached_property
+    def section_headers(self) -> int:
+        """Markdown headers and ALL CAPS lines longer than five characters."""
+        count = 0
+        for line in self.lines:
+            line = line.strip()
+            if line.startswith('#') or (line.isupper() and len(line) > 5):
+                count += 1
+        return count
+
+    @cached_property
+    def numbered_items(self) -> int:
+        """Lines starting with '1.', '2.' etc."""
+        return len(NUMBERED_ITEM_PATTERN.findall(self.text))
+
+    @cached_property
+    def code_block_spans(self) -> List[Tuple[int, int]]:
+        """Fenced (```) and inline (`) code spans."""
+        return [m.span() for m in CODE_BLOCK_PATTERN.finditer(self.text)]
+
+
+class TextFeatures:
+    """Text features of one submission (title, description, PDF text)"""
+
+    def __init__(self, title: str, description: str, pdf_text: str = ""):
+        self.title = TextBlock(title)
+        self.description = TextBlock(description)
+        self.pdf = TextBlock(pdf_text)
+
+    @property
+    def blocks(self) -> Tuple[TextBlock, TextBlock, TextBlock]:
+        return (self.title, self.description, self.pdf)
+
+    @cached_property
+    def combined_lower(self) -> str:
+        """Lowercased "title description pdf_text", as IntentExtractor scans it."""
+        return " ".join(block.lower for block in self.blocks)
+
+    @cached_property
+    def combined_tokens(self) -> Set[str]:
+        # The joining spaces are word boundaries, so the parts' tokens are the whole's
+        return self.title.word_set | self.description.word_set | self.pdf.word_set
+
+    @cached_property
+    def combined_words(self) -> List[str]:
+        return self.title.split_words + self.description.split_words + self.pdf.split_words
@@ -2,10 +2,11 @@
 Title Analyzer - Dynamic Scoring Module
 Analyzes title quality based on measurable signals
 """
-import re
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Set
 import logging
 
+from .text_features import TextFeatures
+
 logger = logging.getLogger("title_analyzer")
 
 class TitleAnalyzer:
@@ -20,9 +21,12 @@ class TitleAnalyzer:
             'client', 'web', 'mobile', 'ios', 'android', 'cloud', 'aws', 'azure', 'gcp'
         }
     
-    def analyze(self, title: str, description: str) -> Dict[str, Any]:
+    def analyze(self, title: str, description: str, features: Optional[TextFeatures] = None) -> Dict[str, Any]:
         """Analyze title and return dynamic metrics"""
-        words = title.lower().split()
+        features = features or TextFeatures(title, description)
+        words = features.title.split_words
+        title_words = features.title.word_set
+        desc_words = features.description.word_set
         word_count = len(words)
         
         # Calculate metrics
@@ -38,7 +42,7 @@ class TitleAnalyzer:
         # Score by absolute count (capped at 4), not ratio — avoids penalising longer titles
         tech_keyword_score = min(len(technical_keywords_found) / 4, 1.0)
         duplicate_penalty = self._calculate_duplicate_penalty(words)
-        alignment_score = self._calculate_alignment_score(title, description)
+        alignment_score = self._calculate_alignment_score(title_words, desc_words)
         
         # Dynamic title score formula
         title_score = 20 * (
@@ -63,7 +67,7 @@ class TitleAnalyzer:
             'signals': {
                 'technical_terms_found': technical_keywords_found,
                 'duplicate_words': self._get_duplicate_words(words),
-                'shared_keywords': self._get_shared_keywords(title, description)
+                'shared_keywords': self._get_shared_keywords(title_words, desc_words)
             }
         }
     
@@ -82,11 +86,8 @@ class TitleAnalyzer:
         repeated_count = len(words) - len(unique_words)
         return repeated_count / len(words)
     
-    def _calculate_alignment_score(self, title: str, description: str) -> float:
+    def _calculate_alignment_score(self, title_words: Set[str], desc_words: Set[str]) -> float:
         """Calculate alignment between title and description keywords"""
-        title_words = set(re.findall(r'\b\w+\b', title.lower()))
-        desc_words = set(re.findall(r'\b\w+\b', description.lower()))
-        
         if not title_words:
             return 0.0
         
@@ -107,8 +108,6 @@ class TitleAnalyzer:
             seen.add(word)
         return duplicates
     
-    def _get_shared_keywords(self, title: str, description: str) -> List[str]:
+    def _get_shared_keywords(self, title_words: Set[str], desc_words: Set[str]) -> List[str]:
         """Get keywords shared between title and description"""
-        title_words = set(re.findall(r'\b\w+\b', title.lower()))
-        desc_words = set(re.findall(r'\b\w+\b', description.lower()))
         return list(title_words.intersection(desc_words))
\ No newline at end of file
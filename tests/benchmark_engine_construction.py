@@ -0,0 +1,50 @@
+"""
+Engine Construction Benchmark
+
+Per-request cost of the review dependencies: building ReviewEngine,
+SequentialTaskGenerator and ReviewOrchestrator for every request (the
+previous providers) versus resolving the application-scoped instances.
+
+Usage: python tests/benchmark_engine_construction.py [requests]   (default 2000)
+"""
+import sys
+import os
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from app.core.dependencies import engines, get_next_task_generator, get_review_engine, get_review_orchestrator
+from app.services.review_engine import ReviewEngine
+from app.services.review_orchestrator import ReviewOrchestrator
+from app.services.sequential_task_generator import SequentialTaskGenerator
+
+
+def per_request():
+    return ReviewOrchestrator(ReviewEngine(), SequentialTaskGenerator())
+
+
+def application_scoped():
+    return get_review_orchestrator(get_review_engine(), get_next_task_generator())
+
+
+def _per_call_us(fn, requests):
+    start = time.perf_counter()
+    for _ in range(requests):
+        fn()
+    return (time.perf_counter() - start) / requests * 1e6
+
+
+def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    engines.startup()
+    constructed = _per_call_us(per_request, requests)
+    shared = _per_call_us(application_scoped, requests)
+    print(f"{'providers':>20} {'us/request':>12}")
+    print(f"{'per-request':>20} {constructed:>12.1f}")
+    print(f"{'application-scoped':>20} {shared:>12.2f}")
+    print(f"saved {constructed - shared:.1f} us per request ({constructed / shared:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
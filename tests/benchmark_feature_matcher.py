@@ -0,0 +1,67 @@
+"""
+Feature Matcher Benchmark
+
+Cold-path cost of compute_match (new repository or commit, nothing reused):
+the previous per-path scan (a lower() per path and term) against the
+NUL-joined PathText, on synthetic path lists with ten expected features,
+and checks both find the same features.
+
+Usage: python tests/benchmark_feature_matcher.py [sizes...]   (default 10000 100000)
+"""
+import sys
+import os
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+sys.path.insert(0, os.path.join(BASE_DIR, "tests"))
+
+from app.services.feature_matcher import FeatureMatcher
+from benchmark_path_classifier import synthetic_tree
+
+# Mix of features found directly, through synonyms, and not at all
+FEATURES = ["api", "auth", "database", "frontend", "docker", "test", "dashboard",
+            "payment", "billing", "notification"]
+
+
+def legacy_match(matcher: FeatureMatcher, paths: list) -> list:
+    """The per-path substring scan compute_match used before (reference output)."""
+    implemented = []
+    for feature in FEATURES:
+        is_found = any(feature.lower() in p.lower() for p in paths)
+        if not is_found:
+            synonyms = matcher.feature_file_patterns.get(feature.lower(), [])
+            is_found = any(syn in p.lower() for p in paths for syn in synonyms)
+        if is_found:
+            implemented.append(feature)
+    return implemented
+
+
+def current_match(matcher: FeatureMatcher, paths: list) -> list:
+    signals = {"components": {"paths": paths}}
+    return matcher.compute_match({"expected_features": FEATURES}, signals)["implemented_features"]
+
+
+def _best_of(fn, matcher, paths, repeats):
+    best, result = float("inf"), None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn(matcher, paths)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [10_000, 100_000]
+    matcher = FeatureMatcher()
+    print(f"{'paths':>10} {'legacy ms':>11} {'joined ms':>11} {'speedup':>8}")
+    for size in sizes:
+        paths = [f["path"] for f in synthetic_tree(size)]
+        legacy_s, expected = _best_of(legacy_match, matcher, paths, 5)
+        joined_s, actual = _best_of(current_match, matcher, paths, 5)
+        assert actual == expected, f"feature mismatch at {size} paths"
+        print(f"{size:>10} {legacy_s * 1000:>11.1f} {joined_s * 1000:>11.1f} {legacy_s / joined_s:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
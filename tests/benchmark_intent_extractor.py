@@ -0,0 +1,121 @@
+"""
+Intent Extractor Benchmark
+
+Compares the token-set IntentExtractor.extract against the previous
+implementation (one regex search per keyword plus one findall per module
+pattern) on synthetic task texts, and checks both produce identical intents.
+
+Usage: python tests/benchmark_intent_extractor.py [chars...]   (default 10000 100000 1000000)
+"""
+import sys
+import os
+import random
+import re
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from app.services.intent_extractor import IntentExtractor
+
+WORDS = [
+    "the", "build", "a", "user", "auth", "service", "module", "system", "layer", "engine",
+    "api", "endpoint", "with", "fastapi", "react", "docker", "python", "go", "payment",
+    "review", "scoring", "pipeline", "microservice", "distributed", "clean", "architecture",
+    "model-view-controller", "hexagonal", "modules", "systemic", "servicing", "data", "UI",
+    "postgresql", "notification", "engineering", "layered", "and", "of", "to", "tests",
+]
+SEPARATORS = [" ", " ", " ", "  ", "\n", ", ", ". ", "-", "\t", "_"]
+
+
+def synthetic_text(chars: int, seed: int = 11) -> str:
+    """Deterministic prose-like text of roughly the given length."""
+    rng = random.Random(seed)
+    parts = []
+    size = 0
+    while size < chars:
+        part = rng.choice(WORDS) + rng.choice(SEPARATORS)
+        parts.append(part)
+        size += len(part)
+    return "".join(parts)[:chars]
+
+
+def legacy_extract(title: str, description: str, pdf_text: str = "") -> dict:
+    """The per-keyword regex implementation extract replaced (reference output)."""
+    feature_keywords = IntentExtractor().feature_keywords
+    objective = title.strip()
+    combined_text = (title + " " + description + " " + pdf_text).lower()
+    found_features = set()
+    for keyword in feature_keywords:
+        if re.search(r'\b' + re.escape(keyword) + r'\b', combined_text):
+            found_features.add(keyword)
+
+    tech_keywords = {
+        'python', 'javascript', 'typescript', 'fastapi', 'flask', 'django',
+        'react', 'vue', 'angular', 'node', 'express', 'postgresql', 'sql',
+        'mongodb', 'nosql', 'docker', 'kubernetes', 'aws', 'azure', 'gcp', 'java', 'go', 'rust'
+    }
+    expected_stack = [tech for tech in tech_keywords if re.search(r'\b' + re.escape(tech) + r'\b', combined_text)]
+
+    arch_patterns = {
+        'mvc': r'\bmvc\b|\bmodel-view-controller\b',
+        'microservices': r'\bmicroservice\b|\bmicroservices\b',
+        'layered': r'\blayered\b|\btiered\b|\bseparation\b',
+        'clean': r'\bclean architecture\b|\bhexagonal\b'
+    }
+    expected_arch = "Standard"
+    for arch, pattern in arch_patterns.items():
+        if re.search(pattern, combined_text):
+            expected_arch = arch
+            break
+
+    modules = []
+    for pattern in [r'(\w+)\s+module', r'(\w+)\s+system', r'(\w+)\s+service', r'(\w+)\s+layer', r'(\w+)\s+engine']:
+        for match in re.findall(pattern, combined_text):
+            if len(match) > 3:
+                modules.append(match)
+
+    words = combined_text.split()
+    complex_keywords = {'microservice', 'distributed', 'orchestration', 'asynchronous', 'concurrency', 'optimization'}
+    complex_count = sum(1 for w in words if w in complex_keywords)
+    if len(words) > 1000 or complex_count > 3:
+        complexity = "high"
+    elif len(words) > 300 or complex_count > 0:
+        complexity = "medium"
+    else:
+        complexity = "low"
+
+    return {
+        "task_objective": objective,
+        "expected_features": sorted(list(found_features)),
+        "expected_modules": sorted(list(set(modules))),
+        "expected_tech_stack": sorted(list(set(expected_stack))),
+        "expected_architecture": expected_arch,
+        "expected_complexity": complexity
+    }
+
+
+def _best_of(fn, args, repeats):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+    extractor = IntentExtractor()
+    print(f"{'chars':>10} {'legacy ms':>11} {'token-set ms':>13} {'speedup':>8}")
+    for size in sizes:
+        args = ("Build a review engine", synthetic_text(size // 10, seed=1), synthetic_text(size))
+        repeats = 5 if size <= 100_000 else 2
+        legacy_s, expected = _best_of(legacy_extract, args, repeats)
+        new_s, actual = _best_of(extractor.extract, args, repeats)
+        assert actual == expected, f"intent mismatch at {size} chars"
+        print(f"{size:>10} {legacy_s * 1000:>11.1f} {new_s * 1000:>13.1f} {legacy_s / new_s:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
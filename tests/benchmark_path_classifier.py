@@ -0,0 +1,129 @@
+"""
+Path Classifier Benchmark
+
+Compares the single-pass classify_tree against the previous per-signal
+implementation (one rescan of the tree per signal) on synthetic
+git/trees-shaped listings, and checks both produce identical signals.
+
+Usage: python tests/benchmark_path_classifier.py [sizes...]   (default 10000 100000 1000000)
+"""
+import sys
+import os
+import random
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from app.services.path_classifier import classify_tree
+
+TOP_DIRS = ["app", "api", "core", "src", "domain", "infra", "lib", "docs", "tests", "scripts", "Services"]
+SUB_DIRS = ["models", "routes", "service", "controllers", "utils", "schemas", "handlers",
+            "interfaces", "managers", "entity", "abstract", "v1", "internal", "Docs"]
+STEMS = ["user", "order", "payment", "auth", "api_client", "test_user", "model_base",
+         "config", "manager", "route_table", "schema", "index", "main", "helpers"]
+EXTENSIONS = ["py", "js", "ts", "java", "go", "md", "json", "yml", "txt", "PY", "MD"]
+
+
+def synthetic_tree(entries: int, seed: int = 7) -> list:
+    """Deterministic tree listing with roughly one directory per eight files."""
+    rng = random.Random(seed)
+    files = [
+        {"path": "README.md", "type": "blob", "size": 1500},
+        {"path": "LICENSE", "type": "blob", "size": 1000},
+    ]
+    dirs = set()
+    while len(files) + len(dirs) < entries:
+        depth = rng.randint(0, 5)
+        parts = [rng.choice(TOP_DIRS)] + [rng.choice(SUB_DIRS) for _ in range(depth)]
+        directory = "/".join(parts)
+        for i in range(1, len(parts) + 1):
+            prefix = "/".join(parts[:i])
+            if prefix not in dirs:
+                dirs.add(prefix)
+                files.append({"path": prefix, "type": "tree"})
+        name = f"{rng.choice(STEMS)}{rng.randint(0, 999)}.{rng.choice(EXTENSIONS)}"
+        files.append({"path": f"{directory}/{name}", "type": "blob", "size": rng.randint(0, 5000)})
+    return files[:entries]
+
+
+def legacy_signals(files: list) -> dict:
+    """The per-signal implementation classify_tree replaced (reference output)."""
+    paths = [f['path'] for f in files]
+    exts = {}
+    for p in paths:
+        if '.' in p:
+            ext = p.split('.')[-1]
+            exts[ext] = exts.get(ext, 0) + 1
+    structure = {
+        "total_files": len([f for f in files if f['type'] == 'blob']),
+        "total_dirs": len([f for f in files if f['type'] == 'tree']),
+        "max_depth": max([p.count('/') for p in paths]) if paths else 0,
+        "languages": exts,
+    }
+
+    blob_paths = [f['path'].lower() for f in files if f['type'] == 'blob']
+    components = {
+        "routes": [p for p in blob_paths if 'route' in p or 'api' in p or 'controller' in p],
+        "services": [p for p in blob_paths if 'service' in p or 'manager' in p],
+        "models": [p for p in blob_paths if 'model' in p or 'schema' in p or 'entity' in p],
+        "tests": [p for p in blob_paths if 'test' in p or '_test' in p],
+        "docs": [p for p in blob_paths if p.endswith('.md') or 'docs/' in p],
+    }
+
+    lower_paths = [f['path'].lower() for f in files]
+    common_layers = {'api', 'service', 'model', 'repository', 'core', 'infra', 'domain', 'app'}
+    found_layers = set()
+    for p in lower_paths:
+        parts = p.split('/')
+        if len(parts) > 1 and parts[0] in common_layers:
+            found_layers.add(parts[0])
+    architecture = {
+        "has_layers": len(found_layers) >= 3,
+        "layer_count": len(found_layers),
+        "found_layers": sorted(list(found_layers)),
+        "modular": any('/' in p for p in lower_paths),
+        "interface_usage": any('interface' in p or 'abstract' in p for p in lower_paths),
+    }
+
+    readme_path = next((f['path'] for f in files if f['path'].lower().split('/')[-1].startswith('readme.md')), None)
+    readme_score = 0
+    if readme_path:
+        readme_score = 1
+        size = next((f['size'] for f in files if f['path'] == readme_path), 0)
+        if size > 1000: readme_score = 3
+        elif size > 500: readme_score = 2
+    doc_count = len([p for p in lower_paths if p.endswith('.md')])
+    code_count = len([p for p in lower_paths if p.endswith(('.py', '.js', '.ts', '.java', '.go'))])
+    quality = {
+        "readme_score": readme_score,
+        "documentation_density": doc_count / code_count if code_count > 0 else 0,
+        "naming_consistency": 0.8,
+        "has_license": any('license' in p for p in lower_paths),
+    }
+    return {"structure": structure, "components": components, "architecture": architecture, "quality": quality}
+
+
+def _best_of(fn, files, repeats):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn(files)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+    print(f"{'entries':>10} {'legacy ms':>11} {'single-pass ms':>15} {'speedup':>8}")
+    for size in sizes:
+        files = synthetic_tree(size)
+        repeats = 5 if size <= 100_000 else 2
+        legacy_s, expected = _best_of(legacy_signals, files, repeats)
+        single_s, actual = _best_of(classify_tree, files, repeats)
+        assert actual == expected, f"signal mismatch at {size} entries"
+        print(f"{size:>10} {legacy_s * 1000:>11.1f} {single_s * 1000:>15.1f} {legacy_s / single_s:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Sarathi Signing Benchmark
+
+Compares authority token issue/verify throughput for RS256, ES256 and EdDSA.
+Keys are generated in a temporary directory; the real keys/ directory is not touched.
+Verification is timed without the replay store so only signature cost is measured.
+
+Usage: python tests/benchmark_sarathi_signing.py [iterations]
+"""
+import sys
+import os
+import time
+import tempfile
+import logging
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from app.sarathi.authority import sarathi_authority
+from app.sarathi.key_manager import sarathi_keys, SarathiKeyManager, KEY_FILE_PREFIXES
+
+logging.disable(logging.CRITICAL)
+
+
+def bench(algorithm: str, iterations: int) -> dict:
+    os.environ["SARATHI_ALGORITHM"] = algorithm
+    sarathi_keys.reload_keys()
+
+    start = time.perf_counter()
+    tokens = [sarathi_authority.issue_token(ttl_seconds=300) for _ in range(iterations)]
+    issue_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for token in tokens:
+        sarathi_authority._decode(token)
+    verify_s = time.perf_counter() - start
+
+    return {
+        "algorithm": algorithm,
+        "issue_per_s": iterations / issue_s,
+        "verify_per_s": iterations / verify_s,
+        "token_bytes": len(tokens[0]),
+    }
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    original_algorithm = os.environ.get("SARATHI_ALGORITHM")
+    original_key_dir = SarathiKeyManager._key_dir
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        SarathiKeyManager._key_dir = lambda self: tmp
+        try:
+            for algorithm in KEY_FILE_PREFIXES:
+                results.append(bench(algorithm, iterations))
+        finally:
+            SarathiKeyManager._key_dir = original_key_dir
+            if original_algorithm is None:
+                os.environ.pop("SARATHI_ALGORITHM", None)
+            else:
+                os.environ["SARATHI_ALGORITHM"] = original_algorithm
+            sarathi_keys.reload_keys()
+
+    baseline = next(r for r in results if r["algorithm"] == "RS256")
+    print(f"Sarathi signing benchmark ({iterations} tokens)")
+    print(f"{'algorithm':<10}{'issue/s':>12}{'verify/s':>12}{'issue x':>10}{'verify x':>10}{'bytes':>8}")
+    for r in results:
+        print(
+            f"{r['algorithm']:<10}{r['issue_per_s']:>12.0f}{r['verify_per_s']:>12.0f}"
+            f"{r['issue_per_s'] / baseline['issue_per_s']:>10.1f}"
+            f"{r['verify_per_s'] / baseline['verify_per_s']:>10.1f}"
+            f"{r['token_bytes']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
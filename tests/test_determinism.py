@@ -4,6 +4,8 @@ import io
 from fastapi.testclient import TestClient
 from app.main import app
 from unittest.mock import patch, MagicMock
+from app.services.path_classifier import classify_tree
+from app.services.repository_analyzer import RepositorySnapshot, summarize_tree
 
 client = TestClient(app)
 
@@ -13,24 +15,34 @@ def test_repeated_call_determinism():
     the exact same score, status, and analysis breakdown.
     """
     
-    # Setup consistent mock for GitHub API calls
-    mock_metrics = {
+    # Setup one consistent repository snapshot in place of the GitHub fetches
+    repo_info = {
+        "name": "repo",
         "full_name": "test/repo",
         "default_branch": "main",
-        "commit_count": 50,
-        "has_readme": True,
-        "has_tests": True,
-        "file_count": 100,
+        "language": "Python",
         "stargazers_count": 10,
         "forks_count": 5,
+        "size": 120,
         "private": False,
         "updated_at": "2026-02-14T12:00:00Z"
     }
+    files = [{"path": "README.md", "type": "blob"}, {"path": "tests", "type": "tree"}, {"path": "tests/test_app.py", "type": "blob"}]
+    files += [{"path": f"app/module_{i}.py", "type": "blob"} for i in range(98)]
+
+    def mock_snapshot(url):
+        return RepositorySnapshot(
+            url, "tree", repo_info, "a" * 40,
+            derived={"signals": classify_tree(files), "summary": summarize_tree(files)},
+            languages={"Python": 1000},
+            commit_count=50,
+        )
 
     # Consistent PDF content
     pdf_content = b"%PDF-1.4\n1 0 obj\n<< /Type /Catalog /Pages 2 0 R >>\nendobj\n..." # Mock binary
     
-    with patch("app.services.repo_analyzer.RepoAnalyzer.analyze_repo", return_value=mock_metrics), \
+    with patch("app.services.repo_analyzer.RepoAnalyzer.snapshot", side_effect=mock_snapshot), \
+         patch("app.services.github_client.github_client.get", side_effect=AssertionError("GitHub must not be called")) as github_get, \
          patch("app.services.pdf_processor.PDFProcessor.extract_text", return_value="Objective: High quality project document.\nStructured Heading\n" + "Word " * 100):
         
         results = []
@@ -50,6 +62,8 @@ def test_repeated_call_determinism():
             assert response.status_code == 200
             results.append(response.json())
 
+        github_get.assert_not_called()
+
         # Validate that all results are identical
         first_res = results[0]
         for i, res in enumerate(results[1:], start=1):
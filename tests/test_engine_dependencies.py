@@ -0,0 +1,73 @@
+"""
+Engine Dependency Tests
+
+Review engines are built once per application, shared across threads and
+requests, and swapped as a set by reload().
+"""
+import sys
+import os
+import threading
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from app.core import dependencies
+from app.core.dependencies import (
+    EngineContainer, get_next_task_generator, get_review_engine, get_review_orchestrator,
+)
+from app.core.engine_registry import EngineRegistry
+from app.services.review_engine import ReviewEngine
+
+
+def _resolve():
+    return get_review_orchestrator(get_review_engine(), get_next_task_generator())
+
+
+def test_providers_return_shared_instances():
+    assert get_review_engine() is get_review_engine()
+    assert get_next_task_generator() is get_next_task_generator()
+    assert _resolve() is _resolve()
+    assert EngineRegistry.get_engine() is get_review_engine()
+
+
+def test_concurrent_first_use_builds_once(monkeypatch):
+    container = EngineContainer()
+    builds = []
+    build = container._build
+    monkeypatch.setattr(container, "_build", lambda: builds.append(1) or build())
+    barrier = threading.Barrier(16)
+    seen = []
+
+    def worker():
+        barrier.wait()
+        seen.append(container.get())
+
+    threads = [threading.Thread(target=worker) for _ in range(16)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(builds) == 1
+    assert all(engines is seen[0] for engines in seen)
+
+
+def test_reload_swaps_the_whole_set(monkeypatch):
+    container = EngineContainer()
+    monkeypatch.setattr(dependencies, "engines", container)
+    before = _resolve()
+    first = container.get()
+
+    reloaded = container.reload()
+
+    assert reloaded.generation == first.generation + 1
+    assert reloaded.review_engine is not first.review_engine
+    assert _resolve() is reloaded.review_orchestrator is not before
+    assert before._review_engine is first.review_engine  # in-flight users keep the old set
+
+
+def test_overridden_engine_gets_its_own_orchestrator():
+    custom = ReviewEngine()
+    orchestrator = get_review_orchestrator(custom, get_next_task_generator())
+    assert orchestrator is not _resolve()
+    assert orchestrator._review_engine is custom
@@ -0,0 +1,314 @@
+"""
+Evaluation Cache Tests
+
+Identical submissions at the same repository head commit are served from
+the content-addressed cache without rerunning the pipeline; an edited
+input, a new commit or an engine version bump is a miss.
+"""
+import sys
+import os
+from collections import Counter
+from datetime import datetime
+
+import pytest
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+sys.path.insert(0, os.path.join(BASE_DIR, "tests"))
+
+from app.services.evaluation_cache import EvaluationCache, evaluation_key
+from app.services import evaluation_engine as evaluation_engine_module
+from app.services.evaluation_engine import EvaluationEngine
+from app.services.final_convergence import FinalConvergenceOrchestrator
+from app.services import final_convergence as final_convergence_module
+from test_repo_cache import SHA_1, SHA_2, _client
+
+REPO = "https://github.com/octo/demo"
+TITLE = "Build a review API service with FastAPI"
+DESCRIPTION = "Implement an API endpoint, a scoring service and unit tests. Use Python and Docker."
+
+
+@pytest.fixture
+def engine(tmp_path):
+    client, repo_cache, fake = _client(tmp_path)
+    engine = EvaluationEngine()
+    engine.repository_analyzer.client = client
+    engine.repository_analyzer.cache = repo_cache
+    engine.cache = EvaluationCache(path=str(tmp_path / "evaluations.db"), ttl_seconds=3600, max_entries=50)
+    engine.stage_cache = EvaluationCache(path=str(tmp_path / "evaluations.db"), table="stages")
+    runs = []
+    pipeline = engine._evaluate
+    engine._evaluate = lambda *args: runs.append(args) or pipeline(*args)
+    return engine, fake, runs
+
+
+def test_resubmission_is_served_from_cache(engine):
+    engine, fake, runs = engine
+    first = engine.evaluate(TITLE, DESCRIPTION, REPO, "pdf text")
+    second = engine.evaluate(TITLE, DESCRIPTION, REPO, "pdf text")
+
+    assert second == first
+    assert len(runs) == 1
+    assert fake.tree_calls() == 1
+    stats = engine.cache.stats()
+    assert stats["hits"] == 1 and stats["entries"] == 1
+
+
+def test_changed_inputs_or_commit_miss(engine):
+    engine, fake, runs = engine
+    engine.evaluate(TITLE, DESCRIPTION, REPO)
+    engine.evaluate(TITLE, DESCRIPTION + " Add a dashboard.", REPO)
+    engine.evaluate(TITLE, DESCRIPTION, REPO, "new pdf")
+    fake.head = SHA_2
+    engine.evaluate(TITLE, DESCRIPTION, REPO)
+    engine.evaluate(TITLE, DESCRIPTION, REPO)
+
+    assert len(runs) == 4
+    assert engine.cache.stats()["hits"] == 1
+
+
+def test_submission_without_repository_is_cached(engine):
+    engine, fake, runs = engine
+    assert engine.evaluate(TITLE, DESCRIPTION) == engine.evaluate(TITLE, DESCRIPTION)
+    assert len(runs) == 1
+    assert fake.calls == []
+
+
+def test_unpinned_repository_is_not_cached(engine, tmp_path, monkeypatch):
+    engine, fake, runs = engine
+    monkeypatch.setenv("REPO_LOCAL_ROOTS", str(tmp_path))
+    local = tmp_path / "work"
+    (local / "app").mkdir(parents=True)
+    (local / "app" / "main.py").write_text("print(1)\n")
+    first = engine.evaluate(TITLE, DESCRIPTION, str(local))
+    second = engine.evaluate(TITLE, DESCRIPTION, str(local))
+
+    # a local checkout is read from disk, with no commit to pin
+    assert first["repository_score"] > 0 and second == first
+    assert fake.calls == []
+
+    # nor can a repository whose GitHub lookup fails
+    fake.missing = True
+    engine.evaluate(TITLE, DESCRIPTION, REPO)
+    assert len(runs) == 3
+    stats = engine.cache.stats()
+    assert stats["uncacheable"] == 3 and stats["entries"] == 0
+
+
+def _count_calls(monkeypatch, obj, name):
+    calls = []
+    original = getattr(obj, name)
+    monkeypatch.setattr(obj, name, lambda *args, **kwargs: calls.append(args) or original(*args, **kwargs))
+    return calls
+
+
+def test_description_edit_reuses_repository_stage(engine, monkeypatch):
+    engine, fake, runs = engine
+    analyses = _count_calls(monkeypatch, engine.repository_analyzer, "analyze")
+    titles = _count_calls(monkeypatch, engine.title_analyzer, "analyze")
+    pdfs = _count_calls(monkeypatch, engine.pdf_analyzer, "analyze_content")
+
+    engine.evaluate(TITLE, DESCRIPTION, REPO, "pdf text")
+    edited = engine.evaluate(TITLE, DESCRIPTION + " Add a dashboard.", REPO, "pdf text")
+
+    assert len(runs) == 2
+    assert len(analyses) == 1
+    assert len(pdfs) == 1
+    assert len(titles) == 2  # alignment depends on the description
+    engine.cache.clear()
+    engine.stage_cache.clear()
+    assert engine.evaluate(TITLE, DESCRIPTION + " Add a dashboard.", REPO, "pdf text") == edited
+
+
+def test_new_commit_reuses_text_stages(engine, monkeypatch):
+    engine, fake, runs = engine
+    intents = _count_calls(monkeypatch, engine.intent_extractor, "extract")
+    analyses = _count_calls(monkeypatch, engine.repository_analyzer, "analyze")
+
+    engine.evaluate(TITLE, DESCRIPTION, REPO, "pdf text")
+    fake.head = SHA_2
+    engine.evaluate(TITLE, DESCRIPTION, REPO, "pdf text")
+
+    assert len(analyses) == 2
+    assert len(intents) == 1
+    assert engine.stage_cache.stats()["hits"] >= 4  # intent, match, pdf, title, description
+
+
+def test_failed_repository_analysis_is_not_memoized(engine, monkeypatch):
+    engine, fake, runs = engine
+
+    def fail(*args):
+        raise RuntimeError("tree unavailable")
+
+    monkeypatch.setattr(engine.repository_analyzer, "_fetch_recursive_tree", fail)
+    engine.evaluate(TITLE, DESCRIPTION, REPO)
+    analyses = _count_calls(monkeypatch, engine.repository_analyzer, "analyze")
+    engine.evaluate(TITLE, DESCRIPTION + " Retry.", REPO)
+    assert len(analyses) == 1
+
+
+def test_repository_metadata_is_not_frozen_by_stage_memo(engine, monkeypatch):
+    engine, fake, runs = engine
+    seen = []
+    score = engine.scoring_engine.calculate_final_score
+    monkeypatch.setattr(
+        engine.scoring_engine, "calculate_final_score",
+        lambda intent, signals, *rest: seen.append(signals["metadata"]) or score(intent, signals, *rest),
+    )
+    pinned = engine.repository_analyzer.snapshot(REPO)
+    engine.evaluate(TITLE, DESCRIPTION, REPO, repository=pinned)
+    pinned.repo_info["stargazers_count"] = 42  # revalidated metadata, same commit
+    engine.evaluate(TITLE, DESCRIPTION + " Add a dashboard.", REPO, repository=pinned)
+
+    assert fake.tree_calls() == 1
+    assert [metadata["stars"] for metadata in seen] == [3, 42]
+
+
+def test_match_stage_is_keyed_on_commit_and_intent(engine, monkeypatch):
+    engine, fake, runs = engine
+    keys = []
+    monkeypatch.setattr(
+        evaluation_engine_module, "evaluation_key",
+        lambda namespace, version, **inputs: keys.append((namespace, inputs)) or evaluation_key(namespace, version, **inputs),
+    )
+    engine.evaluate(TITLE, DESCRIPTION, REPO)
+
+    match = [inputs for namespace, inputs in keys if namespace.endswith(".match")]
+    assert match and set(match[0]) == {"intent", "repository_url", "head_sha", "analysis_mode"}
+    assert match[0]["head_sha"] == SHA_1
+
+
+def test_match_against_failed_analysis_is_not_memoized(engine, monkeypatch):
+    engine, fake, runs = engine
+    fetch_tree = engine.repository_analyzer._fetch_recursive_tree
+    monkeypatch.setattr(engine.repository_analyzer, "_fetch_recursive_tree", lambda *args: 1 / 0)
+    engine.evaluate(TITLE, DESCRIPTION, REPO)
+    monkeypatch.setattr(engine.repository_analyzer, "_fetch_recursive_tree", fetch_tree)
+    matches = _count_calls(monkeypatch, engine.feature_matcher, "compute_match")
+    engine.evaluate(TITLE, DESCRIPTION + " Retry.", REPO)
+    engine.cache.clear()
+    engine.evaluate(TITLE, DESCRIPTION, REPO)
+
+    assert len(matches) == 2
+    assert engine.evaluate(TITLE, DESCRIPTION, REPO)["repository_score"] > 0
+
+
+def _endpoints(fake):
+    return sorted(c.split("/")[-1].split("?")[0] if "/git/trees/" not in c else "tree" for c in fake.calls)
+
+
+def test_one_lookup_pins_and_feeds_the_pipeline(engine):
+    engine, fake, runs = engine
+    engine.evaluate(TITLE, DESCRIPTION, REPO)
+    # metadata and head commit once each, then the tree at that commit
+    assert _endpoints(fake) == ["HEAD", "demo", "tree"]
+
+
+def test_push_during_evaluation_cannot_mislabel_results(engine, monkeypatch):
+    engine, fake, runs = engine
+    pin = engine.repository_analyzer.pin
+
+    def pin_then_push(*args):
+        pinned = pin(*args)
+        fake.head = SHA_2
+        return pinned
+
+    monkeypatch.setattr(engine.repository_analyzer, "pin", pin_then_push)
+    engine.evaluate(TITLE, DESCRIPTION, REPO)
+    trees = [c for c in fake.calls if "/git/trees/" in c]
+    assert len(trees) == 1 and SHA_1 in trees[0]
+    assert runs[0][4] == SHA_1
+
+
+def test_failed_pin_is_not_fetched_again(engine):
+    engine, fake, runs = engine
+    fake.missing = True
+    result = engine.evaluate(TITLE, DESCRIPTION, REPO)
+
+    # the failed lookup feeds the repository stage; nothing is requested twice
+    # (the head commit lookup may still be in flight when the metadata 404 lands)
+    assert set(Counter(_endpoints(fake)).values()) == {1}
+    assert result["repository_score"] == 0.0
+    assert engine.cache.stats()["uncacheable"] == 1
+
+
+def test_convergence_pins_repository_once(tmp_path, monkeypatch):
+    client, repo_cache, fake = _client(tmp_path)
+    analyzer = final_convergence_module.signal_collector.repository_analyzer
+    monkeypatch.setattr(analyzer, "client", client)
+    monkeypatch.setattr(analyzer, "cache", repo_cache)
+    orchestrator = FinalConvergenceOrchestrator()
+    orchestrator.cache = EvaluationCache(path=str(tmp_path / "evaluations.db"))
+
+    orchestrator.process_with_convergence(TITLE, DESCRIPTION, REPO)
+    orchestrator.process_with_convergence(TITLE, DESCRIPTION, REPO)
+
+    assert _endpoints(fake) == ["HEAD", "HEAD", "demo", "demo", "tree"]
+    assert orchestrator.cache.stats()["hits"] == 1
+
+
+def test_convergence_does_not_refetch_after_failed_pin(tmp_path, monkeypatch):
+    client, repo_cache, fake = _client(tmp_path)
+    analyzer = final_convergence_module.signal_collector.repository_analyzer
+    monkeypatch.setattr(analyzer, "client", client)
+    monkeypatch.setattr(analyzer, "cache", repo_cache)
+    orchestrator = FinalConvergenceOrchestrator()
+    orchestrator.cache = EvaluationCache(path=str(tmp_path / "evaluations.db"))
+    fake.missing = True
+
+    orchestrator.process_with_convergence(TITLE, DESCRIPTION, REPO)
+
+    assert set(Counter(_endpoints(fake)).values()) == {1}
+
+
+def test_key_covers_inputs_and_version():
+    base = dict(title="t", description="d", pdf_text="", repository_url="", head_sha="")
+    key = evaluation_key("engine", "1", **base)
+    assert key == evaluation_key("engine", "1", **dict(reversed(list(base.items()))))
+    assert key != evaluation_key("engine", "2", **base)
+    assert key != evaluation_key("engine", "1", **dict(base, description="d "))
+
+
+def test_lru_bound_and_persistence(tmp_path):
+    path = str(tmp_path / "evaluations.db")
+    cache = EvaluationCache(path=path, max_entries=2)
+    for i in range(3):
+        cache.put(f"k{i}", {"score": i})
+    assert cache.stats()["evictions"] == 1
+    assert EvaluationCache(path=path).get("k0") is None
+    assert EvaluationCache(path=path).get("k2") == {"score": 2}
+
+
+def test_convergence_reuses_signals_with_fresh_ids(tmp_path, monkeypatch):
+    orchestrator = FinalConvergenceOrchestrator()
+    orchestrator.cache = EvaluationCache(path=str(tmp_path / "evaluations.db"))
+    collector = final_convergence_module.signal_collector
+    calls = []
+    collect = collector.collect_supporting_signals
+    monkeypatch.setattr(collector, "collect_supporting_signals", lambda **kw: calls.append(kw) or collect(**kw))
+
+    first = orchestrator.process_with_convergence(TITLE, DESCRIPTION)
+    second = orchestrator.process_with_convergence(TITLE, DESCRIPTION)
+
+    assert len(calls) == 1
+    assert second["score"] == first["score"]
+    assert second.get("supporting_signals") == first.get("supporting_signals")
+
+
+def test_convergence_cache_hit_is_stamped_now(tmp_path, monkeypatch):
+    orchestrator = FinalConvergenceOrchestrator()
+    orchestrator.cache = EvaluationCache(path=str(tmp_path / "evaluations.db"))
+
+    _, first = orchestrator._collect_and_assign(TITLE, DESCRIPTION, None, "")
+
+    class Later(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime(2099, 1, 1)
+
+    monkeypatch.setattr(final_convergence_module, "datetime", Later)
+    _, second = orchestrator._collect_and_assign(TITLE, DESCRIPTION, None, "")
+
+    assert orchestrator.cache.stats()["hits"] == 1
+    assert second["evaluated_at"] == "2099-01-01T00:00:00" != first["evaluated_at"]
+    assert dict(second, evaluated_at=None) == dict(first, evaluated_at=None)
@@ -6,7 +6,7 @@ import io
 client = TestClient(app)
 
 def test_github_review_valid(monkeypatch):
-    import requests
+    from app.services.github_client import github_client
     
     class MockResponse:
         def __init__(self, json_data, status_code, headers=None):
@@ -27,7 +27,7 @@ def test_github_review_valid(monkeypatch):
             return MockResponse({"full_name": "fastapi/fastapi", "default_branch": "master", "stargazers_count": 10}, 200)
         return MockResponse({}, 404)
 
-    monkeypatch.setattr(requests, "get", mock_get)
+    monkeypatch.setattr(github_client, "get", mock_get)
 
     response = client.post(
         "/api/v1/task/review",
@@ -64,11 +64,15 @@ def test_github_review_missing_description():
 
 def test_github_review_not_found(monkeypatch):
     import requests
+    from app.services.github_client import github_client
     class MockResponse:
         def __init__(self, status_code): self.status_code = status_code
         def json(self): return {}
+        def raise_for_status(self):
+            if self.status_code >= 400:
+                raise requests.HTTPError(f"{self.status_code} Client Error", response=self)
     
-    monkeypatch.setattr(requests, "get", lambda *args, **kwargs: MockResponse(404))
+    monkeypatch.setattr(github_client, "get", lambda *args, **kwargs: MockResponse(404))
 
     response = client.post(
         "/api/v1/task/review",
@@ -0,0 +1,60 @@
+"""
+Feature Matcher Tests
+
+PathText scans the lowercased, NUL-joined repository paths once per term;
+compute_match must find exactly the features the original per-path
+substring scan found, including terms that could only match across the
+NUL separator of the joined path text.
+"""
+import sys
+import os
+import random
+
+import pytest
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from app.services.feature_matcher import FeatureMatcher, PathText
+
+PATHS = [
+    "app/api/routes.py", "app/services/auth_service.py", "src/UI/Panel.tsx",
+    "db/schema.sql", "tests/test_api.py", "Dockerfile", "docs/readme.md", "x",
+]
+
+
+def _legacy_contains(paths, term):
+    return any(term.lower() in p.lower() for p in paths)
+
+
+@pytest.mark.parametrize("term", [
+    "", "a", "x", "ui", "UI", "db", "api", "API", "auth_service", "panel.tsx",
+    "dockerfile", "docker-compose", "s/a", "py\0", "py\0db", "\0", "zzz", "routes.pyx", "e.p",
+])
+def test_contains_matches_substring_scan(term):
+    assert PathText(PATHS).contains(term) == _legacy_contains(PATHS, term)
+
+
+def test_contains_on_empty_path_list():
+    text = PathText([])
+    assert not text.contains("")
+    assert not text.contains("api")
+
+
+def test_random_terms_match_substring_scan():
+    rng = random.Random(3)
+    alphabet = "abc/_.A"
+    paths = ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 12))) for _ in range(200)]
+    text = PathText(paths)
+    for _ in range(2000):
+        # Paths never contain NUL; terms may, and must not match across paths
+        term = "".join(rng.choice(alphabet + "\0") for _ in range(rng.randint(0, 6)))
+        assert text.contains(term) == _legacy_contains(paths, term), term
+
+
+def test_compute_match_features():
+    signals = {"components": {"routes": ["app/api/routes.py"], "services": ["src/ui/panel.tsx"], "count": 3}}
+    intent = {"expected_features": ["API", "frontend", "dashboard", "billing"]}
+    result = FeatureMatcher().compute_match(intent, signals)
+    assert result["implemented_features"] == ["API", "frontend", "dashboard"]
+    assert result["missing_features"] == ["billing"]
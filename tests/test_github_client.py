@@ -0,0 +1,90 @@
+"""
+GitHub Client Tests
+
+Covers the shared pooled session: connection reuse across analyzers,
+pool configuration and in-process retry of transient 5xx responses.
+No network access: requests are served by a stub adapter.
+"""
+import sys
+import os
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from app.services.github_client import GitHubClient, github_client
+from app.services.repository_analyzer import RepositoryAnalyzer
+
+
+class StubAdapter(HTTPAdapter):
+    """Serves queued (status, body) responses and records each request"""
+
+    def __init__(self, responses):
+        super().__init__()
+        self.responses = list(responses)
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        status, body = self.responses.pop(0)
+        response = requests.Response()
+        response.status_code = status
+        response._content = body.encode("utf-8")
+        response.url = request.url
+        response.request = request
+        return response
+
+
+def test_session_is_shared_and_pooled():
+    client = GitHubClient(pool_size=7)
+    session = client.session
+    assert client.session is session
+
+    adapter = session.get_adapter("https://api.github.com")
+    assert adapter._pool_maxsize == 7
+    assert session.headers["Accept"] == "application/vnd.github.v3+json"
+    client.close()
+
+
+def test_analyzers_use_global_client():
+    assert RepositoryAnalyzer().client is github_client
+
+
+def test_token_header_and_placeholder(monkeypatch):
+    monkeypatch.delenv("GITHUB_TOKENS", raising=False)
+    monkeypatch.setenv("GITHUB_TOKEN", "your_github_token_here")
+    client = GitHubClient()
+    stub = StubAdapter([(200, "{}")])
+    client.session.mount("https://", stub)
+    client.get("https://api.github.com/rate_limit")
+    assert "Authorization" not in stub.requests[0].headers
+
+    monkeypatch.setenv("GITHUB_TOKEN", "abc123")
+    client = GitHubClient()
+    stub = StubAdapter([(200, "{}")])
+    client.session.mount("https://", stub)
+    client.get("https://api.github.com/rate_limit")
+    assert stub.requests[0].headers["Authorization"] == "token abc123"
+
+
+def test_get_json_raises_for_status():
+    client = GitHubClient()
+    stub = StubAdapter([(200, '{"ok": true}'), (404, '{}')])
+    client.session.mount("https://", stub)
+
+    assert client.get_json("https://api.github.com/repos/a/b") == {"ok": True}
+    with pytest.raises(requests.HTTPError):
+        client.get_json("https://api.github.com/repos/a/missing")
+    assert len(stub.requests) == 2
+
+
+def test_retry_policy_covers_transient_failures():
+    client = GitHubClient(max_retries=3)
+    retry = client.session.get_adapter("https://api.github.com").max_retries
+    assert retry.total == 3
+    assert 502 in retry.status_forcelist
+    assert retry.is_retry("GET", 503)
+    assert not retry.is_retry("POST", 503)
@@ -0,0 +1,94 @@
+"""
+GitHub Rate-Limit Scheduler Tests
+
+Covers budget tracking from X-RateLimit-* headers, rotation across the token
+pool, the interactive reserve, deferral with retry-after, and priority
+propagation into the shared fetch pool.
+"""
+import sys
+import os
+import time
+import threading
+
+import pytest
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from app.services.github_client import GitHubClient, configured_tokens
+from app.services.github_scheduler import (
+    GitHubRateScheduler, GitHubRateLimited, github_priority, current_priority,
+    PRIORITY_INTERACTIVE, PRIORITY_BACKGROUND,
+)
+
+
+def _headers(remaining, reset_in=3600, limit=5000):
+    return {
+        "X-RateLimit-Limit": str(limit),
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(int(time.time() + reset_in)),
+    }
+
+
+def test_rotates_to_token_with_most_budget():
+    scheduler = GitHubRateScheduler(["tok-a", "tok-b"], reserve=10, max_wait=0)
+    a, b = scheduler.budgets
+    scheduler.record(a, _headers(40), 200)
+    scheduler.record(b, _headers(900), 200)
+
+    assert scheduler.acquire().token == "tok-b"
+    scheduler.record(b, _headers(5), 200)
+    assert scheduler.acquire().token == "tok-a"
+
+
+def test_background_yields_reserve_to_interactive():
+    scheduler = GitHubRateScheduler(["tok-a"], reserve=10, max_wait=0)
+    scheduler.record(scheduler.budgets[0], _headers(10), 200)
+
+    with pytest.raises(GitHubRateLimited) as exc:
+        scheduler.acquire(PRIORITY_BACKGROUND)
+    assert exc.value.retry_after > 3000
+
+    assert scheduler.acquire(PRIORITY_INTERACTIVE).token == "tok-a"
+    assert scheduler.budgets[0].remaining == 9
+    assert scheduler.stats()["deferred"] == 1
+
+
+def test_exhausted_budget_defers_interactive_past_max_wait():
+    scheduler = GitHubRateScheduler(["tok-a"], reserve=0, max_wait=1)
+    scheduler.record(scheduler.budgets[0], _headers(0, reset_in=600), 403)
+    with pytest.raises(GitHubRateLimited):
+        scheduler.acquire(PRIORITY_INTERACTIVE)
+
+
+def test_interactive_waits_for_reset_and_blocks_background():
+    scheduler = GitHubRateScheduler(["tok-a"], reserve=0, max_wait=5)
+    scheduler.record(scheduler.budgets[0], _headers(0, reset_in=1), 200)
+
+    acquired = []
+    waiter = threading.Thread(target=lambda: acquired.append(scheduler.acquire(PRIORITY_INTERACTIVE)))
+    waiter.start()
+    while scheduler.stats()["interactive_waiting"] == 0:
+        time.sleep(0.01)
+
+    with pytest.raises(GitHubRateLimited):
+        scheduler.acquire(PRIORITY_BACKGROUND)
+
+    waiter.join(5)
+    assert acquired and acquired[0].token == "tok-a"
+
+
+def test_token_pool_configuration(monkeypatch):
+    monkeypatch.setenv("GITHUB_TOKENS", "t1, t2,,t1,your_github_token_here")
+    assert configured_tokens() == ["t1", "t2"]
+    monkeypatch.delenv("GITHUB_TOKENS")
+    monkeypatch.setenv("GITHUB_TOKEN", "solo")
+    assert GitHubClient().scheduler.tokens == ["solo"]
+
+
+def test_priority_propagates_into_fetch_pool():
+    client = GitHubClient()
+    with github_priority(PRIORITY_BACKGROUND):
+        assert client.submit(current_priority).result() == PRIORITY_BACKGROUND
+    assert client.submit(current_priority).result() == PRIORITY_INTERACTIVE
+    client.close()
@@ -0,0 +1,50 @@
+"""
+Intent Extractor Tests
+
+extract must reproduce the original per-keyword regex implementation
+(kept as legacy_extract in the benchmark) exactly, including the
+non-overlapping findall behaviour of the module patterns.
+"""
+import sys
+import os
+
+import pytest
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+sys.path.insert(0, os.path.join(BASE_DIR, "tests"))
+
+from app.services.intent_extractor import IntentExtractor
+from benchmark_intent_extractor import legacy_extract, synthetic_text
+
+EDGE_CASES = {
+    "empty": ("", "", ""),
+    "keywords": ("Build an API", "FastAPI + React UI, docker_compose, go-lang, node.js", ""),
+    "word_boundaries": ("apis", "reviewer api_gateway sql-server nosql", "mvcs microservices"),
+    "arch_order": ("", "layered hexagonal MVC", ""),
+    "arch_phrases": ("", "Clean  architecture / clean architecture's model-view-controller", ""),
+    "phrase_tokens_apart": ("", "clean code and solid architecture; model, view and controller", ""),
+    "consumed_suffix": ("", "user service service billing service", ""),
+    "partial_suffix": ("", "foo moduleXYZW system and alpha systemabcd system", ""),
+    "shared_words": ("", "alpha module system layer engine room", ""),
+    "whitespace": ("", "auth\tservice\npayment   engine notify-layer", ""),
+    "unicode": ("Überblick", "données service ÉCOLE system straße module", "ǅungla layer"),
+    "complexity": ("", "distributed concurrency optimization asynchronous orchestration", ""),
+}
+
+
+@pytest.mark.parametrize("name", sorted(EDGE_CASES))
+def test_matches_legacy_on_edge_cases(name):
+    args = EDGE_CASES[name]
+    assert IntentExtractor().extract(*args) == legacy_extract(*args)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_legacy_on_synthetic_text(seed):
+    args = ("Review engine", synthetic_text(400, seed=seed), synthetic_text(20000, seed=seed + 100))
+    assert IntentExtractor().extract(*args) == legacy_extract(*args)
+
+
+def test_module_suffix_resumes_inside_word():
+    intent = IntentExtractor().extract("", "user systemABCD system", "")
+    assert intent["expected_modules"] == ["abcd", "user"]
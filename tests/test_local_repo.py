@@ -0,0 +1,161 @@
+"""
+Local Repository Backend Tests
+
+Offline analysis of working trees and bare git repositories: .gitignore
+handling, file:// URLs, signal parity between the scandir walk and the
+git-archive path, and the REPO_LOCAL_ROOTS restriction.
+"""
+import sys
+import os
+import shutil
+import subprocess
+
+import pytest
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from app.services import local_repo
+from app.services.local_repo import GitIgnoreRule, walk_directory, is_local_repository
+from app.services.evaluation_engine import EvaluationEngine
+from app.services.repository_analyzer import RepositoryAnalyzer
+
+FILES = {
+    ".gitignore": "node_modules/\n*.log\n!keep.log\n/build\n# comment\n",
+    "README.md": "# Demo\n\nRun it.\n",
+    "app/service.py": "# service\ndef run():\n    return 1  # TODO\n",
+    "app/models/user.py": "class User:\n    pass\n",
+    "tests/test_service.py": "def test_run():\n    assert True\n",
+    "docs/.gitignore": "draft.md\n",
+    "docs/guide.md": "guide\n",
+    "docs/draft.md": "draft\n",
+    "debug.log": "noise\n",
+    "keep.log": "kept\n",
+    "build/out.js": "compiled\n",
+    "src/build/keep.py": "x = 1\n",
+    "node_modules/pkg/index.js": "module\n",
+}
+IGNORED = {"docs/draft.md", "debug.log", "build/out.js", "node_modules/pkg/index.js"}
+
+
+@pytest.fixture
+def work_tree(tmp_path, monkeypatch):
+    monkeypatch.setenv("REPO_LOCAL_ROOTS", str(tmp_path))
+    root = tmp_path / "demo"
+    for path, text in FILES.items():
+        target = root / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(text)
+    return root
+
+
+def _blobs(files):
+    return {f["path"] for f in files if f["type"] == "blob"}
+
+
+def test_walk_honours_gitignore(work_tree):
+    files, content, total_bytes = walk_directory(str(work_tree))
+    assert _blobs(files) == set(FILES) - IGNORED
+    dirs = {f["path"] for f in files if f["type"] == "tree"}
+    assert "node_modules" not in dirs and "build" not in dirs
+    assert "src/build" in dirs  # /build is anchored to the root
+    assert content["todo_count"] == 1
+    assert total_bytes > 0
+
+
+def test_gitignore_rule_semantics():
+    assert GitIgnoreRule("*.log", "").matches("a/b/c.log", False)
+    assert not GitIgnoreRule("/build", "").matches("src/build", True)
+    assert GitIgnoreRule("docs/**/*.md", "").matches("docs/a/b/x.md", False)
+    assert not GitIgnoreRule("cache/", "").matches("cache", False)
+    assert GitIgnoreRule("draft.md", "docs").matches("docs/sub/draft.md", False)
+    assert not GitIgnoreRule("draft.md", "docs").matches("draft.md", False)
+
+
+def test_analyzer_accepts_paths_and_file_urls(work_tree):
+    analyzer = RepositoryAnalyzer()
+    assert is_local_repository(str(work_tree))
+    by_path = analyzer.analyze_local(str(work_tree))
+    by_url = analyzer.analyze_local(work_tree.as_uri())
+
+    assert by_path == by_url
+    assert "error" not in by_path
+    assert by_path["metadata"]["name"] == "demo"
+    assert by_path["metadata"]["language"] == "Python"
+    assert by_path["structure"]["total_files"] == len(FILES) - len(IGNORED)
+    assert set(by_path) >= {"structure", "components", "architecture", "quality", "metadata", "content"}
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+def test_bare_repository_matches_work_tree(work_tree, tmp_path):
+    git = ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", "-c", "init.defaultBranch=main"]
+    subprocess.run(git + ["init", "-q", str(work_tree)], check=True)
+    subprocess.run(git + ["-C", str(work_tree), "add", "-A"], check=True)
+    subprocess.run(git + ["-C", str(work_tree), "commit", "-q", "-m", "init"], check=True)
+    bare = tmp_path / "demo.git"
+    subprocess.run(git + ["clone", "-q", "--bare", str(work_tree), str(bare)], check=True)
+
+    analyzer = RepositoryAnalyzer()
+    from_tree = analyzer.analyze_local(str(work_tree))
+    from_bare = analyzer.analyze_local(str(bare))
+
+    assert "error" not in from_bare
+    assert from_bare["metadata"]["name"] == "demo"
+    for key in ("structure", "components", "architecture", "quality", "content"):
+        assert from_bare[key] == from_tree[key]
+
+
+def test_missing_path_reports_error(tmp_path, monkeypatch):
+    monkeypatch.setenv("REPO_LOCAL_ROOTS", str(tmp_path))
+    result = RepositoryAnalyzer().analyze_local(str(tmp_path / "nope"))
+    assert "error" in result
+    assert result["structure"]["total_files"] == 0
+
+
+def _walks(monkeypatch):
+    calls = []
+    monkeypatch.setattr(local_repo, "walk_directory", lambda root: calls.append(root) or ([], {}, 0))
+    monkeypatch.setattr(local_repo, "archive_bare_repository", lambda path: calls.append(path) or ([], {}, 0))
+    return calls
+
+
+def test_analyze_reads_local_paths_only_when_enabled(work_tree, monkeypatch):
+    walks = _walks(monkeypatch)
+    analyzer = RepositoryAnalyzer()
+    monkeypatch.delenv("REPO_LOCAL_ROOTS")
+    assert analyzer.analyze(str(work_tree)) is None
+    assert analyzer.analyze(work_tree.as_uri()) is None
+    assert analyzer.snapshot(str(work_tree)) is None
+    assert walks == []
+
+    monkeypatch.setenv("REPO_LOCAL_ROOTS", str(work_tree.parent))
+    assert "REPO_LOCAL_ROOTS" in analyzer.analyze("/etc")["error"]
+    assert walks == []
+    assert "error" not in analyzer.analyze(work_tree.as_uri())
+    assert walks == [os.path.realpath(work_tree)]
+
+
+def test_local_checkout_is_evaluated(work_tree):
+    engine = EvaluationEngine()
+    result = engine.evaluate("Build a service", "Implement a Python service with unit tests.", str(work_tree))
+    assert result["repository_score"] > 0
+
+
+def test_local_analysis_is_confined_to_roots(work_tree, tmp_path, monkeypatch):
+    walks = _walks(monkeypatch)
+    analyzer = RepositoryAnalyzer()
+    escape = work_tree / "escape"
+    escape.symlink_to("/etc")
+
+    for path in ("/etc", "/", str(work_tree / ".." / ".." / "etc"), str(escape), "file:///etc"):
+        result = analyzer.analyze_local(path)
+        assert "REPO_LOCAL_ROOTS" in result["error"]
+    assert walks == []
+
+    monkeypatch.delenv("REPO_LOCAL_ROOTS")
+    assert "REPO_LOCAL_ROOTS" in analyzer.analyze_local(str(work_tree))["error"]
+    assert walks == []
+
+    monkeypatch.setenv("REPO_LOCAL_ROOTS", str(tmp_path))
+    analyzer.analyze_local(str(work_tree))
+    assert walks == [os.path.realpath(work_tree)]
@@ -0,0 +1,64 @@
+"""
+Path Classifier Tests
+
+classify_tree must reproduce the original per-signal implementation
+(kept as legacy_signals in the benchmark) exactly, including edge cases.
+"""
+import sys
+import os
+
+import pytest
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+sys.path.insert(0, os.path.join(BASE_DIR, "tests"))
+
+from app.services.path_classifier import classify_tree
+from benchmark_path_classifier import legacy_signals, synthetic_tree
+
+
+def _blob(path, size=10):
+    return {"path": path, "type": "blob", "size": size}
+
+
+def _tree(path):
+    return {"path": path, "type": "tree"}
+
+
+EDGE_CASES = {
+    "empty": [],
+    "flat": [_blob("main.py"), _blob("setup.cfg")],
+    "readme_variants": [
+        _tree("docs"), _blob("docs/README.md", 700), _blob("README.md.txt", 2000), _blob("ReadMe.MD", 50),
+    ],
+    "no_readme": [_blob("notreadme.md"), _blob("src/readme_md.py")],
+    "layers": [
+        _tree("app"), _blob("App/Model.py"), _blob("core/x.go"), _blob("domain/d.ts"),
+        _blob("api"), _blob("xapi/y.py"), _blob("src/service/z.java"),
+    ],
+    "dotted_dirs": [_tree("pkg.egg-info"), _blob("pkg.egg-info/PKG-INFO"), _blob("a.b/c"), _blob(".env")],
+    "keywords": [
+        _blob("src/Controllers/UserController.cs"), _blob("lib/SchemaManager.ts"),
+        _blob("Docs/guide.txt"), _blob("LICENSE"), _blob("pkg/IInterface.java"), _blob("tests/abstract_test.py"),
+    ],
+    "unicode": [_blob("İstanbul/Route.py"), _blob("données/Modèle.md")],
+    "submodule": [{"path": "vendor/lib", "type": "commit"}, _blob("vendor/readme.md", 600)],
+}
+
+
+@pytest.mark.parametrize("name", sorted(EDGE_CASES))
+def test_matches_legacy_on_edge_cases(name):
+    files = EDGE_CASES[name]
+    assert classify_tree(files) == legacy_signals(files)
+
+
+@pytest.mark.parametrize("size", [1, 500, 20000])
+def test_matches_legacy_on_synthetic_trees(size):
+    files = synthetic_tree(size)
+    assert classify_tree(files) == legacy_signals(files)
+
+
+def test_directory_named_like_readme_does_not_raise():
+    # The per-signal implementation raised KeyError on the size-less tree entry
+    files = [_tree("readme.md.d"), _blob("readme.md.d/x.py"), _blob("README.md", 1200)]
+    assert classify_tree(files)["quality"]["readme_score"] == 1
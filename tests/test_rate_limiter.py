@@ -0,0 +1,159 @@
+"""
+Rate Limiter Tests
+Token-bucket behaviour, per-route limits and bounded client tracking.
+"""
+import multiprocessing
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from app.security import middleware
+from app.security.middleware import RateLimiter
+from app.security.shared_rate_limit import SharedRateLimitStore
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(middleware.time, "monotonic", fake)
+    return fake
+
+
+def test_limit_enforced_within_window(clock):
+    limiter = RateLimiter()
+    allowed = [limiter.is_allowed("10.0.0.1", max_requests=5, window_minutes=1) for _ in range(7)]
+    assert allowed == [True] * 5 + [False] * 2
+
+
+def test_tokens_refill_over_time(clock):
+    limiter = RateLimiter()
+    for _ in range(5):
+        assert limiter.is_allowed("10.0.0.1", max_requests=5, window_minutes=1)
+    assert not limiter.is_allowed("10.0.0.1", max_requests=5, window_minutes=1)
+
+    clock.now += 12  # one token per 12 seconds
+    assert limiter.is_allowed("10.0.0.1", max_requests=5, window_minutes=1)
+    assert not limiter.is_allowed("10.0.0.1", max_requests=5, window_minutes=1)
+
+    clock.now += 600
+    allowed = [limiter.is_allowed("10.0.0.1", max_requests=5, window_minutes=1) for _ in range(6)]
+    assert allowed.count(True) == 5
+
+
+def test_clients_are_independent(clock):
+    limiter = RateLimiter()
+    assert limiter.is_allowed("10.0.0.1", max_requests=1, window_minutes=1)
+    assert not limiter.is_allowed("10.0.0.1", max_requests=1, window_minutes=1)
+    assert limiter.is_allowed("10.0.0.2", max_requests=1, window_minutes=1)
+
+
+def test_route_limit_uses_longest_prefix_and_own_bucket(clock):
+    limiter = RateLimiter()
+    limiter.set_route_limit("/auth", max_requests=10, window_seconds=60)
+    limiter.set_route_limit("/auth/login", max_requests=2, window_seconds=60)
+
+    assert limiter.is_allowed("10.0.0.1", path="/auth/login")
+    assert limiter.is_allowed("10.0.0.1", path="/auth/login")
+    assert not limiter.is_allowed("10.0.0.1", path="/auth/login")
+
+    assert limiter.is_allowed("10.0.0.1", path="/auth/me")
+    assert limiter.is_allowed("10.0.0.1", path="/api/v1/lifecycle/history")
+
+
+def test_memory_bounded_by_lru_eviction(clock):
+    limiter = RateLimiter(max_clients=100)
+    for i in range(1000):
+        limiter.is_allowed(f"192.168.{i // 256}.{i % 256}")
+    assert limiter.tracked_clients == 100
+
+
+def test_recently_seen_client_survives_eviction(clock):
+    limiter = RateLimiter(max_clients=3)
+    assert limiter.is_allowed("a", max_requests=1, window_minutes=60)
+    limiter.is_allowed("b")
+    limiter.is_allowed("a", max_requests=1, window_minutes=60)
+    limiter.is_allowed("c")
+    limiter.is_allowed("d")
+    assert not limiter.is_allowed("a", max_requests=1, window_minutes=60)
+
+
+def test_check_rate_limit_raises_429(monkeypatch):
+    monkeypatch.setattr(middleware, "rate_limiter", RateLimiter())
+    for _ in range(100):
+        middleware.check_rate_limit("10.9.9.9", "/api/v1/tts")
+    with pytest.raises(HTTPException) as exc:
+        middleware.check_rate_limit("10.9.9.9", "/api/v1/tts")
+    assert exc.value.status_code == 429
+
+
+def _hammer(db_path, barrier, results, attempts):
+    store = SharedRateLimitStore(db_path)
+    limiter = RateLimiter(shared_store=store)
+    barrier.wait()
+    allowed = sum(
+        1 for _ in range(attempts)
+        if limiter.is_allowed("203.0.113.7", max_requests=50, window_minutes=60)
+    )
+    results.put(allowed)
+
+
+def test_shared_store_enforces_one_budget_across_processes(tmp_path):
+    db_path = str(tmp_path / "rate_limit.db")
+    SharedRateLimitStore(db_path)
+    workers = 4
+    ctx = multiprocessing.get_context("fork")
+    barrier = ctx.Barrier(workers)
+    results = ctx.Queue()
+    procs = [ctx.Process(target=_hammer, args=(db_path, barrier, results, 40)) for _ in range(workers)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join(timeout=60)
+
+    total_allowed = sum(results.get(timeout=5) for _ in range(workers))
+    assert total_allowed == 50
+
+
+def test_local_denial_skips_shared_store(tmp_path, clock, monkeypatch):
+    store = SharedRateLimitStore(str(tmp_path / "rate_limit.db"))
+    limiter = RateLimiter(shared_store=store)
+    calls = []
+    original_consume = store.consume
+    monkeypatch.setattr(store, "consume", lambda *args: (calls.append(args), original_consume(*args))[1])
+
+    allowed = [limiter.is_allowed("10.0.0.1", max_requests=2, window_minutes=1) for _ in range(3)]
+    assert allowed == [True, True, False]
+    assert len(calls) == 2
+
+    assert store.count() == 1
+    store.prune(idle_seconds=-1)
+    assert store.count() == 0
+
+
+def test_shared_store_counts_calls_across_threads(tmp_path):
+    store = SharedRateLimitStore(str(tmp_path / "rate_limit.db"), prune_interval=10)
+    prunes = []
+    prune = store.prune
+    store.prune = lambda *args: prunes.append(args) or prune(*args)
+
+    def hammer(n):
+        for i in range(25):
+            store.consume(f"thread-{n}-{i}", capacity=5, window_seconds=60)
+
+    threads = [threading.Thread(target=hammer, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert store._calls == 200
+    assert len(prunes) == 20
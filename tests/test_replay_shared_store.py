@@ -0,0 +1,71 @@
+"""
+Sarathi Replay Store — Cross-Process Tests
+
+Verifies that the replay store is shared between worker processes:
+the same JTI can only be accepted once across all processes on a host.
+"""
+import sys
+import os
+import uuid
+import multiprocessing
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from app.sarathi.replay_detector import replay_detector
+
+
+def _claim(jti, barrier, results):
+    barrier.wait()
+    results.put(replay_detector.check_and_mark(jti))
+
+
+def _mark(jti):
+    replay_detector.mark_used(jti)
+
+
+def test_check_and_mark_single_process():
+    replay_detector.clear()
+    jti = str(uuid.uuid4())
+    assert replay_detector.check_and_mark(jti) is True
+    assert replay_detector.check_and_mark(jti) is False
+    assert replay_detector.is_replayed(jti)
+
+
+def test_same_jti_accepted_once_across_processes():
+    replay_detector.clear()
+    jti = str(uuid.uuid4())
+    workers = 6
+    ctx = multiprocessing.get_context("fork")
+    barrier = ctx.Barrier(workers)
+    results = ctx.Queue()
+    procs = [ctx.Process(target=_claim, args=(jti, barrier, results)) for _ in range(workers)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join(timeout=30)
+
+    outcomes = [results.get(timeout=5) for _ in range(workers)]
+    assert outcomes.count(True) == 1, f"expected exactly one acceptance, got {outcomes}"
+    assert replay_detector.is_replayed(jti)
+
+
+def test_jti_marked_by_other_process_is_visible():
+    replay_detector.clear()
+    jti = str(uuid.uuid4())
+    assert not replay_detector.is_replayed(jti)
+
+    ctx = multiprocessing.get_context("fork")
+    p = ctx.Process(target=_mark, args=(jti,))
+    p.start()
+    p.join(timeout=30)
+
+    assert replay_detector.is_replayed(jti)
+    assert replay_detector.check_and_mark(jti) is False
+
+
+if __name__ == "__main__":
+    test_check_and_mark_single_process()
+    test_same_jti_accepted_once_across_processes()
+    test_jti_marked_by_other_process_is_visible()
+    print("ALL REPLAY STORE TESTS PASSED")
@@ -0,0 +1,84 @@
+"""
+RepoAnalyzer Concurrency Tests
+
+The metadata, languages, commit-count and tree calls must overlap:
+wall-clock time tracks the longest dependency chain (metadata -> tree),
+not the sum of all calls. Optional calls that miss the shared deadline
+degrade to empty values instead of failing the analysis.
+"""
+import sys
+import os
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from app.services.github_client import github_client
+from app.services.repo_analyzer import RepoAnalyzer
+
+CALL_DELAY = 0.3
+
+
+class MockResponse:
+    def __init__(self, json_data, status_code=200, headers=None):
+        self.json_data = json_data
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def json(self):
+        return self.json_data
+
+    def raise_for_status(self):
+        pass
+
+
+def _slow_get(delays=None):
+    delays = delays or {}
+
+    def mock_get(url, *args, **kwargs):
+        if "/languages" in url:
+            time.sleep(delays.get("languages", CALL_DELAY))
+            return MockResponse({"Python": 100})
+        if "/commits" in url:
+            time.sleep(delays.get("commits", CALL_DELAY))
+            return MockResponse([{}], headers={"Link": 'page=42>; rel="last"'})
+        if "/git/trees/" in url:
+            time.sleep(delays.get("tree", CALL_DELAY))
+            assert "/git/trees/develop?" in url
+            return MockResponse({"tree": [
+                {"path": "README.md", "type": "blob"},
+                {"path": "tests", "type": "tree"},
+                {"path": "tests/test_x.py", "type": "blob"},
+            ]})
+        time.sleep(delays.get("repo", CALL_DELAY))
+        return MockResponse({"full_name": "octo/demo", "default_branch": "develop"})
+
+    return mock_get
+
+
+def test_fetches_overlap(monkeypatch):
+    monkeypatch.setattr(github_client, "get", _slow_get())
+
+    start = time.perf_counter()
+    metrics = RepoAnalyzer.analyze_repo("https://github.com/octo/demo")
+    elapsed = time.perf_counter() - start
+
+    # Sequential would be 4 * CALL_DELAY; the critical path is repo -> tree
+    assert elapsed < 3 * CALL_DELAY
+    assert metrics["commit_count"] == 42
+    assert metrics["languages"] == ["Python"]
+    assert metrics["file_count"] == 2
+    assert metrics["has_readme"] and metrics["has_tests"]
+
+
+def test_slow_optional_call_respects_deadline(monkeypatch):
+    monkeypatch.setattr(github_client, "get", _slow_get({"languages": 2.0, "repo": 0.0, "tree": 0.0, "commits": 0.0}))
+    monkeypatch.setattr(RepoAnalyzer, "DEADLINE_SECONDS", 0.5)
+
+    start = time.perf_counter()
+    metrics = RepoAnalyzer.analyze_repo("https://github.com/octo/demo")
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 1.5
+    assert metrics["languages"] == []
+    assert metrics["commit_count"] == 42
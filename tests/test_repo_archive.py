@@ -0,0 +1,143 @@
+"""
+Repository Archive Analysis Tests
+
+The streaming tar scanner must produce the same tree listing as the
+git/trees API, plus content metrics, and tarball mode must yield the same
+path-based signals as tree mode with a single archive download.
+"""
+import sys
+import os
+import io
+import json
+import tarfile
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from app.services.github_client import GitHubClient
+from app.services.repo_archive import scan_tar_stream, ArchiveTooLarge
+from app.services.repo_cache import RepoAnalysisCache
+from app.services.repository_analyzer import RepositoryAnalyzer
+
+ROOT = "octo-demo-1234567/"
+SHA = "c" * 40
+FILES = {
+    "README.md": b"# Demo\n\nUsage notes.\n",
+    "app/service.py": b"# service layer\nimport os\n\n\ndef run():\n    return os.getcwd()  # TODO: config\n",
+    "app/models/user.py": b"class User:\n    pass\n",
+    "api/routes.js": b"// routes\n/* block\n * comment\n */\nconst x = 1;\n",
+    "tests/test_service.py": b"def test_run():\n    assert True\n\n\ndef test_other():\n    pass\n",
+    ".github/workflows/ci.yml": b"name: ci\n",
+    "assets/logo.png": b"\x89PNG\r\n\x1a\n\x00\x00binary",
+}
+
+
+def _tar_bytes(with_dirs=True):
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+        names = [ROOT] if with_dirs else []
+        if with_dirs:
+            dirs = {p.rsplit("/", 1)[0] for p in FILES if "/" in p}
+            dirs |= {d.rsplit("/", 1)[0] for d in dirs if "/" in d}
+            names += [ROOT + d + "/" for d in sorted(dirs)]
+        for name in names:
+            info = tarfile.TarInfo(name.rstrip("/"))
+            info.type = tarfile.DIRTYPE
+            archive.addfile(info)
+        for path, data in FILES.items():
+            info = tarfile.TarInfo(ROOT + path)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+def _tree_api_listing():
+    files, _ = scan_tar_stream(io.BytesIO(_tar_bytes()))
+    return files
+
+
+def test_tar_scan_listing_and_metrics():
+    files, content = scan_tar_stream(io.BytesIO(_tar_bytes()))
+    paths = {f["path"]: f["type"] for f in files}
+    assert paths["app"] == "tree" and paths["app/models"] == "tree"
+    assert paths[".github/workflows/ci.yml"] == "blob"
+    assert not any(p.startswith(ROOT) for p in paths)
+    assert len([f for f in files if f["type"] == "blob"]) == len(FILES)
+
+    assert content["binary_files"] == 1
+    assert content["files_scanned"] == len(FILES) - 1
+    assert content["todo_count"] == 1
+    assert content["test_functions"] == 2
+    assert content["readme_lines"] == 3
+    assert content["comment_lines"] == 5  # py: 1, js: //, /*, *, */
+    assert content["comment_ratio"] > 0
+
+
+def test_implicit_directories():
+    tar_files, _ = scan_tar_stream(io.BytesIO(_tar_bytes()))
+    bare_files, _ = scan_tar_stream(io.BytesIO(_tar_bytes(with_dirs=False)))
+    assert bare_files == tar_files
+
+
+def test_archive_size_limit():
+    with pytest.raises(ArchiveTooLarge):
+        scan_tar_stream(io.BytesIO(_tar_bytes()), max_bytes=100)
+
+
+class FakeGitHub(HTTPAdapter):
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def send(self, request, **kwargs):
+        path = request.path_url
+        self.calls.append(path)
+        response = requests.Response()
+        response.status_code = 200
+        response.url = request.url
+        response.request = request
+        if request.headers.get("Accept") == "application/vnd.github.sha":
+            body = SHA.encode()
+        elif "/tarball/" in path:
+            body = _tar_bytes()
+        elif "/git/trees/" in path:
+            body = json.dumps({"tree": _tree_api_listing()}).encode()
+        else:
+            body = json.dumps({"name": "demo", "default_branch": "main", "language": "Python"}).encode()
+        response.raw = io.BytesIO(body)
+        return response
+
+
+def _analyzer(tmp_path, mode):
+    client = GitHubClient(etag_store=RepoAnalysisCache(path=str(tmp_path / "etags.db")))
+    fake = FakeGitHub()
+    client.session.mount("https://", fake)
+    analyzer = RepositoryAnalyzer(mode=mode)
+    analyzer.client = client
+    analyzer.cache = RepoAnalysisCache(path=str(tmp_path / f"{mode}.db"))
+    return analyzer, fake
+
+
+def test_tarball_mode_matches_tree_mode_signals(tmp_path):
+    tree_analyzer, tree_fake = _analyzer(tmp_path, "tree")
+    tar_analyzer, tar_fake = _analyzer(tmp_path, "tarball")
+
+    tree_signals = tree_analyzer.analyze("https://github.com/octo/demo")
+    tar_signals = tar_analyzer.analyze("https://github.com/octo/demo")
+
+    for key in ("structure", "components", "architecture", "quality"):
+        assert tar_signals[key] == tree_signals[key]
+    assert "content" not in tree_signals
+    assert tar_signals["content"]["test_functions"] == 2
+
+    assert any(f"/tarball/{SHA}" in c for c in tar_fake.calls)
+    assert not any("/git/trees/" in c for c in tar_fake.calls)
+
+
+def test_unknown_mode_rejected():
+    with pytest.raises(ValueError):
+        RepositoryAnalyzer(mode="svn")
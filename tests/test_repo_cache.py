@@ -0,0 +1,156 @@
+"""
+Repository Analysis Cache Tests
+
+A fake GitHub API (stub transport adapter) honours If-None-Match, so the
+tests can check that repeat analyses of an unchanged repository are served
+from 304s and the per-commit cache without touching the tree endpoint, and
+that a new head commit triggers a fresh tree fetch.
+"""
+import sys
+import os
+import json
+import hashlib
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+import app.services.repo_analyzer as repo_analyzer_module
+from app.services.github_client import GitHubClient
+from app.services.repo_analyzer import RepoAnalyzer
+from app.services.repository_analyzer import RepositoryAnalyzer
+from app.services.repo_cache import RepoAnalysisCache, analysis_key
+
+SHA_1 = "a" * 40
+SHA_2 = "b" * 40
+
+
+class FakeGitHub(HTTPAdapter):
+    """Serves one repository and answers conditional requests with 304"""
+
+    def __init__(self):
+        super().__init__()
+        self.head = SHA_1
+        self.missing = False
+        self.calls = []
+        self.not_modified = 0
+
+    def _route(self, request):
+        path = request.path_url
+        if request.headers.get("Accept") == "application/vnd.github.sha":
+            return self.head, {}
+        if "/git/trees/" in path:
+            return json.dumps({"tree": [
+                {"path": "README.md", "type": "blob", "size": 1200},
+                {"path": "app", "type": "tree"},
+                {"path": "app/service.py", "type": "blob", "size": 10},
+                {"path": "tests", "type": "tree"},
+            ]}), {}
+        if path.endswith("/languages"):
+            return json.dumps({"Python": 1000}), {}
+        if "/commits?" in path:
+            return json.dumps([{}]), {"Link": '<https://x?page=7>; rel="last"'}
+        return json.dumps({
+            "name": "demo", "full_name": "octo/demo", "default_branch": "main",
+            "language": "Python", "stargazers_count": 3, "size": 10,
+        }), {}
+
+    def send(self, request, **kwargs):
+        self.calls.append(request.path_url)
+        body, headers = self._route(request)
+        etag = '"%s"' % hashlib.sha1(body.encode()).hexdigest()
+        response = requests.Response()
+        response.url = request.url
+        response.request = request
+        response.headers.update(headers)
+        response.headers["ETag"] = etag
+        if self.missing:
+            response.status_code = 404
+            response._content = b'{"message": "Not Found"}'
+        elif request.headers.get("If-None-Match") == etag:
+            self.not_modified += 1
+            response.status_code = 304
+            response._content = b""
+        else:
+            response.status_code = 200
+            response._content = body.encode()
+        return response
+
+    def tree_calls(self):
+        return len([c for c in self.calls if "/git/trees/" in c])
+
+
+def _client(tmp_path):
+    cache = RepoAnalysisCache(path=str(tmp_path / "cache.db"), ttl_seconds=3600, max_entries=50)
+    client = GitHubClient(etag_store=cache)
+    fake = FakeGitHub()
+    client.session.mount("https://", fake)
+    return client, cache, fake
+
+
+def test_repository_analyzer_skips_tree_for_unchanged_repo(tmp_path):
+    client, cache, fake = _client(tmp_path)
+    analyzer = RepositoryAnalyzer()
+    analyzer.client = client
+    analyzer.cache = cache
+
+    first = analyzer.analyze("https://github.com/octo/demo")
+    assert first["structure"]["total_files"] == 2
+    assert fake.tree_calls() == 1
+    assert any(SHA_1 in c for c in fake.calls if "/git/trees/" in c)
+
+    second = analyzer.analyze("https://github.com/octo/demo")
+    assert second == first
+    assert fake.tree_calls() == 1
+    assert fake.not_modified == 2  # metadata + head sha
+
+    stats = cache.stats()
+    assert stats["hits"] == 1 and stats["revalidated"] == 2
+    assert stats["hit_rate"] == 0.5
+
+    fake.head = SHA_2
+    analyzer.analyze("https://github.com/octo/demo")
+    assert fake.tree_calls() == 2
+
+
+def test_repo_analyzer_skips_tree_for_unchanged_repo(tmp_path, monkeypatch):
+    client, cache, fake = _client(tmp_path)
+    monkeypatch.setattr(repo_analyzer_module, "github_client", client)
+    monkeypatch.setattr(RepoAnalyzer, "cache", cache)
+
+    first = RepoAnalyzer.analyze_repo("https://github.com/octo/demo")
+    second = RepoAnalyzer.analyze_repo("https://github.com/octo/demo")
+
+    assert first == second
+    assert first["commit_count"] == 7  # Link header survives a 304
+    assert first["has_readme"] and first["has_tests"]
+    assert fake.tree_calls() == 1
+    assert fake.not_modified == 4  # metadata, languages, commits, head sha
+
+
+def test_ttl_expiry_and_size_bound(tmp_path):
+    cache = RepoAnalysisCache(path=str(tmp_path / "cache.db"), ttl_seconds=0.05, max_entries=3)
+    key = analysis_key("t", "o", "r", SHA_1)
+    cache.put(key, {"v": 1})
+    assert cache.get(key) == {"v": 1}
+    time.sleep(0.1)
+    assert cache.get(key) is None
+    assert cache.stats()["expired"] == 1
+
+    cache.ttl_seconds = 3600
+    for i in range(5):
+        cache.put(analysis_key("t", "o", f"r{i}", SHA_1), {"v": i})
+    stats = cache.stats()
+    assert stats["entries"] == 3
+    assert stats["evictions"] == 2
+    assert cache.get(analysis_key("t", "o", "r0", SHA_1)) is None
+    assert cache.get(analysis_key("t", "o", "r4", SHA_1)) == {"v": 4}
+
+
+def test_cache_persists_across_instances(tmp_path):
+    path = str(tmp_path / "cache.db")
+    RepoAnalysisCache(path=path).put("k", {"v": 1})
+    assert RepoAnalysisCache(path=path).get("k") == {"v": 1}
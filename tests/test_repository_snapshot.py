@@ -0,0 +1,112 @@
+"""
+Repository Snapshot Tests
+
+An extended review fetches the repository once: the orchestrator's metrics
+summary and the evaluation engine's architecture/quality signals are both
+derived from the same RepositorySnapshot.
+"""
+import sys
+import os
+from collections import Counter
+
+import pytest
+import requests
+from fastapi import HTTPException
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+sys.path.insert(0, os.path.join(BASE_DIR, "tests"))
+
+import app.services.repo_analyzer as repo_analyzer_module
+from app.services.evaluation_cache import EvaluationCache
+from app.services.repo_analyzer import RepoAnalyzer
+from app.services.review_engine import ReviewEngine
+from app.services.review_orchestrator import ReviewOrchestrator
+from app.services.sequential_task_generator import SequentialTaskGenerator
+from test_repo_cache import _client
+
+REPO = "https://github.com/octo/demo"
+DESCRIPTION = "Implement an API endpoint, a scoring service and unit tests. Use Python and Docker."
+
+
+def _endpoint(path):
+    path = path.split("?")[0]
+    if "/git/trees/" in path:
+        return "tree"
+    if "/commits" in path:
+        return "commits"
+    return path.rsplit("/", 1)[-1]
+
+
+def test_snapshot_serves_metrics_and_signals(tmp_path, monkeypatch):
+    client, cache, fake = _client(tmp_path)
+    monkeypatch.setattr(repo_analyzer_module, "github_client", client)
+    monkeypatch.setattr(RepoAnalyzer, "cache", cache)
+
+    snapshot = RepoAnalyzer.snapshot(REPO)
+
+    assert snapshot.metrics["url"] == REPO
+    assert snapshot.metrics["commit_count"] == 7
+    assert snapshot.metrics["file_count"] == 2
+    assert snapshot.metrics["has_readme"] and snapshot.metrics["has_tests"]
+    assert snapshot.signals["structure"]["total_files"] == 2
+    assert snapshot.signals["metadata"]["name"] == "demo"
+
+
+def test_extended_review_fetches_repository_once(tmp_path, monkeypatch):
+    client, cache, fake = _client(tmp_path)
+    monkeypatch.setattr(repo_analyzer_module, "github_client", client)
+    monkeypatch.setattr(RepoAnalyzer, "cache", cache)
+
+    engine = ReviewEngine()
+    evaluation = engine.evaluation_engine
+    evaluation.repository_analyzer.client = client
+    evaluation.repository_analyzer.cache = cache
+    evaluation.cache = EvaluationCache(path=str(tmp_path / "evaluations.db"))
+    evaluation.stage_cache = EvaluationCache(path=str(tmp_path / "evaluations.db"), table="stages")
+    orchestrator = ReviewOrchestrator(engine, SequentialTaskGenerator())
+
+    result = orchestrator.orchestrate_review(DESCRIPTION, github_url=REPO)
+
+    # One request each for metadata, languages and tree; "commits" is the head SHA and the commit count
+    assert Counter(_endpoint(c) for c in fake.calls) == {"demo": 1, "languages": 1, "commits": 2, "tree": 1}
+    assert result.review.repository_score > 0
+
+
+class _Response:
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.text = ""
+        self.headers = {}
+
+    def json(self):
+        return {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Client Error", response=self)
+
+
+def test_missing_repository_is_not_found(monkeypatch):
+    monkeypatch.setattr(repo_analyzer_module.github_client, "get", lambda *args, **kwargs: _Response(404))
+
+    with pytest.raises(HTTPException) as raised:
+        RepoAnalyzer.snapshot("https://github.com/invalid/repo")
+    assert raised.value.status_code == 404
+
+
+def test_wrapped_not_found_is_not_found(monkeypatch):
+    class Wrapped(Exception):
+        pass
+
+    def fail(*args, **kwargs):
+        try:
+            _Response(404).raise_for_status()
+        except requests.HTTPError as e:
+            raise Wrapped("fetch failed") from e
+
+    monkeypatch.setattr(repo_analyzer_module.github_client, "get", fail)
+
+    with pytest.raises(HTTPException) as raised:
+        RepoAnalyzer.snapshot("https://github.com/invalid/repo")
+    assert raised.value.status_code == 404
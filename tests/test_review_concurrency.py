@@ -0,0 +1,108 @@
+"""
+Review Endpoint Concurrency Tests
+
+/api/v1/task/review dispatches the blocking review pipeline to the bounded
+review executor, so concurrent requests overlap instead of serializing on
+the event loop, and excess load is shed with 503.
+"""
+import sys
+import os
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from app.api import task_review
+from app.core.dependencies import get_review_orchestrator
+from app.core.review_executor import ReviewCapacityExceeded, ReviewExecutor
+from app.models.schemas import ReviewOutput
+
+PIPELINE_SECONDS = 0.3
+PAYLOAD = {"payload": {"task_title": "Concurrent review", "task_description": "A" * 60, "submitted_by": "tester"}}
+
+
+class SlowOrchestrator:
+    """Blocks like a GitHub fetch would, then returns a fixed review"""
+
+    def __init__(self):
+        self.threads = set()
+
+    def process_submission(self, task):
+        self.threads.add(threading.get_ident())
+        time.sleep(PIPELINE_SECONDS)
+        review = ReviewOutput(
+            score=70, readiness_percent=70, status="pass",
+            analysis={"technical_quality": 70, "clarity": 70, "discipline_signals": 70},
+            meta={"evaluation_time_ms": 300, "mode": "rule"},
+        )
+        return SimpleNamespace(review=review)
+
+
+@pytest.fixture
+def app(monkeypatch):
+    monkeypatch.setattr(task_review, "review_executor", ReviewExecutor(workers=4, max_pending=4))
+    orchestrator = SlowOrchestrator()
+    app = FastAPI()
+    app.include_router(task_review.router, prefix="/api/v1/task")
+    app.dependency_overrides[get_review_orchestrator] = lambda: orchestrator
+    app.state.orchestrator = orchestrator
+    return app
+
+
+async def _post_reviews(app, count):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await asyncio.gather(*[
+            client.post("/api/v1/task/review", json=PAYLOAD) for _ in range(count)
+        ])
+
+
+def test_independent_reviews_do_not_serialize(app):
+    start = time.perf_counter()
+    responses = asyncio.run(_post_reviews(app, 4))
+    elapsed = time.perf_counter() - start
+
+    assert [r.status_code for r in responses] == [200] * 4
+    assert all(r.json()["score"] == 70 for r in responses)
+    assert elapsed < PIPELINE_SECONDS * 2.5  # serialized on the loop: 4 x 0.3s
+    assert len(app.state.orchestrator.threads) > 1
+
+
+def test_excess_reviews_are_rejected_with_retry_after(app):
+    responses = asyncio.run(_post_reviews(app, 6))
+    codes = sorted(r.status_code for r in responses)
+    assert codes == [200] * 4 + [503] * 2
+    rejected = [r for r in responses if r.status_code == 503]
+    assert all(r.headers["Retry-After"] for r in rejected)
+    assert task_review.review_executor.stats()["rejected"] == 2
+
+
+def test_executor_releases_slot_after_completion():
+    executor = ReviewExecutor(workers=1, max_pending=1)
+
+    async def scenario():
+        assert await executor.run(lambda: 1) == 1
+        assert await executor.run(lambda x: x * 2, 2) == 4
+
+    asyncio.run(scenario())
+    assert executor.stats()["pending"] == 0 and executor.stats()["completed"] == 2
+
+
+def test_executor_rejects_over_capacity():
+    executor = ReviewExecutor(workers=1, max_pending=1)
+
+    async def scenario():
+        slow = asyncio.ensure_future(executor.run(time.sleep, 0.2))
+        await asyncio.sleep(0)
+        with pytest.raises(ReviewCapacityExceeded):
+            await executor.run(lambda: None)
+        await slow
+
+    asyncio.run(scenario())
@@ -0,0 +1,125 @@
+"""
+Review Context Tests
+
+The orchestrator hands the engine a typed ReviewContext; legacy tasks with
+metrics/PDF embedded in the description unpack to the same context.
+"""
+import sys
+import os
+import json
+import subprocess
+from datetime import datetime
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from app.models.schemas import Task
+from app.services.review_context import ReviewContext, METRICS_MARKER, PDF_MARKER
+from app.services.repository_analyzer import RepositorySnapshot
+from app.services.review_engine import ReviewEngine
+from app.services.review_orchestrator import ReviewOrchestrator
+from app.services.sequential_task_generator import SequentialTaskGenerator
+
+METRICS = {"repo_name": "octo/widgets", "commit_count": 42, "has_tests": True}
+DESCRIPTION = "Build a REST API service with authentication and a database layer."
+PDF_TEXT = "Section 1. Requirements: the api must expose endpoints."
+
+
+def _legacy_task(link=None):
+    return Task(
+        task_id="t-1",
+        task_title="Widget API review",
+        task_description=(
+            f"{DESCRIPTION}\n\n{METRICS_MARKER}\n{json.dumps(METRICS, indent=2)}"
+            f"\n\n{PDF_MARKER}\n\n{PDF_TEXT}"
+        ),
+        submitted_by="tester",
+        timestamp=datetime.now(),
+        github_repo_link=link,
+    )
+
+
+def test_from_task_unpacks_legacy_markers():
+    context = ReviewContext.from_task(_legacy_task())
+    assert context.description == DESCRIPTION
+    assert context.repo_metrics == METRICS
+    assert context.pdf_text == PDF_TEXT
+    # The URL is recovered from the metrics instead of being lost
+    assert context.github_url == "https://github.com/octo/widgets"
+
+
+def test_explicit_repo_link_wins():
+    context = ReviewContext.from_task(_legacy_task("https://github.com/octo/other"))
+    assert context.github_url == "https://github.com/octo/other"
+
+
+def test_to_task_round_trips():
+    context = ReviewContext.from_task(_legacy_task())
+    again = ReviewContext.from_task(context.to_task())
+    assert again.model_dump() == context.model_dump()
+
+
+def test_features_are_built_once_from_context_text():
+    context = ReviewContext(title="Widget API review", description=DESCRIPTION, pdf_text=PDF_TEXT)
+    assert context.features is context.features
+    assert "authentication" in context.features.combined_tokens
+    assert "endpoints" in context.features.combined_tokens
+
+
+EVAL_RESULT = {
+    "score": 72, "architecture_score": 10, "completeness_score": 30, "documentation_score": 5,
+    "code_quality_score": 12, "missing_features": [], "summary": "ok", "documentation_alignment": "MEDIUM",
+}
+
+
+class RecordingEngine(ReviewEngine):
+    def __init__(self):
+        super().__init__()
+        self.contexts = []
+        self.evaluate_calls = 0
+
+    def review(self, context):
+        self.contexts.append(context)
+        return super().review(context)
+
+    def evaluate(self, task):
+        self.evaluate_calls += 1
+        return super().evaluate(task)
+
+
+def test_orchestrator_passes_context_without_string_round_trip(monkeypatch):
+    engine = RecordingEngine()
+    seen = {}
+
+    def evaluate(**kwargs):
+        seen.update(kwargs)
+        return dict(EVAL_RESULT)
+
+    monkeypatch.setattr(engine.evaluation_engine, "evaluate", evaluate)
+    orchestrator = ReviewOrchestrator(engine, SequentialTaskGenerator())
+    snapshot = RepositorySnapshot(
+        url="https://github.com/octo/widgets", mode="tree", repo_info={"full_name": "octo/widgets"},
+        head_sha=None, derived={"signals": {}, "summary": {"has_readme": True, "has_tests": True, "file_count": 3}},
+    )
+    orchestrator._repo_analyzer = type("StubRepoAnalyzer", (), {"snapshot": staticmethod(lambda url: snapshot)})
+
+    result = orchestrator.orchestrate_review(DESCRIPTION, github_url="https://github.com/octo/widgets")
+
+    context = engine.contexts[0]
+    assert engine.evaluate_calls == 0
+    assert context.description == DESCRIPTION
+    assert context.repo_metrics == snapshot.metrics
+    assert seen["task_description"] == DESCRIPTION
+    assert seen["repository_url"] == "https://github.com/octo/widgets"
+    assert seen["features"] is context.features
+    assert seen["repository"] is snapshot
+    assert result.review.score == 72
+
+
+def test_engine_interface_does_not_load_services():
+    probe = (
+        "import sys, app.core.interfaces.review_engine_interface; "
+        "print(sorted(m for m in sys.modules if m.startswith('app.services') or m == 'dotenv'))"
+    )
+    loaded = subprocess.run([sys.executable, "-c", probe], cwd=BASE_DIR, capture_output=True, text=True, check=True)
+    assert loaded.stdout.strip() == "[]"
@@ -0,0 +1,61 @@
+"""
+Sarathi Batch Validation Tests
+
+validate_tokens must give the same verdicts as validate_token, in input
+order, and write the replay store once per batch.
+"""
+import sys
+import os
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from app.sarathi.authority import sarathi_authority
+from app.sarathi.replay_detector import replay_detector
+
+
+def test_batch_mixed_results_in_order():
+    replay_detector.clear()
+    good = [sarathi_authority.issue_token(ttl_seconds=300) for _ in range(5)]
+    expired = sarathi_authority.issue_token(ttl_seconds=-600)
+    tampered = good[0][:-5] + "XXXXX"
+
+    batch = [good[0], "", tampered, good[1], good[1], expired] + good[2:]
+    results = sarathi_authority.validate_tokens(batch)
+
+    assert len(results) == len(batch)
+    codes = [r["payload"]["iss"] if r["valid"] else r["code"] for r in results]
+    assert codes[0] == "tantra-sarathi"
+    assert codes[1] == "MISSING_TOKEN"
+    assert codes[2] in ("INVALID_SIGNATURE", "INVALID_TOKEN")
+    assert codes[3] == "tantra-sarathi"
+    assert codes[4] == "REPLAY_ATTACK"
+    assert codes[5] == "EXPIRED_TOKEN"
+    assert all(r["valid"] for r in results[6:])
+    assert replay_detector.count == 5
+
+
+def test_batch_rejects_previously_used_tokens():
+    replay_detector.clear()
+    token = sarathi_authority.issue_token(ttl_seconds=300)
+    sarathi_authority.validate_token(token)
+
+    results = sarathi_authority.validate_tokens([token])
+    assert results == [{"valid": False, "code": "REPLAY_ATTACK", "reason": "Token replay detected"}]
+
+
+def test_batch_single_store_write(monkeypatch):
+    replay_detector.clear()
+    tokens = [sarathi_authority.issue_token(ttl_seconds=300) for _ in range(10)]
+
+    writes = []
+    original_save = replay_detector._save_store
+    monkeypatch.setattr(replay_detector, "_save_store", lambda: (writes.append(1), original_save()))
+
+    results = sarathi_authority.validate_tokens(tokens)
+    assert all(r["valid"] for r in results)
+    assert len(writes) == 1
+
+
+def test_empty_batch():
+    assert sarathi_authority.validate_tokens([]) == []
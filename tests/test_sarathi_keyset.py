@@ -0,0 +1,123 @@
+"""
+Sarathi Keyset Tests
+
+Covers kid-based key selection and zero-downtime key rotation:
+tokens signed with a retired key stay valid after reload_keys().
+"""
+import sys
+import os
+import time
+import uuid
+
+import jwt
+import pytest
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from app.sarathi.authority import (
+    sarathi_authority, SarathiValidationError,
+    SARATHI_ISSUER, SARATHI_AUDIENCE, SARATHI_ALGORITHM,
+)
+from app.sarathi.key_manager import sarathi_keys, SarathiKeyManager
+from app.sarathi.replay_detector import replay_detector
+
+
+def _claims():
+    now = int(time.time())
+    return {
+        "iss": SARATHI_ISSUER,
+        "sub": "tantra-core",
+        "aud": SARATHI_AUDIENCE,
+        "iat": now,
+        "exp": now + 300,
+        "jti": str(uuid.uuid4()),
+    }
+
+
+def test_issued_token_carries_active_kid():
+    replay_detector.clear()
+    token = sarathi_authority.issue_token(ttl_seconds=300)
+    assert jwt.get_unverified_header(token)["kid"] == sarathi_keys.get_kid()
+    assert sarathi_authority.validate_token(token)["iss"] == SARATHI_ISSUER
+
+
+def test_keyset_holds_parsed_key_objects():
+    algorithm, key = sarathi_keys.get_verification_key()
+    assert algorithm == SARATHI_ALGORITHM
+    assert not isinstance(key, (bytes, str))
+
+
+def test_token_without_kid_uses_active_key():
+    replay_detector.clear()
+    token = jwt.encode(_claims(), sarathi_keys.get_private_key(), algorithm=SARATHI_ALGORITHM)
+    assert sarathi_authority.validate_token(token)["sub"] == "tantra-core"
+
+
+def test_unknown_kid_rejected():
+    replay_detector.clear()
+    token = jwt.encode(
+        _claims(), sarathi_keys.get_private_key(),
+        algorithm=SARATHI_ALGORITHM, headers={"kid": "not-a-known-key"},
+    )
+    with pytest.raises(SarathiValidationError) as exc:
+        sarathi_authority.validate_token(token)
+    assert exc.value.code == "UNKNOWN_KEY_ID"
+
+
+def test_retired_key_still_verifies_after_rotation(tmp_path, monkeypatch):
+    replay_detector.clear()
+    old_kid = sarathi_keys.get_kid()
+    old_token = sarathi_authority.issue_token(ttl_seconds=300)
+    retired_before = dict(sarathi_keys._retired_keys)
+
+    monkeypatch.setattr(SarathiKeyManager, "_key_dir", lambda self: str(tmp_path))
+    try:
+        sarathi_keys.reload_keys()
+        assert sarathi_keys.get_kid() != old_kid
+
+        new_token = sarathi_authority.issue_token(ttl_seconds=300)
+        assert jwt.get_unverified_header(new_token)["kid"] == sarathi_keys.get_kid()
+        assert sarathi_authority.validate_token(old_token)["jti"]
+        assert sarathi_authority.validate_token(new_token)["jti"]
+    finally:
+        monkeypatch.undo()
+        sarathi_keys.reload_keys()
+        sarathi_keys._retired_keys = retired_before
+        sarathi_keys._build_keyset(sarathi_keys._key_dir())
+
+    assert sarathi_keys.get_kid() == old_kid
+
+
+@pytest.mark.parametrize("algorithm", ["ES256", "EdDSA"])
+def test_alternative_algorithms_issue_and_verify(algorithm, tmp_path, monkeypatch):
+    replay_detector.clear()
+    retired_before = dict(sarathi_keys._retired_keys)
+
+    monkeypatch.setenv("SARATHI_ALGORITHM", algorithm)
+    monkeypatch.setattr(SarathiKeyManager, "_key_dir", lambda self: str(tmp_path))
+    try:
+        sarathi_keys.reload_keys()
+        assert sarathi_keys.get_algorithm() == algorithm
+
+        token = sarathi_authority.issue_token(ttl_seconds=300)
+        assert jwt.get_unverified_header(token)["alg"] == algorithm
+        assert sarathi_authority.validate_token(token)["iss"] == SARATHI_ISSUER
+
+        tampered = token[:-5] + ("AAAAA" if not token.endswith("AAAAA") else "BBBBB")
+        with pytest.raises(SarathiValidationError):
+            sarathi_authority.validate_token(tampered)
+    finally:
+        monkeypatch.undo()
+        sarathi_keys.reload_keys()
+        sarathi_keys._retired_keys = retired_before
+        sarathi_keys._build_keyset(sarathi_keys._key_dir())
+
+    assert sarathi_keys.get_algorithm() == SARATHI_ALGORITHM
+
+
+def test_unsupported_algorithm_rejected(monkeypatch):
+    from app.sarathi.key_manager import configured_algorithm
+    monkeypatch.setenv("SARATHI_ALGORITHM", "HS256")
+    with pytest.raises(ValueError):
+        configured_algorithm()
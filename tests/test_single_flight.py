@@ -0,0 +1,109 @@
+"""
+Single-Flight Coalescing Tests
+
+Concurrent analyses of the same repository must share one set of GitHub
+fetches and one result; different repositories must not be coalesced.
+"""
+import sys
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from app.services.github_client import github_client
+from app.services.repo_analyzer import RepoAnalyzer
+from app.services.single_flight import SingleFlight
+
+CALLERS = 8
+
+
+class MockResponse:
+    def __init__(self, json_data, status_code=200, headers=None):
+        self.json_data = json_data
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def json(self):
+        return self.json_data
+
+    def raise_for_status(self):
+        pass
+
+
+def test_concurrent_calls_share_one_execution():
+    flights = SingleFlight()
+    calls = []
+    gate = threading.Event()
+
+    def slow(value):
+        calls.append(value)
+        gate.wait(2)
+        return {"value": value}
+
+    with ThreadPoolExecutor(max_workers=CALLERS) as pool:
+        futures = [pool.submit(flights.do, "k", slow, 1) for _ in range(CALLERS)]
+        while flights.coalesced < CALLERS - 1:
+            time.sleep(0.01)
+        gate.set()
+        results = [f.result() for f in futures]
+
+    assert calls == [1]
+    assert all(r == {"value": 1} for r in results)
+    assert len({id(r) for r in results}) == CALLERS  # followers get copies
+    assert flights.in_flight == 0
+
+    # Completed calls are not cached
+    flights.do("k", slow, 2)
+    assert calls == [1, 2]
+
+
+def test_leader_exception_reaches_followers():
+    flights = SingleFlight()
+    gate = threading.Event()
+
+    def failing():
+        gate.wait(2)
+        raise RuntimeError("upstream down")
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        futures = [pool.submit(flights.do, "k", failing) for _ in range(3)]
+        while flights.coalesced < 2:
+            time.sleep(0.01)
+        gate.set()
+        for future in futures:
+            with pytest.raises(RuntimeError):
+                future.result()
+    assert flights.in_flight == 0
+
+
+def test_repo_analyzer_coalesces_same_repository(monkeypatch):
+    metadata_calls = {"octo/demo": 0, "octo/other": 0}
+    lock = threading.Lock()
+
+    def mock_get(url, *args, **kwargs):
+        time.sleep(0.1)
+        if "/languages" in url:
+            return MockResponse({"Python": 1})
+        if "/commits" in url:
+            return MockResponse([{}])
+        if "/git/trees/" in url:
+            return MockResponse({"tree": []})
+        name = url.split("/repos/")[1].lower()
+        with lock:
+            metadata_calls[name] += 1
+        return MockResponse({"full_name": name, "default_branch": "main"})
+
+    monkeypatch.setattr(github_client, "get", mock_get)
+
+    urls = ["https://github.com/octo/demo"] * CALLERS + ["https://github.com/Octo/Other.git"]
+    with ThreadPoolExecutor(max_workers=len(urls)) as pool:
+        results = list(pool.map(RepoAnalyzer.analyze_repo, urls))
+
+    assert metadata_calls == {"octo/demo": 1, "octo/other": 1}
+    assert all(r["repo_name"] == "octo/demo" for r in results[:CALLERS])
+    assert results[-1]["repo_name"] == "octo/other"
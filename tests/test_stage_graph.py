@@ -0,0 +1,112 @@
+"""
+Stage Graph Tests
+
+Dependency ordering, overlap of network stages with inline CPU stages,
+error propagation, context propagation and per-stage timings.
+"""
+import sys
+import os
+import threading
+import time
+
+import pytest
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from app.services.github_scheduler import PRIORITY_BACKGROUND, current_priority, github_priority
+from app.services.stage_graph import StageGraph, StageMetrics
+from app.services.evaluation_cache import EvaluationCache
+from app.services.evaluation_engine import EvaluationEngine
+from app.services.repository_analyzer import RepositorySnapshot
+
+
+def _sleep_then(value, seconds=0.2):
+    def stage(*deps):
+        time.sleep(seconds)
+        return value
+    return stage
+
+
+def test_dependencies_receive_results_in_order():
+    graph = StageGraph("t")
+    graph.add("a", lambda: 2)
+    graph.add("b", lambda: 3, io=True)
+    graph.add("c", lambda a, b: a * b, deps=("a", "b"))
+    results, timings = graph.run()
+    assert results == {"a": 2, "b": 3, "c": 6}
+    assert set(timings) == {"a", "b", "c"}
+
+
+def test_network_stages_overlap_with_inline_stages():
+    caller = threading.get_ident()
+    threads = {}
+
+    def parse():
+        threads["parse"] = threading.get_ident()
+        return _sleep_then("z")()
+
+    graph = StageGraph("t")
+    graph.add("fetch1", _sleep_then("x"), io=True)
+    graph.add("fetch2", _sleep_then("y"), io=True)
+    graph.add("parse", parse)
+    graph.add("join", lambda a, b, c: a + b + c, deps=("fetch1", "fetch2", "parse"))
+
+    start = time.perf_counter()
+    results, timings = graph.run()
+    elapsed = time.perf_counter() - start
+
+    assert results["join"] == "xyz"
+    assert threads["parse"] == caller
+    assert elapsed < 0.45  # sequential would be 0.6s
+    assert timings["fetch1"] >= 190
+
+
+def test_stage_error_is_raised_after_in_flight_stages():
+    finished = []
+    graph = StageGraph("t")
+    graph.add("slow", lambda: time.sleep(0.1) or finished.append("slow"), io=True)
+    graph.add("bad", lambda: 1 / 0)
+    with pytest.raises(ZeroDivisionError):
+        graph.run()
+    assert finished == ["slow"]
+
+
+def test_undeclared_dependency_rejected():
+    graph = StageGraph("t")
+    with pytest.raises(ValueError):
+        graph.add("b", lambda a: a, deps=("a",))
+
+
+def test_network_stage_inherits_request_priority():
+    graph = StageGraph("t")
+    graph.add("fetch", current_priority, io=True)
+    with github_priority(PRIORITY_BACKGROUND):
+        results, _ = graph.run()
+    assert results["fetch"] == PRIORITY_BACKGROUND
+
+
+def test_metrics_aggregate_runs():
+    metrics = StageMetrics()
+    metrics.record("g", {"a": 10.0})
+    metrics.record("g", {"a": 30.0})
+    assert metrics.stats() == {"g.a": {"runs": 2, "avg_ms": 20.0, "max_ms": 30.0}}
+
+
+def test_evaluation_latency_tracks_repository_fetch(tmp_path, monkeypatch):
+    engine = EvaluationEngine()
+    engine.cache = EvaluationCache(path=str(tmp_path / "e.db"))
+    engine.stage_cache = EvaluationCache(path=str(tmp_path / "e.db"), table="stages")
+    # The file listing is fetched lazily, inside the repository stage, after the repository is pinned
+    listing = _sleep_then({"signals": {"error": "offline"}, "summary": {}}, 0.3)
+    snapshot = RepositorySnapshot("https://github.com/octo/demo", "tree", {}, "c" * 40, listing)
+    monkeypatch.setattr(engine.repository_analyzer, "pin", lambda url, repository=None: ("c" * 40, snapshot))
+    title = engine.title_analyzer.analyze
+    monkeypatch.setattr(engine.title_analyzer, "analyze", lambda *a: time.sleep(0.3) or title(*a))
+
+    start = time.perf_counter()
+    result = engine.evaluate("Build an API", "Implement an API service.", "https://github.com/octo/demo")
+    elapsed = time.perf_counter() - start
+
+    assert result["score_breakdown"]["repository"] == 0.0
+    assert elapsed < 0.5  # sequential would be 0.6s
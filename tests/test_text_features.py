@@ -0,0 +1,82 @@
+"""
+Text Features Tests
+
+The shared per-submission tokenization must give the analyzers exactly the
+values their own per-call regex passes produced.
+"""
+import sys
+import os
+import re
+
+import pytest
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+sys.path.insert(0, os.path.join(BASE_DIR, "tests"))
+
+from app.services.text_features import TextBlock, TextFeatures
+from app.services.title_analyzer import TitleAnalyzer
+from app.services.description_analyzer import DescriptionAnalyzer
+from app.services.intent_extractor import IntentExtractor
+from app.services.pdf_analyzer import PDFAnalyzer
+from benchmark_intent_extractor import legacy_extract, synthetic_text
+
+DESCRIPTION = """# Overview
+Build a REST API service with FastAPI. First, design the schema!
+1. Auth module with JWT
+2. Review engine; then `pytest` tests.
+
+```python
+def run(): pass
+```
+ARCHITECTURE NOTES
+Use a layered system. Finally deploy with Docker?
+"""
+TITLE = "Review API Service with FastAPI and JWT auth auth"
+PDF = "Features\n- dashboard\n- scoring\n\nArchitecture\nclean architecture with React"
+
+
+def test_text_block_matches_per_call_regexes():
+    block = TextBlock(DESCRIPTION)
+    assert block.words == re.findall(r'\b\w+\b', DESCRIPTION.lower())
+    assert block.split_words == DESCRIPTION.lower().split()
+    assert block.sentences == re.split(r'[.!?]+', DESCRIPTION)
+    assert block.numbered_items == 2
+    assert block.section_headers == 2
+    assert [DESCRIPTION[a:b] for a, b in block.code_block_spans] == \
+        re.findall(r'```[\s\S]*?```|`[^`]+`', DESCRIPTION)
+
+
+def test_combined_views_match_concatenated_text():
+    features = TextFeatures(TITLE, DESCRIPTION, PDF)
+    combined = (TITLE + " " + DESCRIPTION + " " + PDF).lower()
+    assert features.combined_lower == combined
+    assert features.combined_tokens == set(re.findall(r'\w+', combined))
+    assert features.combined_words == combined.split()
+
+
+def test_analyzers_agree_with_and_without_shared_features(tmp_path):
+    features = TextFeatures(TITLE, DESCRIPTION, PDF)
+    assert TitleAnalyzer().analyze(TITLE, DESCRIPTION, features) == TitleAnalyzer().analyze(TITLE, DESCRIPTION)
+    assert DescriptionAnalyzer().analyze(DESCRIPTION, features) == DescriptionAnalyzer().analyze(DESCRIPTION)
+    assert IntentExtractor().extract(TITLE, DESCRIPTION, PDF, features) == legacy_extract(TITLE, DESCRIPTION, PDF)
+    pdf_analyzer = PDFAnalyzer(upload_dir=str(tmp_path))
+    assert pdf_analyzer.analyze_content(PDF, features) == pdf_analyzer.analyze_content(PDF)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_intent_from_shared_features_matches_legacy(seed):
+    title = synthetic_text(60, seed=seed)
+    description = synthetic_text(3000, seed=seed + 10)
+    pdf = synthetic_text(8000, seed=seed + 20)
+    features = TextFeatures(title, description, pdf)
+    assert IntentExtractor().extract(title, description, pdf, features) == legacy_extract(title, description, pdf)
+
+
+def test_description_tokenized_once_across_analyzers():
+    features = TextFeatures(TITLE, DESCRIPTION, PDF)
+    TitleAnalyzer().analyze(TITLE, DESCRIPTION, features)
+    words = features.description.words
+    DescriptionAnalyzer().analyze(DESCRIPTION, features)
+    IntentExtractor().extract(TITLE, DESCRIPTION, PDF, features)
+    assert features.description.words is words
@@ -0,0 +1,82 @@
+"""
+Access Token Cache Tests
+verify_token decodes each token once, honours exp, and forgets everything
+on secret rotation.
+"""
+from datetime import timedelta
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.security import middleware
+from app.security.middleware import SecurityConfig, TokenCache, token_cache
+
+
+def _credentials(token):
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    token_cache.clear()
+    original_secret = middleware.SECRET_KEY
+    yield
+    SecurityConfig.rotate_secret(original_secret)
+
+
+def test_second_verification_skips_decode(monkeypatch):
+    token = SecurityConfig.create_access_token({"sub": "alice", "role": "admin"})
+    decode_calls = []
+    original_decode = middleware.jwt.decode
+    monkeypatch.setattr(
+        middleware.jwt, "decode",
+        lambda *a, **kw: (decode_calls.append(1), original_decode(*a, **kw))[1],
+    )
+
+    first = SecurityConfig.verify_token(_credentials(token))
+    second = SecurityConfig.verify_token(_credentials(token))
+
+    assert first == second == {"username": "alice", "role": "admin"}
+    assert len(decode_calls) == 1
+
+
+def test_cached_claims_not_mutable_by_caller():
+    token = SecurityConfig.create_access_token({"sub": "alice", "role": "user"})
+    SecurityConfig.verify_token(_credentials(token))["role"] = "admin"
+    assert SecurityConfig.verify_token(_credentials(token))["role"] == "user"
+
+
+def test_expired_entry_is_not_served():
+    cache = TokenCache()
+    cache.put("token-a", {"username": "bob", "role": "user"}, expires_at=0)
+    assert cache.get("token-a") is None
+    assert len(cache) == 0
+
+
+def test_expired_token_rejected():
+    token = SecurityConfig.create_access_token({"sub": "carol"}, expires_delta=timedelta(seconds=-5))
+    with pytest.raises(HTTPException) as exc:
+        SecurityConfig.verify_token(_credentials(token))
+    assert exc.value.status_code == 401
+    assert len(token_cache) == 0
+
+
+def test_secret_rotation_invalidates_cache():
+    token = SecurityConfig.create_access_token({"sub": "dave", "role": "user"})
+    SecurityConfig.verify_token(_credentials(token))
+    assert len(token_cache) == 1
+
+    SecurityConfig.rotate_secret("a-brand-new-secret-for-tests")
+    assert len(token_cache) == 0
+    with pytest.raises(HTTPException):
+        SecurityConfig.verify_token(_credentials(token))
+
+
+def test_cache_is_bounded():
+    cache = TokenCache(max_size=3)
+    for i in range(10):
+        cache.put(f"token-{i}", {"username": str(i)}, expires_at=4102444800)
+    assert len(cache) == 3
+    assert cache.get("token-9") == {"username": "9"}
+    assert cache.get("token-0") is None